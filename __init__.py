@@ -50,16 +50,35 @@ from HumGen3D.backend.content.content_packs import cpacks_refresh as _cpacks_ref
 from HumGen3D.backend.preferences.preference_func import get_prefs
 from HumGen3D.backend.preview_collections import PREVIEW_COLLECTION_DATA, PreviewCollection
 from HumGen3D.backend.preview_collections import preview_collections as _preview_collections
+from HumGen3D.backend.preview_collections import thumbnail_loader as _thumbnail_loader
 from HumGen3D.backend.properties.object_props import HG_OBJECT_PROPS
 from HumGen3D.backend.updates import addon_updater_ops
 from HumGen3D.backend.updates.update import check_update as _check_update
 from HumGen3D.backend.vscode_reload import _post_vscode_reload  # noqa
 from HumGen3D.batch_generator.generator import BatchHumanGenerator
 from HumGen3D.common.exceptions import HumGenException
+from HumGen3D.human.content_changes import (
+    clear_checked_hashes_on_load as _clear_checked_hashes,
+)
+from HumGen3D.human.content_changes import (
+    invalidate_edited_content as _invalidate_edited_content,
+)
+from HumGen3D.human.hair.import_cache import (
+    clear_hair_cache_on_save as _clear_hair_cache,
+)
+from HumGen3D.human.hair.import_cache import hair_import_cache as _hair_import_cache
 from HumGen3D.human.human import Human
+from HumGen3D.human.keys.keys import (
+    invalidate_coords_on_edit as _invalidate_coords_on_edit,
+)
+from HumGen3D.human.keys.keys import (
+    invalidate_coords_on_undo as _invalidate_coords_on_undo,
+)
 from HumGen3D.human.keys.bpy_livekey import BpyLiveKey
 from HumGen3D.human.keys.keys import KeyItem, LiveKeyItem, ShapeKeyItem
 from HumGen3D.human.process.process import SCRIPT_ITEM
+from HumGen3D.human.template_cache import clear_templates_on_save as _clear_templates
+from HumGen3D.human.template_cache import template_cache as _template_cache
 from HumGen3D.user_interface.batch_panel import batch_ui_lists
 from HumGen3D.user_interface.content_panel import utility_ui_lists
 from HumGen3D.user_interface.icons.icons import hg_icons
@@ -178,6 +197,23 @@ def register() -> None:
     # load handler
     if HG_start not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(HG_start)
+    if _clear_templates not in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.append(_clear_templates)
+    if _clear_hair_cache not in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.append(_clear_hair_cache)
+    if _clear_checked_hashes not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_clear_checked_hashes)
+    if _invalidate_edited_content not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_invalidate_edited_content)
+    for handlers in (
+        bpy.app.handlers.undo_post,
+        bpy.app.handlers.redo_post,
+        bpy.app.handlers.load_post,
+    ):
+        if _invalidate_coords_on_undo not in handlers:
+            handlers.append(_invalidate_coords_on_undo)
+    if _invalidate_coords_on_edit not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_invalidate_coords_on_edit)
 
 
 def unregister() -> None:
@@ -190,12 +226,32 @@ def unregister() -> None:
     # remove handler
     if HG_start in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(HG_start)
+    if _clear_templates in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.remove(_clear_templates)
+    _template_cache.clear()
+    if _clear_hair_cache in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.remove(_clear_hair_cache)
+    _hair_import_cache.clear()
+    if _clear_checked_hashes in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_clear_checked_hashes)
+    if _invalidate_edited_content in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_invalidate_edited_content)
+    for handlers in (
+        bpy.app.handlers.undo_post,
+        bpy.app.handlers.redo_post,
+        bpy.app.handlers.load_post,
+    ):
+        if _invalidate_coords_on_undo in handlers:
+            handlers.remove(_invalidate_coords_on_undo)
+    if _invalidate_coords_on_edit in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_invalidate_coords_on_edit)
 
     from .user_interface.batch_panel.primitive_menu import add_hg_primitive_menu
 
     bpy.types.VIEW3D_MT_add.remove(add_hg_primitive_menu)
 
     # remove pcolls
+    _thumbnail_loader.clear()
     for pcoll_item in _preview_collections.values():
         bpy.utils.previews.remove(pcoll_item.pcoll)
     bpy.utils.previews.remove(hg_icons.pop())
@@ -9,10 +9,14 @@ This callback has the following usages:
 -Update the subsurface scattering toggle in the UI
 -Makes sure the hg_rig.HG.body_object is updated to the correct body object when
     a human is duplicated by the user
+
+The work is debounced with bpy.app.timers, so clicking through many humans only
+updates for the human that ends up active. Preview collections are not refreshed
+again if the gender and UI phase are the same as for the last refresh.
 """
 
 import contextlib
-from typing import no_type_check
+from typing import Any, Callable, Optional, no_type_check
 
 import bpy
 from bpy.types import Context  # type:ignore[import]
@@ -77,8 +81,29 @@ def msgbus(self: bpy.types.Operator, context: Context) -> None:
     sett.subscribed = True
 
 
+CALLBACK_DELAY = 0.1  # Seconds without new calls before hg_callback does its work
+
+# (gender, ui phase, populate counts of all pcolls) after the last pcoll refresh
+_last_refresh: Optional[tuple[Any, ...]] = None
+
+# (material pointer, material name, lookup name) -> (node count, name of found node)
+_node_name_cache: dict[tuple[int, str, str], tuple[int, Optional[str]]] = {}
+
+
 def hg_callback(self) -> None:
-    """Runs every time the active object changes."""
+    """Runs every time the active object changes, the update itself is debounced."""
+    if bpy.app.background:
+        _update_for_active_object()
+        return
+
+    if bpy.app.timers.is_registered(_update_for_active_object):
+        bpy.app.timers.unregister(_update_for_active_object)
+    bpy.app.timers.register(_update_for_active_object, first_interval=CALLBACK_DELAY)
+
+
+def _update_for_active_object() -> None:
+    global _last_refresh
+
     human = Human.from_existing(bpy.context.object, strict_check=False)
     if not human:
         return  # return immediately when the active object is not part of a human
@@ -88,9 +113,21 @@ def hg_callback(self) -> None:
     sett = bpy.context.scene.HG3D  # type: ignore[attr-defined]
     ui_phase = sett.ui.phase
 
-    _set_shader_switches(human, sett)
-    update_tips_from_context(bpy.context, sett, human)
-    _context_specific_updates(sett, human, ui_phase)
+    try:
+        _set_shader_switches(human, sett)
+        update_tips_from_context(bpy.context, sett, human)
+
+        refresh_key = (human.gender, ui_phase, _pcoll_populate_counts())
+        if ui_phase == "apply" or refresh_key != _last_refresh:
+            _context_specific_updates(sett, human, ui_phase)
+            _last_refresh = (human.gender, ui_phase, _pcoll_populate_counts())
+    finally:
+        # Also when the refresh is skipped, otherwise all setters keep returning early
+        sett.update_exception = False
+
+
+def _pcoll_populate_counts() -> tuple[int, ...]:
+    return tuple(pcoll.populate_count for pcoll in preview_collections.values())
 
 
 @no_type_check
@@ -98,24 +135,31 @@ def _set_shader_switches(human, sett):
     """Sets the subsurface toggle to the correct position. Update_exception is
     used to prevent an endless loop of setting the toggle
     """  # noqa
-    sett.update_exception = True
     body_obj = human.objects.body
-    nodes = body_obj.data.materials[0].node_tree.nodes
     if not body_obj:
         return
+    sett.update_exception = True
+    try:
+        skin_mat = body_obj.data.materials[0]
 
-    principled_bsdf = next(node for node in nodes if node.type == "BSDF_PRINCIPLED")
-    sett.skin_sss = (
-        "off" if principled_bsdf.inputs[SUBSURFACE_INPUT_NAME].default_value == 0 else "on"
-    )
-
-    uw_node = nodes.get("Underwear_Opacity")
-    if uw_node:
-        sett.underwear_toggle = "on" if uw_node.inputs[1].default_value == 1 else "off"
+        principled_bsdf = _find_node(
+            skin_mat,
+            "BSDF_PRINCIPLED",
+            lambda nodes: next(n for n in nodes if n.type == "BSDF_PRINCIPLED"),
+        )
+        sss_value = principled_bsdf.inputs[SUBSURFACE_INPUT_NAME].default_value
+        _set_if_changed(sett, "skin_sss", "off" if sss_value == 0 else "on")
 
-    _hair_shader_type_update(sett, body_obj)
+        uw_node = _find_node(
+            skin_mat, "Underwear_Opacity", lambda nodes: nodes.get("Underwear_Opacity")
+        )
+        if uw_node:
+            uw_value = uw_node.inputs[1].default_value
+            _set_if_changed(sett, "underwear_toggle", "on" if uw_value == 1 else "off")
 
-    sett.update_exception = False
+        _hair_shader_type_update(sett, body_obj)
+    finally:
+        sett.update_exception = False
 
 
 @no_type_check
@@ -181,11 +225,52 @@ def set_human_categ_props() -> None:
 @no_type_check
 def _hair_shader_type_update(sett, hg_body):
     mat = hg_body.data.materials[1]
-    hair_node = mat.node_tree.nodes.get("HG_Hair_V3")
+    hair_node = _find_node(mat, "HG_Hair_V3", lambda nodes: nodes.get("HG_Hair_V3"))
 
     if not hair_node:
         return
 
     switch_value = hair_node.inputs["Fast/Accurate"].default_value
 
-    sett.hair_shader_type = "fast" if switch_value == 0.0 else "accurate"
+    _set_if_changed(
+        sett, "hair_shader_type", "fast" if switch_value == 0.0 else "accurate"
+    )
+
+
+def _find_node(
+    mat: bpy.types.Material,
+    lookup_name: str,
+    find: Callable[[bpy.types.Nodes], Optional[bpy.types.Node]],
+) -> Optional[bpy.types.Node]:
+    """Find a node in the material, remembering its name for the next call.
+
+    The cached name is used as long as the node count of the material is the same
+    and a node with that name still exists.
+
+    Args:
+        mat (bpy.types.Material): Material to search in
+        lookup_name (str): Unique name of this lookup, used as cache key
+        find (Callable[[Nodes], Optional[Node]]): Finds the node in the node tree
+
+    Returns:
+        Optional[bpy.types.Node]: The node, None if find() didn't find it
+    """
+    nodes = mat.node_tree.nodes
+    cache_key = (mat.as_pointer(), mat.name, lookup_name)
+    cached = _node_name_cache.get(cache_key)
+    if cached and cached[0] == len(nodes):
+        if cached[1] is None:
+            return None
+        node = nodes.get(cached[1])
+        if node is not None:
+            return node
+
+    node = find(nodes)
+    _node_name_cache[cache_key] = (len(nodes), node.name if node else None)
+    return node
+
+
+def _set_if_changed(sett: Any, propname: str, value: str) -> None:
+    # Setting a property runs its update function and redraws the UI
+    if getattr(sett, propname) != value:
+        setattr(sett, propname, value)
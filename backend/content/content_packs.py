@@ -548,6 +548,11 @@ class HG_DELETE_CPACK(bpy.types.Operator):
         index = context.scene.contentpacks_col_index
         item = col[self.item_name]
 
+        # Close memory-mapped livekey packs, so they can be deleted
+        from HumGen3D.human.keys.livekey_pack import livekey_packs
+
+        livekey_packs.clear()
+
         # delete files from dict in json
         with open(item.json_path) as f:
             data = json.load(f)
@@ -574,6 +579,10 @@ class HG_DELETE_CPACK(bpy.types.Operator):
 
         cpacks_refresh(self, context)
 
+        from HumGen3D.human.keys.keys import update_livekey_collection
+
+        update_livekey_collection()
+
         return {"FINISHED"}
 
     @no_type_check
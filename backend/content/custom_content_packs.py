@@ -414,7 +414,10 @@ def build_content_collection(self, context):
     other_cpacks_content_set = _get_other_content_set(context, pref)
 
     for categ in PREVIEW_COLLECTION_DATA:
-        preview_collections[categ].populate(context, None, use_search_term=False)
+        # The icons are copied to the collection items, so they can't be placeholders
+        preview_collections[categ].populate(
+            context, None, use_search_term=False, lazy_thumbnails=False
+        )
 
         for content_item_enum in preview_collections[categ].pcoll[categ]:
             _add_to_collection(
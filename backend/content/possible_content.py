@@ -9,6 +9,7 @@ from bpy.props import (  # type:ignore
     StringProperty,
 )
 from bpy.types import Object  # type:ignore
+from HumGen3D.human.content_changes import content_hash
 from HumGen3D.human.human import Human
 from HumGen3D.user_interface.icons.icons import get_hg_icon
 
@@ -100,25 +101,20 @@ def find_possible_content(context: bpy.types.Context) -> None:
     item.category = "texture"
 
     hashes = human.props.hashes
-    if str(hash(human.hair.regular_hair)) != hashes.get("$hair") or show_unchanged:
-        item = coll.add()
-        item.name = "Hairstyle"
-        item.category = "hair"
-
-    if str(hash(human.clothing.outfit)) != hashes.get("$outfit") or show_unchanged:
-        item = coll.add()
-        item.name = "Outfit"
-        item.category = "outfit"
-
-    if str(hash(human.clothing.footwear)) != hashes.get("$footwear") or show_unchanged:
-        item = coll.add()
-        item.name = "Footwear"
-        item.category = "footwear"
-
-    if str(hash(human.pose)) != hashes.get("$pose") or show_unchanged:
-        item = coll.add()
-        item.name = "Pose"
-        item.category = "pose"
+    rig = human.objects.rig
+    changed_content = (
+        ("hair", "Hairstyle", human.hair.regular_hair),
+        ("outfit", "Outfit", human.clothing.outfit),
+        ("footwear", "Footwear", human.clothing.footwear),
+        ("pose", "Pose", human.pose),
+    )
+    for category, name, content in changed_content:
+        # Only hashes the content again if it changed since the last check
+        stored_hash = hashes.get(f"${category}")
+        if show_unchanged or content_hash(rig, category, content) != stored_hash:
+            item = coll.add()
+            item.name = name
+            item.category = category
 
     if len(coll) == 1:
         header = coll.add()
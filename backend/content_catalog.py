@@ -0,0 +1,204 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+"""Persistent index of the folders in the Human Generator content folder.
+
+Preview collections are refreshed on every active object change, which used to walk
+the category folder with os.walk each time. That is slow when the content folder is
+on network storage. The catalog stores the file and folder names of each visited
+folder together with its modification time in a JSON file in the content folder.
+Adding, removing or renaming an entry changes the modification time of the folder
+containing it, so a folder only has to be listed again when its own modification time
+changed. Walking a category then costs one stat per folder instead of a listing.
+
+If the catalog file can't be written (for example on read-only storage), the index is
+kept in memory for the rest of the session.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+from typing import Iterator, Optional, TypedDict
+
+from .logging import hg_log
+
+CATALOG_NAME = ".hg_content_catalog.json"
+CATALOG_VERSION = 1
+
+
+class FolderEntry(TypedDict):
+    """Index entry of a single folder."""
+
+    mtime: int
+    folders: list[str]
+    files: list[str]
+
+
+class ContentCatalog:
+    """Index of folder contents under a root folder, validated by folder mtime."""
+
+    def __init__(self, root: str) -> None:
+        self.root = os.path.normpath(root)
+        self.filepath = os.path.join(self.root, CATALOG_NAME)
+        self._folders: dict[str, FolderEntry] = self._read()
+        self._changed = False
+        self._writable = True
+
+    def walk(self, folder: str) -> Iterator[tuple[str, list[str], list[str]]]:
+        """Top-down walk of a folder, like os.walk but read from the index.
+
+        Args:
+            folder (str): Absolute path of a folder inside the root folder
+
+        Yields:
+            tuple[str, list[str], list[str]]: Path of the folder, names of its
+                subfolders and names of its files, both sorted.
+        """
+        try:
+            yield from self._walk(folder)
+        finally:
+            self.save()
+
+    def listdir(self, folder: str) -> Optional[list[str]]:
+        """Names of the subfolders and files in a folder, read from the index.
+
+        Args:
+            folder (str): Absolute path of a folder inside the root folder
+
+        Returns:
+            Optional[list[str]]: Sorted names, None if the folder doesn't exist
+        """
+        entry = self._get_entry(self._key(folder))
+        self.save()
+        if entry is None:
+            return None
+        return sorted(entry["folders"] + entry["files"])
+
+    def save(self) -> None:
+        """Write the index to the catalog file if it changed since the last save."""
+        if not self._changed or not self._writable:
+            return
+
+        data = {"version": CATALOG_VERSION, "folders": self._folders}
+        # Batch workers share the content folder, so each write gets its own temp
+        # file. The last os.replace wins, every version written is complete.
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=CATALOG_NAME, suffix=".tmp", dir=self.root
+            )
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.filepath)
+        except OSError as e:
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+            hg_log(f"Keeping content catalog in memory, can't write it: {e}")
+            self._writable = False
+            return
+
+        self._changed = False
+        # Writing the catalog changed the root folder, but not in a way that matters
+        root_entry = self._folders.get("")
+        if root_entry is not None:
+            root_entry["mtime"] = os.stat(self.root).st_mtime_ns
+
+    def _walk(self, folder: str) -> Iterator[tuple[str, list[str], list[str]]]:
+        entry = self._get_entry(self._key(folder))
+        if entry is None:
+            return
+
+        yield folder, entry["folders"], entry["files"]
+        for name in entry["folders"]:
+            yield from self._walk(os.path.join(folder, name))
+
+    def _get_entry(self, key: str) -> Optional[FolderEntry]:
+        folder = os.path.join(self.root, *key.split("/")) if key else self.root
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except OSError:
+            self._forget(key)
+            return None
+
+        entry = self._folders.get(key)
+        if entry is not None and entry["mtime"] == mtime:
+            return entry
+
+        folders, files = [], []
+        try:
+            with os.scandir(folder) as it:
+                for dir_entry in it:
+                    is_dir = dir_entry.is_dir()
+                    (folders if is_dir else files).append(dir_entry.name)
+        except OSError:
+            self._forget(key)
+            return None
+
+        entry = {"mtime": mtime, "folders": sorted(folders), "files": sorted(files)}
+        self._folders[key] = entry  # type:ignore[assignment]
+        self._changed = True
+        return entry  # type:ignore[return-value]
+
+    def _forget(self, key: str) -> None:
+        prefix = key + "/"
+        removed = [k for k in self._folders if k == key or k.startswith(prefix)]
+        for k in removed:
+            del self._folders[k]
+        self._changed = self._changed or bool(removed)
+
+    def _key(self, folder: str) -> str:
+        relpath = os.path.relpath(os.path.normpath(folder), self.root)
+        if relpath == os.curdir:
+            return ""
+        if relpath.startswith(os.pardir):
+            raise ValueError(f"{folder} is not inside the content folder {self.root}")
+        return relpath.replace(os.sep, "/")
+
+    def _read(self) -> dict[str, FolderEntry]:
+        try:
+            with open(self.filepath) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != CATALOG_VERSION:
+            return {}
+        return data.get("folders", {})
+
+
+_catalogs: dict[str, ContentCatalog] = {}  # global dict of catalogs per content root
+
+
+def get_catalog(root: str) -> ContentCatalog:
+    """Get the catalog of this content folder, reading its catalog file once.
+
+    Args:
+        root (str): Absolute path of the content folder
+
+    Returns:
+        ContentCatalog: Catalog of this content folder
+    """
+    root = os.path.normpath(root)
+    if root not in _catalogs:
+        _catalogs[root] = ContentCatalog(root)
+    return _catalogs[root]
+
+
+def is_in_folder(path: str, root: str) -> bool:
+    """Check whether a path is inside a folder (or is the folder itself).
+
+    Args:
+        path (str): Path to check
+        root (str): Folder to check against
+
+    Returns:
+        bool: True if path is inside root
+    """
+    path, root = os.path.normpath(path), os.path.normpath(root)
+    try:
+        return os.path.commonpath((path, root)) == root
+    except ValueError:
+        return False
@@ -169,6 +169,11 @@ class HGPreferenceBackend:
     )
 
     nc_colorspace_name: StringProperty(default="")
+    livekey_float32: BoolProperty(
+        name="Single precision livekeys",
+        description="Use 32 bit floats for livekey calculations. Uses less memory and is faster, but is slightly less precise",
+        default=False,
+    )
     debug_mode: BoolProperty(default=False)
     silence_all_console_messages: BoolProperty(default=False)
 
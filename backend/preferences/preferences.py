@@ -256,6 +256,7 @@ class HG_PREF(CpackEditingSystem, HGPreferenceBackend, bpy.types.AddonPreference
 
         col = layout.column(heading="Advanced options:")
         col.prop(self, "debug_mode", text="Debug Mode")
+        col.prop(self, "livekey_float32")
         col.prop(
             self,
             "silence_all_console_messages",
@@ -5,7 +5,9 @@
 from __future__ import annotations
 
 import os
-from typing import Dict, Optional, Union
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, Optional, Union
 
 import bpy
 from HumGen3D.backend.preferences.preference_func import get_addon_root
@@ -13,6 +15,7 @@ from HumGen3D.common.type_aliases import BpyEnum, GenderStr
 
 from ..common.exceptions import HumGenException  # type: ignore
 from . import get_prefs, hg_log
+from .content_catalog import get_catalog, is_in_folder
 
 preview_collections: Dict[str, PreviewCollection] = {}  # global dict of all pcolls
 
@@ -81,6 +84,8 @@ class PreviewCollection:
         if isinstance(self.subfolder, list):
             self.subfolder = os.path.join(*self.subfolder)
 
+        self.populate_count = 0  # To check if the items changed since a refresh
+
     def refresh(self, context: bpy.types.Context, gender: Optional[str] = None) -> None:
         """Refresh the items of this preview.
 
@@ -110,6 +115,7 @@ class PreviewCollection:
         gender: Optional[GenderStr],
         subcategory: Optional[str] = None,
         use_search_term: bool = True,
+        lazy_thumbnails: bool = True,
     ) -> None:
         """Populates the pcoll enum list with blend file filepaths and icons.
 
@@ -118,10 +124,14 @@ class PreviewCollection:
             gender: Gender to populate the pcoll for ("male", "female")
             subcategory: Only find files inside this subcategory
             use_search_term: Filter only files that match user defined search_term
+            lazy_thumbnails: Show a placeholder icon for thumbnails that are not loaded
+                yet and load them in the background with `thumbnail_loader`. If
+                False, all thumbnails are loaded before returning.
         """
         sett = context.scene.HG3D  # type:ignore[attr-defined]
         sett.load_exception = self.name != "pose"
         pref = get_prefs()
+        self.populate_count += 1
 
         # clear previews list
         sett["previews_list_{}".format(self.name)] = []
@@ -144,6 +154,8 @@ class PreviewCollection:
 
         all_files = list_files_in_dir(pcoll_full_dir, search_term, self.extension)
         path_list = []
+        thumb_paths = {}
+        category_thumbs = []
         if not all_files:
             empty_thumb = self._add_info_thumbnail("pcoll_empty")
             pcoll_enum = [("none", "", "", empty_thumb.icon_id, 0)]
@@ -156,12 +168,20 @@ class PreviewCollection:
                     continue
                 short_path = os.path.relpath(full_path, pref.filepath)
 
+                thumb_path = self._get_thumbnail_path(full_path)
+                category_thumbs.append(thumb_path)
+                loaded_thumb = self.pcoll.get(thumb_path)  # type:ignore[attr-defined]
+                if loaded_thumb is None and not lazy_thumbnails:
+                    loaded_thumb = self._load_thumbnail(thumb_path)
+                if loaded_thumb is None:
+                    thumb_paths[short_path] = thumb_path
+
                 pcoll_enum.append(
                     (
                         short_path,
                         get_display_name(full_path),
                         "",
-                        self._get_thumbnail_for_item(full_path).icon_id,
+                        (loaded_thumb or none_thumb).icon_id,
                         i + 1,
                     )
                 )
@@ -177,8 +197,50 @@ class PreviewCollection:
         self.pcoll[self.name] = pcoll_enum  # type:ignore[index]
         sett[f"previews_list_{self.name}"] = path_list
 
+        thumbnail_loader.queue(
+            self,
+            os.path.join(gender, subcategory),
+            [
+                (i, item[0], thumb_paths[item[0]])
+                for i, item in enumerate(pcoll_enum)
+                if item[0] in thumb_paths
+            ],
+            category_thumbs,
+        )
+
         sett.load_exception = False
 
+    def list_items(
+        self, gender: Optional[GenderStr] = None, subcategory: Optional[str] = None
+    ) -> list[str]:
+        """Get the relative paths of the items of this pcoll, sorted by path.
+
+        Unlike populate(), this doesn't load thumbnails or change any properties, so
+        it can be used to pick content before a human exists.
+
+        Args:
+            gender: Gender to find items for ("male", "female")
+            subcategory: Only find files inside this subcategory
+
+        Returns:
+            list[str]: Paths relative to the Human Generator folder, the same format
+                as the options of the preview collection.
+        """
+        pref = get_prefs()
+        gender = gender if gender and self.gender_split else ""
+        if not subcategory or subcategory == "All":
+            subcategory = ""
+
+        pcoll_full_dir = os.path.join(
+            pref.filepath, self.subfolder, gender, subcategory  # type:ignore[arg-type]
+        )
+        items = [
+            os.path.relpath(full_path, pref.filepath)
+            for full_path in list_files_in_dir(pcoll_full_dir, "", self.extension)
+            if not (self.name == "shapekeys" and "expressions" in full_path)
+        ]
+        return sorted(items, key=lambda path: (path.lower().endswith(".trial"), path))
+
     def find_folders(self, gender: GenderStr, include_all: bool = True) -> BpyEnum:
         """Gets enum of folders found in a specific directory.
 
@@ -203,15 +265,14 @@ class PreviewCollection:
         else:
             categ_folder = os.path.join(pref.filepath, folder)
 
-        if not os.path.isdir(categ_folder):
+        dirlist = get_catalog(pref.filepath).listdir(categ_folder)
+        if dirlist is None:
             hg_log(
                 f"Can't find folder {categ_folder} for preview collection {self.name}",
                 level="DEBUG",
             )
             return [("NOT INSTALLED", "NOT INSTALLED", "", i) for i in range(99)]
 
-        dirlist = os.listdir(categ_folder)
-        dirlist.sort()
         categ_list = []
         ext = (".jpg", "png", ".jpeg", ".blend")
         # FIXME
@@ -236,7 +297,7 @@ class PreviewCollection:
         else:
             return enum_list
 
-    def _get_thumbnail_for_item(self, full_path: str) -> bpy.types.ImagePreview:
+    def _get_thumbnail_path(self, full_path: str) -> str:
         if self.custom_icon:
             filepath_thumb = os.path.join(
                 get_addon_root(), "user_interface", "icons", self.custom_icon
@@ -245,6 +306,9 @@ class PreviewCollection:
             filepath_thumb = full_path + ".jpg"
         else:
             filepath_thumb = os.path.splitext(full_path)[0] + ".jpg"
+        return filepath_thumb
+
+    def _load_thumbnail(self, filepath_thumb: str) -> bpy.types.ImagePreview:
         if not self.pcoll.get(filepath_thumb):  # type:ignore[attr-defined]
             return self.pcoll.load(filepath_thumb, filepath_thumb, "IMAGE")
         else:
@@ -268,6 +332,117 @@ class PreviewCollection:
             return self.pcoll[filepath_thumb]  # type:ignore[index, no-any-return]
 
 
+class ThumbnailLoader:
+    """Loads pcoll thumbnails in the background, a few per timer tick.
+
+    Populating a pcoll only puts placeholder icons in the enum. The missing thumbnails
+    are loaded in enum order, which is the order of the grid, with the most recently
+    populated pcoll first. The previews of the least recently populated categories
+    are unloaded when more than `max_categories` categories have been populated.
+    """
+
+    def __init__(self, tick_budget: float = 0.01, max_categories: int = 12) -> None:
+        self.tick_budget = tick_budget
+        self.max_categories = max_categories
+        # (pcoll name, enum index, short path, thumbnail path)
+        self._queue: deque[tuple[str, int, str, str]] = deque()
+        self._categories: OrderedDict[tuple[str, str], set[str]] = OrderedDict()
+        self._shown: dict[str, tuple[str, str]] = {}
+
+    def queue(
+        self,
+        pcoll: PreviewCollection,
+        category: str,
+        items: list[tuple[int, str, str]],
+        category_thumbs: Iterable[str],
+    ) -> None:
+        """Replace the queued thumbnails of this pcoll and start loading them.
+
+        Args:
+            pcoll (PreviewCollection): Pcoll that was just populated
+            category (str): Folder the pcoll was populated from, used as LRU key
+            items (list[tuple[int, str, str]]): Enum index, relative path and
+                thumbnail path of each item that still shows a placeholder
+            category_thumbs (Iterable[str]): Thumbnail paths of all items
+        """
+        key = (pcoll.name, category)
+        self._categories[key] = set(category_thumbs)
+        self._categories.move_to_end(key)
+        self._shown[pcoll.name] = key
+        self._evict()
+
+        queue = [(pcoll.name, *item) for item in items]
+        queue.extend(entry for entry in self._queue if entry[0] != pcoll.name)
+        self._queue = deque(queue)
+
+        # Timers don't run while a background script is executing
+        if self._queue and not bpy.app.background:
+            if not bpy.app.timers.is_registered(_load_thumbnails_tick):
+                bpy.app.timers.register(_load_thumbnails_tick, first_interval=0.0)
+
+    def tick(self) -> Optional[float]:
+        """Load thumbnails until the time budget of this tick is used up.
+
+        Returns:
+            Optional[float]: Seconds until the next tick, None when the queue is empty
+        """
+        start = time.perf_counter()
+        while self._queue and time.perf_counter() - start < self.tick_budget:
+            pcoll_name, enum_idx, short_path, thumb_path = self._queue.popleft()
+            pcoll = preview_collections.get(pcoll_name)
+            enum = pcoll.pcoll.get(pcoll_name) if pcoll else None
+            if not enum or enum_idx >= len(enum) or enum[enum_idx][0] != short_path:
+                continue
+
+            thumb = pcoll._load_thumbnail(thumb_path)  # type:ignore[union-attr]
+            enum[enum_idx] = (*enum[enum_idx][:3], thumb.icon_id, enum[enum_idx][4])
+
+        _redraw_areas()
+        return 0.05 if self._queue else None
+
+    def clear(self) -> None:
+        """Stop loading and forget all queued thumbnails."""
+        self._queue.clear()
+        self._categories.clear()
+        self._shown.clear()
+        if bpy.app.timers.is_registered(_load_thumbnails_tick):
+            bpy.app.timers.unregister(_load_thumbnails_tick)
+
+    def _evict(self) -> None:
+        evictable = [k for k in self._categories if k not in self._shown.values()]
+        while len(self._categories) > self.max_categories and evictable:
+            pcoll_name, category = evictable.pop(0)
+            thumbs = self._categories.pop((pcoll_name, category))
+            pcoll = preview_collections.get(pcoll_name)
+            if not pcoll:
+                continue
+
+            still_used = set().union(
+                *(
+                    paths
+                    for key, paths in self._categories.items()
+                    if key[0] == pcoll_name
+                )
+            )
+            for thumb_path in thumbs - still_used:
+                if thumb_path in pcoll.pcoll:
+                    del pcoll.pcoll[thumb_path]
+
+
+def _load_thumbnails_tick() -> Optional[float]:
+    return thumbnail_loader.tick()
+
+
+def _redraw_areas() -> None:
+    wm = bpy.context.window_manager
+    for window in wm.windows if wm else ():
+        for area in window.screen.areas:
+            area.tag_redraw()
+
+
+thumbnail_loader = ThumbnailLoader()  # global loader used by PreviewCollection
+
+
 def list_files_in_dir(
     search_dir: str,
     search_term: str,
@@ -277,7 +452,8 @@ def list_files_in_dir(
     """Gets a list of files in dir with certain extension.
 
     Extension depends on the passed pcoll_type. Also handles search terms the users
-    entered in a searchbox
+    entered in a searchbox. Directories inside the Human Generator folder are read
+    from the content catalog instead of walking the file system.
 
     Args:
         search_dir (str): Directory to search in
@@ -288,8 +464,14 @@ def list_files_in_dir(
     Returns:
         list: list of file paths in dir of certain extension
     """
+    content_folder = get_prefs().filepath
+    if content_folder and is_in_folder(search_dir, content_folder):
+        walker = get_catalog(content_folder).walk(search_dir)
+    else:
+        walker = os.walk(search_dir)
+
     file_paths = []
-    for root, _, files in os.walk(search_dir):
+    for root, _, files in walker:
         if skip_pbr_folder and "PBR" in root:
             continue  # don't show textures in PBR folder of texture sets``
         for fn in files:
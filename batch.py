@@ -0,0 +1,61 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+"""Streaming helpers for human specs, stored as JSON lines (one spec per line).
+
+Specs are plain dictionaries as made by `BatchHumanGenerator.iter_specs()` and
+accepted by `Human.from_spec()`. Because every spec is a single line, large batches
+can be written and read lazily, deduplicated, or split between machines with
+standard line based tools.
+"""
+
+import json
+import os
+from typing import Any, Iterable, Iterator
+
+Spec = dict[str, Any]
+
+
+def write_jsonl(filepath: str, specs: Iterable[Spec], append: bool = False) -> int:
+    """Write specs to a file, one JSON object per line.
+
+    Args:
+        filepath (str): Path of the .jsonl file to write
+        specs (Iterable[Spec]): Specs to write, consumed lazily
+        append (bool): Add the specs to the end of an existing file instead of
+            overwriting it. Defaults to False.
+
+    Returns:
+        int: Amount of written specs
+    """
+    folder = os.path.dirname(filepath)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    count = 0
+    with open(filepath, "a" if append else "w") as f:
+        for spec in specs:
+            f.write(json.dumps(spec, separators=(",", ":")) + "\n")
+            count += 1
+    return count
+
+
+def read_jsonl(filepath: str) -> Iterator[Spec]:
+    """Lazily read the specs from a file written by `write_jsonl`.
+
+    Args:
+        filepath (str): Path of the .jsonl file to read
+
+    Yields:
+        Spec: One spec per non-empty line
+
+    Raises:
+        ValueError: If a line doesn't contain a JSON object.
+    """
+    with open(filepath) as f:
+        for line_nr, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            spec = json.loads(line)
+            if not isinstance(spec, dict):
+                raise ValueError(f"Line {line_nr} of {filepath} is not a JSON object")
+            yield spec
@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING, Union, no_type_check
 
 import bpy  # type:ignore
 import numpy as np
+from HumGen3D.common.rng import get_rng
+from HumGen3D.common.type_aliases import RNG
 
 if TYPE_CHECKING:
     from HumGen3D.backend.properties.batch_props import BatchProps
@@ -14,6 +16,7 @@ def height_from_bell_curve(
     one_sd: float,
     random_seed: bool = True,
     samples: int = 1,
+    rng: RNG = None,
 ) -> list[float]:
     """Returns one or multiple samples from a bell curve generated from the
     batch_average_height and batch_standard_deviation properties.
@@ -25,18 +28,18 @@ def height_from_bell_curve(
         random_seed (bool, optional): Used by the example list to make sure the
             list doesn't update all the time. Defaults to True.
         samples (int, optional): Amount of length samples to draw. Defaults to 0.
+        rng (RNG): Numpy generator to draw the samples from. Defaults to a new
+            randomly seeded generator. Ignored if random_seed is False.
 
     Returns:
         list: with the default 0 samples it returns a single length value
             in centimeters, else it returns a list of length values in cm
     """
-    if random_seed:
-        np.random.seed()
-    else:
-        np.random.seed(0)
+    # Uses its own generator instead of reseeding the global numpy state
+    rng = get_rng(rng) if random_seed else np.random.default_rng(0)
 
     return list(
-        np.random.normal(
+        rng.normal(
             loc=average_height_cm, scale=average_height_cm * one_sd, size=samples
         )
     )
@@ -1,16 +1,33 @@
 # Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
 
+import json
 import os
-import random
-from typing import Literal, Optional, Union
+from typing import Any, Iterator, Literal, Optional
 
 import bpy
+import numpy as np
+from HumGen3D.backend import get_prefs, preview_collections
+from HumGen3D.batch import Spec as HumanSpec
+from HumGen3D.batch import write_jsonl
 from HumGen3D.batch_generator.batch_functions import height_from_bell_curve
+from HumGen3D.batch_generator.workers import (
+    ExportFormat,
+    ProgressCallback,
+    generator_settings,
+    run_batch_workers,
+)
 from HumGen3D.common.decorators import injected_context
-from HumGen3D.common.type_aliases import C  # type:ignore
+from HumGen3D.common.rng import choice, seed_python_random, weighted_choice
+from HumGen3D.common.type_aliases import C, GenderStr  # type:ignore
+from HumGen3D.human.body.body import random_body_key_value
+from HumGen3D.human.eyes.eyes import random_pupil_color
+from HumGen3D.human.face.face import random_face_key_value
+from HumGen3D.human.hair.basehair import HAIR_COLORS
 from HumGen3D.human.human import Human
+from HumGen3D.human.keys.keys import update_livekey_collection
+from HumGen3D.human.skin.skin import SPOT_PROBABILITIES
 
-SettingsDict = dict[str, Union[str, int, float]]
+SettingsDict = dict[str, Any]
 
 
 class BatchHumanGenerator:
@@ -41,50 +58,64 @@ class BatchHumanGenerator:
         add_clothing: bool = True,
         add_hair: bool = True,
         add_expression: bool = True,
+        seed: Optional[int] = None,
     ) -> None:
+        """Create a generator with these settings.
+
+        Args:
+            add_clothing (bool): Add an outfit and footwear. Defaults to True.
+            add_hair (bool): Add a random hairstyle. Defaults to True.
+            add_expression (bool): Add a random expression. Defaults to True.
+            seed (int, optional): Base seed. The n-th human generated by this
+                generator uses seed + n, making the whole batch reproducible. A
+                random seed is picked for every human if None.
+        """
         self.add_clothing = add_clothing
         self.add_hair = add_hair
         self.add_expression = add_expression
+        self.seed = seed
+        self.manifest: list[HumanSpec] = []
+        self._generated_count = 0
 
     @injected_context
     def generate_human(
         self,
         context: C = None,
         pose_type: str = "a_pose",
+        seed: Optional[int] = None,
     ) -> "Human":
+        """Generate a random human, using a single seeded generator for all choices.
 
-        gender = random.choices(
-            ("male", "female"), (self.male_chance, self.female_chance)
-        )[0]
-        if not self.human_preset_category_chances:
-            presets = Human.get_preset_options(gender)
-        else:
-            presets = []
-            # While loop to ensure at least one preset is in the list
-            while not presets:
-                chosen_category: str = random.choices(
-                    *zip(*self.human_preset_category_chances.items())  # type:ignore
-                )[0]
-                presets = Human.get_preset_options(gender, chosen_category, context)
+        The human is built with `Human.from_spec` from the same spec `iter_specs`
+        samples for this seed. Texture resolution, hair quality and clothing colors
+        are applied afterwards, they are not part of the spec.
 
-        chosen_preset = random.choice(presets)
-        human = Human.from_preset(chosen_preset, from_batch_generator=True)
+        A record of the seed, the chosen content and the resulting values is added
+        to `manifest`. This record is a spec, see `Human.from_spec`.
 
-        human.body.randomize()
-        human.face.randomize(use_bell_curve=gender == "female")
+        Args:
+            context (C): Blender context. bpy.context if not provided.
+            pose_type (str): "a_pose", "t_pose" or a pose category like "Running".
+                Defaults to "a_pose".
+            seed (int, optional): Seed of this human. Passing the seed from a
+                manifest record generates the same human again, as long as the
+                generator settings and installed content are the same. Defaults to
+                the next seed of this generator.
 
-        human.skin.randomize()
-        human.skin.texture.set_resolution(self.texture_resolution)
-        human.eyes.randomize()
+        Returns:
+            Human: The generated human
+        """
+        if seed is None:
+            seed = self._next_seed()
+        rng = np.random.default_rng(seed)
+        spec = self._sample_spec(seed, pose_type, rng)
 
-        if self.add_hair:
-            human.hair.regular_hair.randomize(context)
-            if human.gender == "male" and random.choice((1, 2, 3)) == 1:
-                human.hair.face_hair.randomize(context)
-                human.hair.face_hair.lightness = human.hair.regular_hair.lightness
-                human.hair.face_hair.redness = human.hair.regular_hair.redness
+        # The settings below only change the output, they are drawn after the spec.
+        # Name picking, haircard UVs and the color operator still use `random`
+        seed_python_random(rng)
+        human = Human.from_spec(spec, context)
 
-        human.hair.eyebrows.randomize_color()
+        human.skin.texture.set_resolution(self.texture_resolution)
         if self.hair_type == "particle":
             human.hair.set_hair_quality(self.hair_quality)
             human.hair.children_set_hide(True)
@@ -97,67 +128,285 @@ class BatchHumanGenerator:
                     continue
                 hair_attr.convert_to_haircards(self.hair_quality, context)
 
-        human.height.set(
-            height_from_bell_curve(
-                self.average_height_male
-                if gender == "male"
-                else self.average_height_female,
-                self.height_one_standard_deviation,
-            )[0]
+        for clothing in (human.clothing.outfit, human.clothing.footwear):
+            for cloth in clothing.objects:
+                clothing.randomize_colors(cloth, context, rng)
+                clothing.set_texture_resolution(cloth, self.texture_resolution)
+
+        # Makes the record a spec that can be passed to Human.from_spec
+        record: HumanSpec = {**spec, **human.as_dict(), "height": spec["height"]}
+        self.manifest.append(record)
+        return human
+
+    def iter_specs(self, n: int, pose_type: str = "a_pose") -> Iterator[HumanSpec]:
+        """Sample specs for n humans, without creating anything in Blender.
+
+        Specs only contain the chosen content and sampled values, which makes them
+        cheap enough to sample up front. They can then be saved with
+        `HumGen3D.batch.write_jsonl`, deduplicated or split, and turned into humans
+        with `Human.from_spec` only when needed. The seeds continue from those of
+        `generate_human`, which builds its humans from these same specs, so a
+        generator with a seed yields the same specs.
+
+        Body and face variation is sampled for the livekeys. Texture resolution,
+        hair quality and clothing colors are not part of the spec.
+
+        Args:
+            n (int): Amount of specs to yield
+            pose_type (str): "a_pose", "t_pose" or a pose category like "Running".
+                Defaults to "a_pose".
+
+        Yields:
+            HumanSpec: Spec dictionary for `Human.from_spec`
+        """
+        for _ in range(n):
+            seed = self._next_seed()
+            yield self._sample_spec(seed, pose_type, np.random.default_rng(seed))
+
+    def write_manifest(self, filepath: str) -> None:
+        """Write the records of all humans generated so far as JSON lines.
+
+        Args:
+            filepath (str): Path of the .jsonl file to write
+        """
+        write_jsonl(filepath, self.manifest)
+
+    def _next_seed(self) -> int:
+        if self.seed is None:
+            seed = int(np.random.default_rng().integers(2**31))
+        else:
+            seed = self.seed + self._generated_count
+        self._generated_count += 1
+        return seed
+
+    def generate_many(
+        self,
+        count: int,
+        output_folder: str,
+        workers: Optional[int] = None,
+        seed: Optional[int] = None,
+        pose_type: str = "a_pose",
+        export_format: ExportFormat = "blend",
+        blender_path: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> list[str]:
+        """Generate humans in parallel background Blender processes.
+
+        Every human is written to its own file in output_folder, the humans are not
+        added to the current scene. The manifest records of the humans are written
+        to manifest.jsonl in output_folder. The Human Generator add-on needs to be enabled
+        in the preferences of the started Blender processes.
+
+        Args:
+            count (int): Amount of humans to generate
+            output_folder (str): Folder to write the generated humans to
+            workers (int, optional): Amount of Blender processes to start. Defaults
+                to the amount of CPU cores.
+            seed (int, optional): Base seed, human i is generated with seed + i.
+                Defaults to the seed of this generator, or a random base seed if
+                that is None too.
+            pose_type (str): Pose type, see `generate_human`. Defaults to "a_pose".
+            export_format (ExportFormat): "blend", "fbx" or "glb". Defaults to
+                "blend".
+            blender_path (str, optional): Blender executable to start. Defaults to
+                the executable of the running Blender.
+            progress_callback (ProgressCallback, optional): Called with the amount
+                of finished humans, the total and the progress message of the
+                worker after each human.
+
+        Returns:
+            list[str]: Paths of the written files, sorted by human index
+        """
+        return run_batch_workers(
+            generator_settings(self),
+            count,
+            output_folder,
+            workers=workers,
+            seed=seed if seed is not None else self.seed,
+            pose_type=pose_type,
+            export_format=export_format,
+            blender_path=blender_path,
+            progress_callback=progress_callback,
         )
 
-        if self.add_clothing:
-            self._set_clothing(context, human)
-
-        if pose_type != "a_pose":
-            if pose_type == "t_pose":
-                human.pose.set(os.path.join("poses", "Base Poses", "HG_T_Pose.blend"))
-            else:
-                options = human.pose.get_options(
-                    context, category=pose_type.replace("_", " ")
+    def _sample_spec(
+        self, seed: int, pose_type: str, rng: np.random.Generator
+    ) -> HumanSpec:
+        gender = weighted_choice(
+            ("male", "female"), (self.male_chance, self.female_chance), rng
+        )
+        human_pcoll = preview_collections["humans"]
+        if not self.human_preset_category_chances:
+            presets = human_pcoll.list_items(gender)
+        else:
+            presets = []
+            categories, chances = zip(*self.human_preset_category_chances.items())
+            # While loop to ensure at least one preset is in the list
+            while not presets:
+                chosen_category: str = weighted_choice(categories, chances, rng)
+                presets = human_pcoll.list_items(gender, chosen_category)
+        preset = choice(presets, rng)
+
+        with open(os.path.join(get_prefs().filepath, preset)) as f:
+            preset_data = json.load(f)
+
+        spec: HumanSpec = {
+            "seed": seed,
+            "pose_type": pose_type,
+            "gender": gender,
+            "preset": preset,
+            "keys": _sample_livekey_values(gender, rng),
+            "skin": _sample_skin_values(preset_data["skin"], gender, rng),
+            "eyes": {**preset_data["eyes"], "pupil_color": random_pupil_color(rng)},
+        }
+
+        hair_spec: dict[str, dict[str, Any]] = {
+            "regular_hair": {"set": None},
+            "face_hair": {"set": None},
+        }
+        if self.add_hair:
+            hair_spec["regular_hair"]["set"] = choice(
+                preview_collections["hair"].list_items(gender), rng
+            )
+            if gender == "male" and choice((1, 2, 3), rng) == 1:
+                hair_spec["face_hair"]["set"] = choice(
+                    preview_collections["face_hair"].list_items(gender), rng
                 )
-                human.pose.set(random.choice(options))
+        lightness, redness, salt_and_pepper = HAIR_COLORS[
+            choice(list(HAIR_COLORS), rng)
+        ]
+        for hair_type in ("eyebrows", "regular_hair", "face_hair"):
+            hair_spec.setdefault(hair_type, {}).update(
+                lightness=lightness, redness=redness, salt_and_pepper=salt_and_pepper
+            )
+        if gender == "female":
+            hair_spec.pop("face_hair")
+        spec["hair"] = hair_spec
 
-        if self.add_expression:
-            self._set_expression(context, human)
+        spec["height"] = {
+            "set": float(
+                height_from_bell_curve(
+                    self.average_height_male
+                    if gender == "male"
+                    else self.average_height_female,
+                    self.height_one_standard_deviation,
+                    rng=rng,
+                )[0]
+            )
+        }
 
-        return human
+        clothing_spec: dict[str, dict[str, Any]] = {
+            "outfit": {"set": None},
+            "footwear": {"set": None},
+        }
+        if self.add_clothing:
+            clothing_category = (
+                choice(self.clothing_categories, rng)
+                if self.clothing_categories
+                else "All"
+            )
+            outfit_pcoll = preview_collections["outfit"]
+            outfits = outfit_pcoll.list_items(gender, clothing_category)
+            outfits = outfits or outfit_pcoll.list_items(gender)
+            clothing_spec["outfit"]["set"] = choice(outfits, rng)
+            clothing_spec["footwear"]["set"] = choice(
+                preview_collections["footwear"].list_items(gender), rng
+            )
+        spec["clothing"] = clothing_spec
 
-    def _set_clothing(self, context: bpy.types.Context, human: Human) -> None:
-        if self.clothing_categories:
-            clothing_category = random.choice(self.clothing_categories)
-        else:
-            clothing_category = "All"
-        clothing_options = human.clothing.outfit.get_options(context, clothing_category)
-        if not clothing_options:
-            clothing_options = human.clothing.outfit.get_options(context)
-
-        human.clothing.outfit.set(random.choice(clothing_options))
-        human.clothing.footwear.set_random(context)
-
-        for cloth in human.clothing.outfit.objects:
-            human.clothing.outfit.randomize_colors(cloth)
-            human.clothing.outfit.set_texture_resolution(cloth, self.texture_resolution)
-
-        for cloth in human.clothing.footwear.objects:
-            human.clothing.footwear.randomize_colors(cloth)
-            human.clothing.footwear.set_texture_resolution(
-                cloth, self.texture_resolution
+        if pose_type == "t_pose":
+            spec["pose"] = os.path.join("poses", "Base Poses", "HG_T_Pose.blend")
+        elif pose_type != "a_pose":
+            spec["pose"] = choice(
+                preview_collections["pose"].list_items(
+                    subcategory=pose_type.replace("_", " ")
+                ),
+                rng,
             )
 
-    def _set_expression(self, context: bpy.types.Context, human: Human) -> None:
-        categories = human.expression.get_categories()
+        if self.add_expression:
+            spec["expression"] = self._sample_expression(gender, rng)
+
+        return spec
+
+    def _sample_expression(self, gender: GenderStr, rng: np.random.Generator) -> str:
+        expression_pcoll = preview_collections["expression"]
+        categories = [
+            option[0]
+            for option in expression_pcoll.find_folders(gender, include_all=False)
+        ]
         if self.expression_type == "most_varied":
-            chosen_category = random.choice(categories)
+            chosen_category = choice(categories, rng)
         else:
             weight_dict = {"happy": 1.0, "neutral": 1.0}
             weights = tuple(
                 weight_dict.get(category.lower(), 0.08) for category in categories
             )
-            chosen_category = random.choices(categories, weights=weights)[0]
+            chosen_category = weighted_choice(categories, weights, rng)
 
-        options = human.expression.get_options(context, category=chosen_category)
-        if options:
-            human.expression.set(random.choice(options))
-        else:
-            human.expression.set_random(context)
+        options = expression_pcoll.list_items(gender, chosen_category)
+        return choice(options or expression_pcoll.list_items(gender), rng)
+
+
+def _sample_livekey_values(
+    gender: GenderStr, rng: np.random.Generator
+) -> dict[str, float]:
+    """Sample body and face livekey values, like body.randomize and face.randomize.
+
+    Like in `generate_human`, face proportions locked in the UI are not sampled.
+
+    Args:
+        gender (GenderStr): Gender of the human
+        rng (np.random.Generator): Generator to draw values from
+
+    Returns:
+        dict[str, float]: Livekey name to value
+    """
+    livekeys = bpy.context.window_manager.livekeys
+    if not len(livekeys):
+        update_livekey_collection()
+    locks = bpy.context.scene.HG3D.locks
+
+    values = {}
+    for key in livekeys:
+        if key.gender and key.gender != gender:
+            continue
+        if key.category == "body_proportions":
+            value = random_body_key_value(key.name, key.subcategory, rng)
+            if value is not None:
+                values[key.name] = value
+        elif key.category == "face_proportions":
+            if key.subcategory.lower() == "special":
+                continue
+            if getattr(locks, key.subcategory, False):
+                continue
+            values[key.name] = random_face_key_value(key.name, rng)
+    return values
+
+
+def _sample_skin_values(
+    preset_skin: dict[str, Any], gender: GenderStr, rng: np.random.Generator
+) -> dict[str, Any]:
+    """Sample skin values around those of the preset, like skin.randomize.
+
+    Args:
+        preset_skin (dict[str, Any]): Skin section of the preset
+        gender (GenderStr): Gender of the human
+        rng (np.random.Generator): Generator to draw values from
+
+    Returns:
+        dict[str, Any]: Skin section for the spec
+    """
+    skin = {
+        attr: float(preset_skin[attr] * rng.uniform(0.8, 1.2))
+        for attr in ("tone", "redness", "saturation")
+    }
+    skin["freckles"] = choice(SPOT_PROBABILITIES, rng)
+    skin["splotches"] = choice(SPOT_PROBABILITIES, rng)
+    if gender == "male":
+        beard_shadow_value = choice(SPOT_PROBABILITIES, rng) * 2
+        skin["gender_specific"] = {
+            "mustache_shadow": beard_shadow_value,
+            "beard_shadow": beard_shadow_value,
+        }
+    return skin
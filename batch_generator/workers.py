@@ -0,0 +1,272 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+"""Headless batch generation, spreading humans over background Blender processes.
+
+The main process writes a job file for each worker and starts it with
+`blender --background --python scripts/batch_worker.py -- <job file>`. Each worker
+builds its share of the humans, writes every human to its own file and reports the
+progress as JSON lines on its stdout pipe. The manifest records of all humans are
+collected in manifest.jsonl in the output folder. The Human Generator add-on needs to be
+enabled in the preferences Blender is started with.
+"""
+
+import json
+import os
+import queue
+import random
+import shutil
+import subprocess
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional
+
+import bpy
+from HumGen3D.backend import hg_log
+from HumGen3D.backend.preferences.preference_func import get_addon_root
+from HumGen3D.batch import write_jsonl
+from HumGen3D.common.exceptions import HumGenException
+
+if TYPE_CHECKING:
+    from .generator import BatchHumanGenerator, SettingsDict
+
+PROGRESS_PREFIX = "HG_BATCH_PROGRESS "
+MANIFEST_NAME = "manifest.jsonl"
+
+ExportFormat = Literal["blend", "fbx", "glb"]
+ProgressCallback = Callable[[int, int, dict[str, Any]], None]
+
+# Attributes of BatchHumanGenerator that are passed to the workers
+SETTING_NAMES = (
+    "female_chance",
+    "male_chance",
+    "human_preset_category_chances",
+    "add_clothing",
+    "clothing_categories",
+    "add_expression",
+    "expression_type",
+    "add_hair",
+    "hair_type",
+    "hair_quality",
+    "average_height_male",
+    "average_height_female",
+    "height_one_standard_deviation",
+    "texture_resolution",
+)
+
+
+def generator_settings(generator: "BatchHumanGenerator") -> "SettingsDict":
+    """Get the settings of this generator as a JSON serializable dict.
+
+    Args:
+        generator (BatchHumanGenerator): Generator to get the settings from
+
+    Returns:
+        SettingsDict: Dict of setting name to value
+    """
+    return {name: getattr(generator, name) for name in SETTING_NAMES}
+
+
+def apply_generator_settings(
+    generator: "BatchHumanGenerator", settings: "SettingsDict"
+) -> None:
+    """Set the settings from a `generator_settings` dict on this generator.
+
+    Args:
+        generator (BatchHumanGenerator): Generator to change
+        settings (SettingsDict): Output of `generator_settings`
+    """
+    for name, value in settings.items():
+        if name in SETTING_NAMES:
+            setattr(generator, name, value)
+
+
+def run_batch_workers(
+    settings: "SettingsDict",
+    count: int,
+    output_folder: str,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    pose_type: str = "a_pose",
+    export_format: ExportFormat = "blend",
+    blender_path: Optional[str] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> list[str]:
+    """Generate humans in parallel background Blender processes.
+
+    Args:
+        settings (SettingsDict): Generator settings, see `generator_settings`
+        count (int): Amount of humans to generate
+        output_folder (str): Folder to write the generated humans to
+        workers (int, optional): Amount of Blender processes to start. Defaults to
+            the amount of CPU cores.
+        seed (int, optional): Base seed, human i is generated with seed + i. A random
+            base seed is used if None.
+        pose_type (str): Pose type as used by `BatchHumanGenerator.generate_human`.
+            Defaults to "a_pose".
+        export_format (ExportFormat): "blend", "fbx" or "glb". Defaults to "blend".
+        blender_path (str, optional): Blender executable to start. Defaults to the
+            executable of the running Blender.
+        progress_callback (ProgressCallback, optional): Called with the amount of
+            finished humans, the total and the progress message of the worker.
+
+    Returns:
+        list[str]: Paths of the written files, sorted by human index
+
+    Raises:
+        HumGenException: If no human could be generated at all.
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, count))
+    if seed is None:
+        seed = random.randrange(2**31)
+    blender_path = blender_path or bpy.app.binary_path
+    worker_script = os.path.join(get_addon_root(), "scripts", "batch_worker.py")
+    os.makedirs(output_folder, exist_ok=True)
+
+    job_folder = tempfile.mkdtemp(prefix="hg_batch_")
+    processes = []
+    for worker_nr in range(workers):
+        job = {
+            "settings": settings,
+            "indices": list(range(worker_nr, count, workers)),
+            "seed": seed,
+            "pose_type": pose_type,
+            "export_format": export_format,
+            "output_folder": output_folder,
+        }
+        job_path = os.path.join(job_folder, f"job_{worker_nr}.json")
+        with open(job_path, "w") as f:
+            json.dump(job, f)
+
+        hg_log("STARTING HumGen batch worker", worker_nr, level="BACKGROUND")
+        processes.append(
+            subprocess.Popen(
+                [
+                    blender_path,
+                    "--background",
+                    "--python",
+                    worker_script,
+                    "--",
+                    job_path,
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+        )
+
+    messages: queue.Queue = queue.Queue()
+    readers = [
+        threading.Thread(target=_read_progress, args=(process, messages), daemon=True)
+        for process in processes
+    ]
+    for reader in readers:
+        reader.start()
+
+    results: dict[int, str] = {}
+    records: dict[int, dict[str, Any]] = {}
+    finished = 0
+    while finished < count:
+        try:
+            message = messages.get(timeout=0.5)
+        except queue.Empty:
+            if any(reader.is_alive() for reader in readers) or not messages.empty():
+                continue
+            break
+
+        finished += 1
+        if "error" in message:
+            hg_log(
+                f"Batch human {message['index']} failed:",
+                message["error"],
+                level="WARNING",
+            )
+        else:
+            results[message["index"]] = message["filepath"]
+            records[message["index"]] = {
+                "index": message["index"],
+                "filepath": message["filepath"],
+                **message["manifest"],
+            }
+        if progress_callback:
+            progress_callback(finished, count, message)
+
+    for process in processes:
+        process.wait()
+    for reader in readers:
+        reader.join()
+    shutil.rmtree(job_folder, ignore_errors=True)
+
+    write_jsonl(
+        os.path.join(output_folder, MANIFEST_NAME),
+        (records[index] for index in sorted(records)),
+    )
+
+    if not results:
+        raise HumGenException("Batch workers did not generate any humans.")
+    if len(results) < count:
+        hg_log(f"Generated {len(results)} of {count} humans.", level="WARNING")
+
+    return [results[index] for index in sorted(results)]
+
+
+def _read_progress(process: subprocess.Popen, messages: queue.Queue) -> None:
+    for line in process.stdout:  # type:ignore[union-attr]
+        if line.startswith(PROGRESS_PREFIX):
+            messages.put(json.loads(line[len(PROGRESS_PREFIX) :]))
+
+
+def run_worker(job: dict[str, Any]) -> None:
+    """Generate the humans of a job, runs inside a background Blender process.
+
+    Args:
+        job (dict[str, Any]): Job as written by `run_batch_workers`
+    """
+    from .generator import BatchHumanGenerator
+
+    generator = BatchHumanGenerator()
+    apply_generator_settings(generator, job["settings"])
+    context = bpy.context
+
+    for index in job["indices"]:
+        human_seed = job["seed"] + index
+
+        human = None
+        try:
+            human = generator.generate_human(context, job["pose_type"], human_seed)
+            filepath = os.path.join(
+                job["output_folder"], f"human_{index:05d}.{job['export_format']}"
+            )
+            _write_human(human, filepath, job["export_format"], context)
+            message = {
+                "index": index,
+                "seed": human_seed,
+                "filepath": filepath,
+                "manifest": generator.manifest[-1],
+            }
+        except Exception as e:  # noqa PIE786
+            message = {"index": index, "seed": human_seed, "error": repr(e)}
+        finally:
+            # Also after a failed export, later humans must not build on this one
+            if human is not None:
+                human.delete()
+                bpy.data.orphans_purge(do_recursive=True)
+
+        print(PROGRESS_PREFIX + json.dumps(message), flush=True)  # noqa T201
+
+
+def _write_human(
+    human: Any, filepath: str, export_format: ExportFormat, context: bpy.types.Context
+) -> None:
+    if export_format == "blend":
+        # Only write the human, not the rest of the session like the base templates
+        scene = bpy.data.scenes.new(name="HG_Batch")
+        for obj in human.objects:
+            scene.collection.objects.link(obj)
+        bpy.data.libraries.write(filepath, {scene})
+        bpy.data.scenes.remove(scene)
+    elif export_format == "fbx":
+        human.process.export.to_fbx(filepath, context=context)
+    elif export_format == "glb":
+        human.process.export.to_glb(filepath, context=context)
+    else:
+        raise HumGenException(f"Unknown export format {export_format}")
@@ -2,21 +2,108 @@
 
 """Functions used for analysing, manipulating, or creating raw geometry."""
 
-import hashlib
+import itertools
 from typing import Any, Iterable, Optional, Union, cast
 
 import bpy
 import numpy as np
 from bpy.types import Object, bpy_prop_collection
 from HumGen3D.common.decorators import injected_context
-from HumGen3D.common.type_aliases import DistanceDict  # type:ignore
-from HumGen3D.common.type_aliases import C
+from HumGen3D.common.hashing import ContentHasher
+from HumGen3D.common.math import NearestNeighbors
+from HumGen3D.common.type_aliases import (  # type:ignore
+    C,
+    DistanceArrays,
+    SmoothDistanceArrays,
+)
 from HumGen3D.human.keys.keys import ShapeKeyItem
-from mathutils import Matrix, Vector, kdtree
+from mathutils import Matrix
 
 NDArrayOrList = Union[list, np.ndarray]
 
 
+def mesh_from_arrays(
+    mesh_name: str,
+    vertices: NDArrayOrList,
+    edges: Optional[NDArrayOrList] = None,
+    faces: Optional[NDArrayOrList] = None,
+    use_smooth: bool = True,
+) -> bpy.types.Mesh:
+    """Create a new Blender mesh, filling it directly from numpy arrays.
+
+    Unlike mesh.from_pydata, this doesn't need Python tuples for every element.
+    The vertices, loops and polygons are added in bulk and written with
+    foreach_set, after which Blender computes the edges of the faces.
+
+    Args:
+        mesh_name (str): Name of the new mesh.
+        vertices (NDArrayOrList): Vertex coordinates, shape (n, 3).
+        edges (NDArrayOrList, optional): Loose edges as pairs of vertex indices.
+            Edges of the faces are added automatically. Defaults to None.
+        faces (NDArrayOrList, optional): Faces as vertex indices. Faces with the
+            same amount of vertices are fastest as 2D array, lists of faces with
+            different lengths are also accepted. Defaults to None.
+        use_smooth (bool): Whether to use smooth shading. Defaults to True.
+
+    Returns:
+        bpy.types.Mesh: The newly created mesh.
+    """
+    mesh = bpy.data.meshes.new(name=mesh_name)
+
+    coords = np.asarray(vertices, dtype=np.float32).reshape((-1, 3))
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set("co", coords.ravel())
+
+    if edges is not None and len(edges):
+        edge_idxs = np.asarray(edges, dtype=np.int32).reshape((-1, 2))
+        mesh.edges.add(len(edge_idxs))
+        mesh.edges.foreach_set("vertices", edge_idxs.ravel())
+
+    if faces is not None and len(faces):
+        loop_vert_idxs, loop_totals = _face_arrays(faces)
+        loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+        np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+
+        mesh.loops.add(len(loop_vert_idxs))
+        mesh.loops.foreach_set("vertex_index", loop_vert_idxs)
+        mesh.polygons.add(len(loop_totals))
+        mesh.polygons.foreach_set("loop_start", loop_starts)
+        # Blender 3.6+ derives the totals from the loop starts
+        if not bpy.types.MeshPolygon.bl_rna.properties["loop_total"].is_readonly:
+            mesh.polygons.foreach_set("loop_total", loop_totals)
+        mesh.polygons.foreach_set(
+            "use_smooth", np.full(len(loop_totals), use_smooth, dtype=bool)
+        )
+
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def _face_arrays(faces: NDArrayOrList) -> tuple[np.ndarray, np.ndarray]:
+    """Get the flattened vertex indices and the vertex count of each face.
+
+    Args:
+        faces (NDArrayOrList): Faces as 2D array or as list of index sequences
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Vertex index of each loop and loop total of
+            each face, both int32.
+    """
+    if isinstance(faces, np.ndarray) and faces.ndim == 2:
+        loop_totals = np.full(len(faces), faces.shape[1], dtype=np.int32)
+        return faces.astype(np.int32).ravel(), loop_totals
+
+    loop_totals = np.fromiter(
+        (len(face) for face in faces), dtype=np.int32, count=len(faces)
+    )
+    loop_vert_idxs = np.fromiter(
+        itertools.chain.from_iterable(faces),
+        dtype=np.int32,
+        count=int(loop_totals.sum()),
+    )
+    return loop_vert_idxs, loop_totals
+
+
 @injected_context
 def obj_from_pydata(
     obj_name: str,
@@ -40,17 +127,7 @@ def obj_from_pydata(
     Returns:
         bpy.types.Object: The newly created object.
     """
-    mesh = bpy.data.meshes.new(name="hair")
-    all_verts_as_tuples = [tuple(co) for co in vertices]
-    all_edges_as_tuples = [tuple(idxs) for idxs in edges] if edges is not None else []
-    all_faces_as_tuples = [tuple(idxs) for idxs in faces] if faces is not None else []
-
-    mesh.from_pydata(all_verts_as_tuples, all_edges_as_tuples, all_faces_as_tuples)
-    mesh.update()
-
-    for f in mesh.polygons:
-        f.use_smooth = use_smooth
-
+    mesh = mesh_from_arrays(obj_name, vertices, edges, faces, use_smooth)
     obj = bpy.data.objects.new(obj_name, mesh)  # type:ignore[arg-type]
 
     context.scene.collection.objects.link(obj)
@@ -124,21 +201,25 @@ def _get_world_co(
 def build_distance_dict(
     body_coordinates_world: np.ndarray,
     target_coordinates_world: np.ndarray,
-) -> DistanceDict:
-    kd = kdtree.KDTree(len(body_coordinates_world))  # type:ignore[call-arg]
+) -> DistanceArrays:
+    """Find the nearest body vertex and the offset to it for each target vertex.
 
-    for i, co in enumerate(body_coordinates_world):
-        kd.insert(co, i)
-
-    kd.balance()
-
-    distance_dict = {}
-    for idx_target, co_target in enumerate(target_coordinates_world):
-        co_body, idx_body, _ = kd.find_n(co_target, 1)[0]
+    Args:
+        body_coordinates_world (np.ndarray): Body coordinates in world space, (n, 3)
+        target_coordinates_world (np.ndarray): Target coordinates in world space,
+            (m, 3)
 
-        distance_dict[idx_target] = (idx_body, co_body - Vector(co_target))
+    Returns:
+        DistanceArrays: Tuple of the nearest body vertex index for each target vertex,
+            shape (m,), and the offset from the target vertex to that body vertex,
+            shape (m, 3).
+    """
+    body_idxs, _ = NearestNeighbors(body_coordinates_world).query(
+        target_coordinates_world
+    )
+    offsets = np.asarray(body_coordinates_world)[body_idxs] - target_coordinates_world
 
-    return distance_dict
+    return body_idxs, offsets
 
 
 def matrix_multiplication(matrix: Matrix, coordinates: np.ndarray) -> np.ndarray:
@@ -153,53 +234,68 @@ def matrix_multiplication(matrix: Matrix, coordinates: np.ndarray) -> np.ndarray
     return cast(np.ndarray, coords)
 
 
+def _deform_target_data(
+    name: str, deform_obj: bpy.types.Object, as_shapekey: bool
+) -> bpy_prop_collection:
+    if not as_shapekey:
+        return deform_obj.data.vertices
+
+    key_blocks = deform_obj.data.shape_keys
+    if not key_blocks:
+        sk = deform_obj.shape_key_add(name="BASIS")
+        sk.interpolation = "KEY_LINEAR"
+        sk.value = 1
+        key_blocks = deform_obj.data.shape_keys
+
+    sk = key_blocks.key_blocks.get(name)
+    if not sk:
+        sk = deform_obj.shape_key_add(name=name)
+        sk.interpolation = "KEY_LINEAR"
+        sk.value = 1
+
+    return sk.data
+
+
+def _set_world_coords(
+    data: bpy_prop_collection, deform_obj: bpy.types.Object, world_coords: np.ndarray
+) -> None:
+    mx_inv: Matrix = deform_obj.matrix_world.inverted()  # type:ignore[assignment]
+    local_coords = matrix_multiplication(mx_inv, world_coords)
+    data.foreach_set("co", np.ascontiguousarray(local_coords, np.float32).ravel())
+
+
 def deform_obj_from_difference(
     name: str,
-    distance_dict: DistanceDict,
+    distance_dict: DistanceArrays,
     body_eval_coords_woorld: np.ndarray,
     deform_obj: bpy.types.Object,
     as_shapekey: bool = False,
 ) -> None:
+    """Move the vertices of deform_obj along with the body vertices nearest to them.
 
-    if as_shapekey:
-        key_blocks = deform_obj.data.shape_keys
-        if not key_blocks:
-            sk = deform_obj.shape_key_add(name="BASIS")
-            sk.interpolation = "KEY_LINEAR"
-            sk.value = 1
-            key_blocks = deform_obj.data.shape_keys
-
-        sk = key_blocks.key_blocks.get(name)
-        if not sk:
-            sk = deform_obj.shape_key_add(name=name)
-            sk.interpolation = "KEY_LINEAR"
-            sk.value = 1
-
-    # TODO fully numpy
-    for vertex_index in distance_dict:
-        source_new_vert_loc = Vector(
-            body_eval_coords_woorld[distance_dict[vertex_index][0]]
-        )
-        distance_to_vert = distance_dict[vertex_index][1]
-        world_new_loc = source_new_vert_loc - distance_to_vert
+    Args:
+        name (str): Name of the shape key to write to if as_shapekey is True
+        distance_dict (DistanceArrays): Output of `build_distance_dict`
+        body_eval_coords_woorld (np.ndarray): New body coordinates in world space
+        deform_obj (bpy.types.Object): Object to deform
+        as_shapekey (bool): Write the result to a shape key instead of the mesh.
+            Defaults to False.
+    """
+    body_idxs, offsets = distance_dict
+    world_new_coords = np.asarray(body_eval_coords_woorld)[body_idxs] - offsets
+
+    data = _deform_target_data(name, deform_obj, as_shapekey)
+    _set_world_coords(data, deform_obj, world_new_coords)
 
-        if as_shapekey:
-            sk.data[vertex_index].co = (
-                deform_obj.matrix_world.inverted() @ world_new_loc
-            )
-        else:
-            deform_obj.data.vertices[vertex_index].co = (
-                deform_obj.matrix_world.inverted() @ world_new_loc
-            )
 
 def build_distance_dict_SMOOTH(
     body_coordinates_world: np.ndarray,
     target_coordinates_world: np.ndarray,
     k_neighbors: int = 5,
     falloff_power: float = 2.0,
-) -> DistanceDict:
+) -> SmoothDistanceArrays:
     """
-    Build a distance dictionary using k nearest neighbors instead of just one.
+    Build distance arrays using k nearest neighbors instead of just one.
 
     Args:
         body_coordinates_world: Source body coordinates in world space
@@ -208,52 +304,34 @@ def build_distance_dict_SMOOTH(
         falloff_power: Power for distance weighting (higher values give more weight to closer points)
 
     Returns:
-        A dictionary mapping target indices to a list of (source_idx, distance_vector, weight) tuples
+        Tuple of body indices (m, k), offsets from the target vertices to those body
+        vertices (m, k, 3) and normalized inverse distance weights (m, k)
     """
-    kd = kdtree.KDTree(len(body_coordinates_world))  # type:ignore[call-arg]
-
-    for i, co in enumerate(body_coordinates_world):
-        kd.insert(co, i)
-
-    kd.balance()
-
-    distance_dict = {}
-    for idx_target, co_target in enumerate(target_coordinates_world):
-        # Find k nearest neighbors
-        nearest_points = kd.find_n(co_target, k_neighbors)
-
-        # Calculate distances for weighting
-        distances = [Vector(result[0]).length for result in nearest_points]
+    target_coordinates_world = np.asarray(target_coordinates_world)
+    body_idxs, distances = NearestNeighbors(body_coordinates_world).query(
+        target_coordinates_world, k_neighbors
+    )
+    body_idxs = body_idxs.reshape((len(target_coordinates_world), -1))
+    distances = distances.reshape(body_idxs.shape)
+    offsets = (
+        np.asarray(body_coordinates_world)[body_idxs]
+        - target_coordinates_world[:, None, :]
+    )
 
-        # Handle edge case when some points are at exact same position (distance = 0)
-        if any(d < 1e-7 for d in distances):
-            # If any point is extremely close, just use the closest one
-            co_body, idx_body, _ = nearest_points[0]
-            distance_dict[idx_target] = [(idx_body, co_body - Vector(co_target), 1.0)]
-        else:
-            # Calculate weights based on inverse distance
-            weights_raw = [1.0 / (d**falloff_power) for d in distances]
-            weight_sum = sum(weights_raw)
-            weights = [
-                w / weight_sum for w in weights_raw
-            ]  # Normalize weights to sum to 1
+    # If any point is extremely close, just use the closest one
+    exact = np.any(distances < 1e-7, axis=1)
+    weights = np.zeros_like(distances)
+    weights[exact, 0] = 1.0
 
-            # Store all neighbors with their weights
-            neighbors_data = []
-            for i, (co_body, idx_body, _) in enumerate(nearest_points):
-                neighbors_data.append(
-                    (idx_body, co_body - Vector(co_target), weights[i])
-                )
-
-            distance_dict[idx_target] = neighbors_data
-
-    return distance_dict
+    weights_raw = 1.0 / distances[~exact] ** falloff_power
+    weights[~exact] = weights_raw / weights_raw.sum(axis=1, keepdims=True)
 
+    return body_idxs, offsets, weights
 
 
 def deform_obj_from_difference_SMOOTH(
     name: str,
-    distance_dict: DistanceDict,
+    distance_dict: SmoothDistanceArrays,
     body_eval_coords_world: np.ndarray,
     deform_obj: bpy.types.Object,
     as_shapekey: bool = False,
@@ -261,42 +339,12 @@ def deform_obj_from_difference_SMOOTH(
     """
     Deform an object using multiple nearest neighbors for smoother results.
     """
-    if as_shapekey:
-        key_blocks = deform_obj.data.shape_keys
-        if not key_blocks:
-            sk = deform_obj.shape_key_add(name="BASIS")
-            sk.interpolation = "KEY_LINEAR"
-            sk.value = 1
-            key_blocks = deform_obj.data.shape_keys
-
-        sk = key_blocks.key_blocks.get(name)
-        if not sk:
-            sk = deform_obj.shape_key_add(name=name)
-            sk.interpolation = "KEY_LINEAR"
-            sk.value = 1
-
-    # Process each vertex using the weighted average of multiple nearest neighbors
-    for vertex_index in distance_dict:
-        neighbors = distance_dict[vertex_index]
-
-        # Initialize the new world position as a zero vector
-        world_new_loc = Vector((0, 0, 0))
-
-        # Calculate the weighted average position
-        for idx_body, distance_to_vert, weight in neighbors:
-            source_new_vert_loc = Vector(body_eval_coords_world[idx_body])
-            # Add the weighted contribution of this neighbor
-            world_new_loc += (source_new_vert_loc - distance_to_vert) * weight
-
-        # Apply the result
-        if as_shapekey:
-            sk.data[vertex_index].co = (
-                deform_obj.matrix_world.inverted() @ world_new_loc
-            )
-        else:
-            deform_obj.data.vertices[vertex_index].co = (
-                deform_obj.matrix_world.inverted() @ world_new_loc
-            )
+    body_idxs, offsets, weights = distance_dict
+    neighbor_coords = np.asarray(body_eval_coords_world)[body_idxs] - offsets
+    world_new_coords = np.einsum("ak,akj->aj", weights, neighbor_coords)
+
+    data = _deform_target_data(name, deform_obj, as_shapekey)
+    _set_world_coords(data, deform_obj, world_new_coords)
 
 
 def hash_mesh_object(obj: bpy.types.Object) -> int:
@@ -308,15 +356,11 @@ def hash_mesh_object(obj: bpy.types.Object) -> int:
     Returns:
         The hash of the object.
     """
+    hasher = ContentHasher()
     if obj.data.shape_keys:
-        keys = obj.data.shape_keys.key_blocks
-        coordinates = np.empty(
-            (len(keys), len(obj.data.vertices) * 3), dtype=np.float64
-        )
-        for key in keys:
-            key.data.foreach_get("data", coordinates[key.index])
+        for key in obj.data.shape_keys.key_blocks:
+            hasher.update_attribute(key.data, "co", decimals=3)
     else:
-        coordinates = world_coords_from_obj(obj)
+        hasher.update_array(world_coords_from_obj(obj), decimals=3)
 
-    np.round(coordinates, 3, out=coordinates)
-    return hash(tuple(coordinates))
+    return hasher.intdigest()
@@ -0,0 +1,110 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+"""Incremental hashing of Blender data, used for the hashes in Human.props.hashes.
+
+Attributes are read with foreach_get into reused numpy buffers and the raw bytes of
+those buffers are fed to a single BLAKE2b digest, so no Python objects are created
+per vertex or per hair key. The digest is stable between sessions and installs, so
+hashes stored in a .blend file can be compared after reopening it.
+"""
+
+import hashlib
+from typing import Optional
+
+import numpy as np
+from bpy.types import ParticleSystem, bpy_prop_collection  # type:ignore
+
+DIGEST_SIZE = 8
+
+
+class ContentHasher:
+    """Streams numpy arrays, Blender attributes and strings into one digest."""
+
+    def __init__(self) -> None:
+        self._digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+        self._float_buffer = np.empty(0, dtype=np.float32)
+
+    def update_array(self, array: np.ndarray, decimals: Optional[int] = None) -> None:
+        """Add the contents and the shape of a numpy array to the digest.
+
+        Args:
+            array (np.ndarray): Array to add
+            decimals (int, optional): Quantize floats to this many decimals first, so
+                tiny floating point differences don't change the hash.
+                Defaults to None.
+        """
+        array = np.asarray(array)
+        if decimals is not None:
+            scaled = array.astype(np.float64) * 10.0**decimals
+            array = np.rint(scaled).astype(np.int64)
+        self._digest.update(np.asarray(array.shape, dtype=np.int64).tobytes())
+        self._digest.update(np.ascontiguousarray(array).data)
+
+    def update_attribute(
+        self,
+        collection: bpy_prop_collection,
+        attribute: str,
+        width: int = 3,
+        decimals: Optional[int] = None,
+    ) -> None:
+        """Add a float attribute of all items of a Blender collection to the digest.
+
+        Args:
+            collection (bpy_prop_collection): For example mesh.vertices or
+                shape_key.data
+            attribute (str): Name of the attribute, for example "co"
+            width (int): Amount of values per item. Defaults to 3.
+            decimals (int, optional): See `update_array`. Defaults to None.
+        """
+        values = self._buffer(len(collection) * width)
+        collection.foreach_get(attribute, values)
+        self.update_array(values, decimals)
+
+    def update_hair_keys(
+        self, particle_system: ParticleSystem, decimals: Optional[int] = 2
+    ) -> None:
+        """Add the local hair key coordinates of a particle system to the digest.
+
+        Args:
+            particle_system (ParticleSystem): Hair particle system
+            decimals (int, optional): See `update_array`. Defaults to 2.
+        """
+        particles = particle_system.particles
+        key_counts = np.fromiter(
+            (len(p.hair_keys) for p in particles), dtype=np.int64, count=len(particles)
+        )
+        ends = np.cumsum(key_counts) * 3
+        coords = self._buffer(int(ends[-1]) if len(ends) else 0)
+
+        start = 0
+        for particle, end in zip(particles, ends.tolist()):
+            particle.hair_keys.foreach_get("co_local", coords[start:end])
+            start = end
+
+        self.update_array(key_counts)
+        self.update_array(coords, decimals)
+
+    def update_text(self, *texts: str) -> None:
+        """Add strings to the digest.
+
+        Args:
+            *texts (str): Strings to add, for example node names
+        """
+        for text in texts:
+            encoded = text.encode("utf-8")
+            self._digest.update(len(encoded).to_bytes(4, "little"))
+            self._digest.update(encoded)
+
+    def intdigest(self) -> int:
+        """Get the digest of everything added so far.
+
+        Returns:
+            int: Digest as signed 64 bit integer
+        """
+        return int.from_bytes(self._digest.digest(), "little", signed=True)
+
+    def _buffer(self, size: int) -> np.ndarray:
+        # The buffer is reused, its contents are hashed before it is filled again
+        if len(self._float_buffer) < size:
+            self._float_buffer = np.empty(size, dtype=np.float32)
+        return self._float_buffer[:size]
@@ -2,11 +2,16 @@
 
 """Contains functions encapsulating commonly used math operations."""
 
-from typing import Any, Iterable, Union, cast
+from typing import Any, Iterable, Literal, Union, cast
 
 import numpy as np
 from mathutils import Vector, kdtree  # type:ignore
 
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
 TuplePoint = tuple[float, float, float]
 
 
@@ -50,21 +55,129 @@ def centroid(coordinates: Coordinates) -> Vector:
     return Vector((mx, my, mz))
 
 
-def create_kdtree(coordinates: Coordinates) -> kdtree:
-    """Create a new mathutils kdtree from a set of coordinates:
+def create_kdtree(coordinates: Coordinates) -> "NearestNeighbors":
+    """Create a nearest neighbour search structure from a set of coordinates.
 
     Args:
         coordinates (Coordinates): Set of coordinates as list or numpy array.
 
     Returns:
-        kdtree: The kdtree, already balanced
+        NearestNeighbors: Search structure with bulk `query` and the `find` and
+            `find_n` methods of mathutils.kdtree.KDTree
+    """
+    return NearestNeighbors(coordinates)
+
+
+NNBackend = Literal["auto", "scipy", "mathutils"]
+
+
+class NearestNeighbors:
+    """Bulk nearest neighbour search over a fixed set of points.
+
+    Uses the vectorized KD-tree of SciPy when it's installed, answering all query
+    points in a single call. Blender doesn't ship SciPy, so otherwise the C KD-tree
+    of mathutils is used with one `find_n` call per query point.
     """
-    size = len(coordinates)  # type:ignore[arg-type]
-    kd = kdtree.KDTree(size)  # type:ignore
-    for i, v in enumerate(coordinates):
-        kd.insert(v, i)
-    kd.balance()
-    return kd
+
+    def __init__(self, coordinates: Coordinates, backend: NNBackend = "auto") -> None:
+        """Build the search structure.
+
+        Args:
+            coordinates (Coordinates): Points to search in, shape (n, 3)
+            backend (NNBackend): "scipy", "mathutils" or "auto" to use SciPy when
+                it's available. Defaults to "auto".
+
+        Raises:
+            ValueError: If no coordinates are passed.
+            ImportError: If backend is "scipy" and SciPy is not installed.
+        """
+        self.points = np.asarray(coordinates, dtype=np.float64).reshape((-1, 3))
+        if not len(self.points):
+            raise ValueError("Can't build a nearest neighbour search without points.")
+
+        if backend == "auto":
+            backend = "scipy" if cKDTree is not None else "mathutils"
+        if backend == "scipy" and cKDTree is None:
+            raise ImportError("SciPy is not installed, use the mathutils backend.")
+
+        self.backend = backend
+        if backend == "scipy":
+            self._tree = cKDTree(self.points)
+        else:
+            self._tree = kdtree.KDTree(len(self.points))  # type:ignore
+            for i, co in enumerate(self.points.tolist()):
+                self._tree.insert(co, i)
+            self._tree.balance()
+
+    def query(
+        self, coordinates: Coordinates, k: int = 1
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the k nearest points for each of the passed coordinates.
+
+        Args:
+            coordinates (Coordinates): Query points, shape (m, 3)
+            k (int): Number of neighbours to find. Defaults to 1.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Indices and distances of the neighbours,
+                sorted by distance. Shape (m,) if k is 1, (m, k) otherwise. k is
+                clipped to the number of points.
+        """
+        idxs, distances = self._query(coordinates, k)
+        if k == 1:
+            return idxs[:, 0], distances[:, 0]
+        return idxs, distances
+
+    def find(self, co: Iterable[float]) -> tuple[Vector, int, float]:
+        """Find the nearest point, same as mathutils.kdtree.KDTree.find.
+
+        Args:
+            co (Iterable[float]): Coordinate to search from
+
+        Returns:
+            tuple[Vector, int, float]: Coordinate, index and distance of the point
+        """
+        return self.find_n(co, 1)[0]
+
+    def find_n(self, co: Iterable[float], n: int) -> list[tuple[Vector, int, float]]:
+        """Find the n nearest points, same as mathutils.kdtree.KDTree.find_n.
+
+        Args:
+            co (Iterable[float]): Coordinate to search from
+            n (int): Number of points to find
+
+        Returns:
+            list[tuple[Vector, int, float]]: Coordinate, index and distance of each
+                point, sorted by distance
+        """
+        idxs, distances = self._query([tuple(co)], n)
+        return [
+            (Vector(self.points[idx]), int(idx), float(dist))
+            for idx, dist in zip(idxs[0], distances[0])
+        ]
+
+    def _query(self, coordinates: Coordinates, k: int) -> tuple[np.ndarray, np.ndarray]:
+        # Like query, but always with shape (m, k)
+        coordinates = np.asarray(coordinates, dtype=np.float64).reshape((-1, 3))
+        k = min(k, len(self.points))
+
+        if self.backend == "scipy":
+            distances, idxs = self._tree.query(coordinates, k)
+            idxs = np.asarray(idxs, dtype=np.int64).reshape((len(coordinates), k))
+            distances = np.asarray(distances).reshape((len(coordinates), k))
+            return idxs, distances
+
+        idxs = np.empty((len(coordinates), k), dtype=np.int64)
+        distances = np.empty((len(coordinates), k), dtype=np.float64)
+        find_n = self._tree.find_n
+        for i, co in enumerate(coordinates.tolist()):
+            for j, (_, idx, dist) in enumerate(find_n(co, k)):
+                idxs[i, j] = idx
+                distances[i, j] = dist
+        return idxs, distances
+
+    def __len__(self) -> int:
+        return len(self.points)
 
 
 def normalize(vector_array: np.ndarray, axis: int = -1, order: int = 2) -> np.ndarray:
@@ -0,0 +1,87 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+"""Helpers for drawing random values from an optional numpy Generator.
+
+All randomize functions take an `rng` argument. Passing the same seeded
+`np.random.Generator` to all of them makes a human fully reproducible, passing None
+keeps the old behaviour of a different result on every call.
+"""
+
+import random
+from typing import Optional, Sequence, TypeVar
+
+import numpy as np
+
+from .type_aliases import RNG
+
+T = TypeVar("T")
+
+
+def get_rng(rng: RNG = None) -> np.random.Generator:
+    """Get the passed generator, or a new randomly seeded one if None.
+
+    Args:
+        rng (RNG): Generator to use. Defaults to None.
+
+    Returns:
+        np.random.Generator: Generator to draw values from
+    """
+    return rng if rng is not None else np.random.default_rng()
+
+
+def choice(seq: Sequence[T], rng: RNG = None) -> T:
+    """Pick a random item from a sequence, like random.choice.
+
+    Unlike Generator.choice, this doesn't convert the items to a numpy array, so
+    tuples and strings are returned unchanged.
+
+    Args:
+        seq (Sequence[T]): Non-empty sequence to pick from
+        rng (RNG): Generator to use. Defaults to None.
+
+    Returns:
+        T: The chosen item
+
+    Raises:
+        IndexError: If the sequence is empty.
+    """
+    if not seq:
+        raise IndexError("Cannot choose from an empty sequence")
+    return seq[int(get_rng(rng).integers(len(seq)))]
+
+
+def weighted_choice(
+    seq: Sequence[T], weights: Sequence[float], rng: RNG = None
+) -> T:
+    """Pick a random item with the passed relative weights, like random.choices.
+
+    Args:
+        seq (Sequence[T]): Non-empty sequence to pick from
+        weights (Sequence[float]): Relative weight of each item, don't need to sum
+            to one.
+        rng (RNG): Generator to use. Defaults to None.
+
+    Returns:
+        T: The chosen item
+    """
+    probabilities = np.asarray(weights, dtype=np.float64)
+    probabilities /= probabilities.sum()
+    return seq[int(get_rng(rng).choice(len(seq), p=probabilities))]
+
+
+def seed_python_random(rng: RNG = None) -> Optional[int]:
+    """Seed the `random` module from this generator.
+
+    Used for code that still relies on the `random` module, like operators.
+
+    Args:
+        rng (RNG): Generator to draw the seed from. Does nothing if None.
+
+    Returns:
+        Optional[int]: The seed that was used, None if rng is None
+    """
+    if rng is None:
+        return None
+    seed = int(rng.integers(2**63))
+    random.seed(seed)
+    return seed
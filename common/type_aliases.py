@@ -3,7 +3,7 @@
 from typing import List, Literal, Optional, Union
 
 import bpy
-from mathutils import Vector
+import numpy as np
 
 C = Optional[bpy.types.Context]
 
@@ -11,5 +11,7 @@ PcollRowHeader = tuple[str, str, str]
 PcollRow = tuple[str, str, str, int]
 PcollRowIcon = tuple[str, str, str, int, int]
 BpyEnum = List[Union[PcollRow, PcollRowIcon, PcollRowHeader]]
-DistanceDict = dict[int, tuple[int, Vector]]
+DistanceArrays = tuple[np.ndarray, np.ndarray]  # nearest indices, offsets
+SmoothDistanceArrays = tuple[np.ndarray, np.ndarray, np.ndarray]  # + weights
 GenderStr = Literal["male", "female"]
+RNG = Optional[np.random.Generator]  # None means a freshly seeded generator
@@ -0,0 +1,92 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+"""Bulk reading and writing of vertex group weights with numpy arrays.
+
+VertexGroup.weight() raises for every vertex that isn't in the group and
+VertexGroup.add() is called per vertex list, so per-vertex loops over them are
+slow on the body mesh. These functions read all groups in one pass over the vertex
+group elements and write each distinct weight with a single add() call.
+"""
+
+from typing import Iterable, Literal, Optional, Union
+
+import bpy
+import numpy as np
+
+VertexGroupLike = Union[bpy.types.VertexGroup, str]
+
+
+def read_vertex_group_weights(
+    obj: bpy.types.Object, vertex_groups: Iterable[VertexGroupLike]
+) -> np.ndarray:
+    """Get the weights of the passed vertex groups for all vertices of the object.
+
+    Args:
+        obj (bpy.types.Object): Mesh object the vertex groups belong to
+        vertex_groups (Iterable[VertexGroupLike]): Vertex groups or their names
+
+    Returns:
+        np.ndarray: Weights with shape (vertex count, group count), 0 for vertices
+            that are not in a group.
+
+    Raises:
+        KeyError: If a passed group name is not a vertex group of the object.
+    """
+    group_idxs = [
+        obj.vertex_groups[vg].index if isinstance(vg, str) else vg.index
+        for vg in vertex_groups
+    ]
+    column_of_group = {group_idx: col for col, group_idx in enumerate(group_idxs)}
+
+    verts = obj.data.vertices
+    weights = np.zeros((len(verts), len(group_idxs)), dtype=np.float32)
+    if not group_idxs:
+        return weights
+
+    for vert in verts:
+        for element in vert.groups:
+            col = column_of_group.get(element.group)
+            if col is not None:
+                weights[vert.index, col] = element.weight
+
+    return weights
+
+
+def write_vertex_group_weights(
+    vertex_group: bpy.types.VertexGroup,
+    weights: np.ndarray,
+    min_weight: float = 0.0,
+    decimals: Optional[int] = None,
+    add_type: Literal["REPLACE", "ADD", "SUBTRACT"] = "REPLACE",
+) -> int:
+    """Add the vertices to the vertex group, one add() call per distinct weight.
+
+    Args:
+        vertex_group (bpy.types.VertexGroup): Vertex group to write to
+        weights (np.ndarray): Weight for each vertex of the object, shape (n,)
+        min_weight (float): Only vertices with a weight above this value are added.
+            Defaults to 0.0.
+        decimals (int, optional): Round the weights to this many decimals first,
+            which reduces the amount of add() calls. Defaults to None.
+        add_type (Literal["REPLACE", "ADD", "SUBTRACT"]): Mode passed to
+            VertexGroup.add(). Defaults to "REPLACE".
+
+    Returns:
+        int: Amount of add() calls made
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    if decimals is not None:
+        weights = np.round(weights, decimals)
+
+    vert_idxs = np.flatnonzero(weights > min_weight)
+    if not len(vert_idxs):
+        return 0
+
+    values, group_of_vert = np.unique(weights[vert_idxs], return_inverse=True)
+    order = np.argsort(group_of_vert, kind="stable")
+    splits = np.cumsum(np.bincount(group_of_vert, minlength=len(values)))[:-1]
+
+    for value, idxs in zip(values, np.split(vert_idxs[order], splits)):
+        vertex_group.add(idxs.tolist(), float(value), add_type)
+
+    return len(values)
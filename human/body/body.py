@@ -1,13 +1,14 @@
 # Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
 """Module containing subpart of Human class to edit body proportions of the human."""
 
-import random
-from typing import TYPE_CHECKING, Union, cast
+from typing import TYPE_CHECKING, Optional, Union, cast
 
 import bpy
+import numpy as np
 
 from HumGen3D.common.decorators import injected_context
-from HumGen3D.common.type_aliases import C
+from HumGen3D.common.rng import get_rng
+from HumGen3D.common.type_aliases import RNG, C
 
 if TYPE_CHECKING:
     from HumGen3D import Human
@@ -16,6 +17,28 @@ if TYPE_CHECKING:
 ALL = "ALL"
 
 
+def random_body_key_value(
+    name: str, subcategory: str, rng: np.random.Generator, std_deviation: float = 0.1
+) -> Optional[float]:
+    """Draw a random value for a body proportion key.
+
+    Args:
+        name (str): Name of the key
+        subcategory (str): Subcategory of the key
+        rng (np.random.Generator): Generator to draw the value from
+        std_deviation (float): Standard deviation for keys outside the "main"
+            subcategory. Defaults to 0.1.
+
+    Returns:
+        Optional[float]: Value for the key, None for keys that are not randomized
+    """
+    if subcategory.lower() == "main":
+        return float(rng.uniform(0, 1.0))
+    if subcategory.lower() == "special" or "length" in name.lower():
+        return None
+    return float(rng.normal(0, std_deviation))
+
+
 class BodySettings:
     """Class to edit body proportions of the human.
 
@@ -57,7 +80,11 @@ class BodySettings:
 
     @injected_context
     def randomize(
-        self, category: str = ALL, use_locks: bool = False, context: C = None
+        self,
+        category: str = ALL,
+        use_locks: bool = False,
+        context: C = None,
+        rng: RNG = None,
     ) -> None:
         """Randomizes the values of the body keys of this human.
 
@@ -68,34 +95,30 @@ class BodySettings:
             category (str, optional): Category of keys to randomize. Defaults to ALL.
             use_locks (bool, optional): Whether to use locks shown in UI. Defaults to False.
             context (C): Blender context
+            rng (RNG): Numpy generator to draw values from, for reproducible results.
+                Defaults to a new randomly seeded generator.
         """
         locks = bpy.context.scene.HG3D.locks
+        rng = get_rng(rng)
 
+        new_values = {}
         for key in self.keys:
             if category != ALL and key.subcategory != category:
                 continue
 
-            if key.subcategory.lower() == "main":
-                random_value = random.uniform(0, 1.0)
-                if hasattr(key, "set_without_update"):
-                    key.set_without_update(random_value)
-                else:
-                    key.value = random_value
-                continue
-            if key.subcategory.lower() == "special" or "length" in key.name.lower():
-                continue
-
-            # Skip if category is locked
-            if getattr(locks, key.subcategory, False) and use_locks:
+            # Skip if category is locked, the main keys can't be locked
+            locked = use_locks and getattr(locks, key.subcategory, False)
+            if locked and key.subcategory.lower() != "main":
                 continue
 
             std_deviation = 0.1 if category == ALL else 0.5
-            random_value = random.normalvariate(0, std_deviation)
-            if hasattr(key, "set_without_update"):
-                key.set_without_update(random_value)
-            else:
-                key.value = random_value
+            value = random_body_key_value(
+                key.name, key.subcategory, rng, std_deviation
+            )
+            if value is not None:
+                new_values[key.name] = value
 
+        self._human.keys.set_many(new_values)
         self._human.keys.update_human_from_key_change(context)
 
     @injected_context
@@ -105,12 +128,7 @@ class BodySettings:
         Args:
             context (C): Blender context
         """
-        for key in self.keys:
-            if hasattr(key, "set_without_update"):
-                key.set_without_update(0)
-            else:
-                key.value = 0
-
+        self._human.keys.set_many({key.name: 0 for key in self.keys})
         self._human.keys.update_human_from_key_change(context)
 
     def __hash__(self) -> int:
@@ -7,16 +7,16 @@ the two is made to give the user the option to choose footwear separately from
 clothing. This class contains the functionality that is shared between the two.
 
 The clothing system heavily relies on `build_distance_dict` and
-`deform_obj_from_difference`.
+`deform_obj_from_difference`. The output of `build_distance_dict` is stored on the
+cloth mesh, see the `correspondence` module.
 """
 
 import contextlib
-import hashlib
 import json
 import os
 from math import acos, pi
 from pathlib import Path
-from typing import Any, Iterable, Literal, Optional, Tuple, Union
+from typing import Any, Iterable, Literal, Optional, Tuple
 
 import bpy
 import numpy as np
@@ -25,22 +25,22 @@ from HumGen3D.backend.preferences.preference_func import get_addon_root
 from HumGen3D.backend.preview_collections import PREVIEW_COLLECTION_DATA
 from HumGen3D.common.collections import add_to_collection
 from HumGen3D.common.decorators import injected_context
-from HumGen3D.common.geometry import (
-    build_distance_dict,
-    deform_obj_from_difference,
-    world_coords_from_obj,
-)
-from HumGen3D.common.type_aliases import C
+from HumGen3D.common.geometry import deform_obj_from_difference
+from HumGen3D.common.hashing import ContentHasher
+from HumGen3D.common.rng import seed_python_random
+from HumGen3D.common.type_aliases import RNG, C
 from HumGen3D.human import clothing
 from HumGen3D.human.clothing.add_obj_to_clothing import (
     _add_corrective_shapekeys,
     _auto_weight_paint,
     _correct_shape_to_a_pose,
 )
+from HumGen3D.human.clothing.correspondence import get_cloth_correspondence
 from HumGen3D.human.clothing.pattern import PatternSettings
 from HumGen3D.human.clothing.saving import _save_clothing
 from HumGen3D.human.common_baseclasses.pcoll_content import PreviewCollectionContent
 from HumGen3D.human.common_baseclasses.savable_content import SavableContent
+from HumGen3D.human.content_changes import bump_generation, content_hash
 from mathutils import Vector
 
 
@@ -127,7 +127,11 @@ class BaseClothing(PreviewCollectionContent, SavableContent):
         # refresh pcoll for consistent 'click here to select' icon
         self.refresh_pcoll(context)
 
-        self._human.props.hashes[f"${self._pcoll_name}"] = str(hash(self))
+        rig = self._human.objects.rig
+        bump_generation(rig, self._pcoll_name)
+        self._human.props.hashes[f"${self._pcoll_name}"] = content_hash(
+            rig, self._pcoll_name, self
+        )
 
     def add_obj(
         self,
@@ -160,6 +164,7 @@ class BaseClothing(PreviewCollectionContent, SavableContent):
         # cloth_obj.matrix_parent_inverse = rig_obj.matrix_world.inverted()
         tag = "shoe" if cloth_type == "footwear" else "cloth"
         cloth_obj[tag] = 1  # type:ignore[index]
+        bump_generation(rig_obj, "footwear" if tag == "shoe" else "outfit")
 
         if "hg_body" in cloth_obj:
             del cloth_obj["hg_body"]
@@ -179,27 +184,19 @@ class BaseClothing(PreviewCollectionContent, SavableContent):
             cloth_obj (Object): cloth object to deform
         """
         body_obj = self._human.objects.body
-        if self._human.gender == "female":
-            verts = body_obj.data.vertices
-        else:
-            verts = body_obj.data.shape_keys.key_blocks["Male"].data
-
-        body_coords_world = world_coords_from_obj(body_obj, data=verts)
-
-        cloth_coords_world = world_coords_from_obj(cloth_obj)
-
-        distance_dict = build_distance_dict(body_coords_world, cloth_coords_world)
+        body_idxs, offsets = get_cloth_correspondence(
+            cloth_obj, body_obj, self._human.gender
+        )
 
         cloth_obj.parent = self._human.objects.rig
 
-        body_eval_coords_world = world_coords_from_obj(
-            body_obj,
-            data=self._human.keys.all_deformation_shapekeys,
-        )
+        body_mx = body_obj.matrix_world
+        body_eval_coords_world = self._human.keys.evaluated_coords(local=False)
+        offsets_world = offsets @ np.array(body_mx.to_3x3()).T
 
         deform_obj_from_difference(
             "Body Proportions",
-            distance_dict,
+            (body_idxs, offsets_world),
             body_eval_coords_world,
             cloth_obj,
             as_shapekey=True,
@@ -226,6 +223,7 @@ class BaseClothing(PreviewCollectionContent, SavableContent):
         for obj in self.objects:
             mask_remove_list.extend(find_masks(obj))
             hg_delete(obj)
+        bump_generation(self._human.objects.rig, self._pcoll_name)
 
         if remove_masks:
             for mask in mask_remove_list:
@@ -344,13 +342,19 @@ class BaseClothing(PreviewCollectionContent, SavableContent):
             new_image.colorspace_settings.name = old_color_setting
 
     @injected_context
-    def randomize_colors(self, cloth_obj: bpy.types.Object, context: C = None) -> None:
+    def randomize_colors(
+        self, cloth_obj: bpy.types.Object, context: C = None, rng: RNG = None
+    ) -> None:
         """Randomizes the colors of the passed clothing object.
 
         Args:
             cloth_obj (bpy.types.Object): Blender object that is currently loaded on
                 this human as clothing.
             context (C): Blender context. bpy.context if not provided.
+            rng (RNG): Numpy generator to draw values from, for reproducible results.
+                Defaults to a new randomly seeded generator. The colors are still
+                picked by the color_random operator, which uses the `random` module
+                seeded from this generator.
         """
         mat = cloth_obj.data.materials[0]
         if not mat:
@@ -366,6 +370,7 @@ class BaseClothing(PreviewCollectionContent, SavableContent):
             return
 
         old_active = context.view_layer.objects.active
+        seed_python_random(rng)
 
         colorgroups_json = os.path.join(
             get_addon_root(), "human", "clothing", "colorgroups.json"
@@ -632,29 +637,16 @@ class BaseClothing(PreviewCollectionContent, SavableContent):
         return is_inside_list.count(True) / len(is_inside_list)
 
     def __hash__(self) -> int:
-        hash_coll: list[Union[str, int]] = []
+        hasher = ContentHasher()
         for obj in self.objects:
-            vert_count = len(obj.data.vertices)
-            vert_co = np.empty(vert_count * 3, dtype=np.float64)
-            obj.data.vertices.foreach_get("co", vert_co)
-
-            hash_coll.append(
-                hashlib.sha1(vert_co).hexdigest()  # type:ignore[arg-type] # noqa DUO130
-            )
+            hasher.update_attribute(obj.data.vertices, "co")
             if obj.data.shape_keys:
                 for sk in obj.data.shape_keys.key_blocks:
-                    co = np.empty(vert_count * 3, dtype=np.float64)
-                    sk.data.foreach_get("co", co)
-                    hash_coll.append(
-                        hashlib.sha1(co).hexdigest()  # type:ignore[arg-type] # noqa DUO130
-                    )
+                    hasher.update_attribute(sk.data, "co")
 
             mat = obj.active_material
             if mat:
-                node_names = []
                 # TODO check effect of pattern loading
-                for node in mat.node_tree.nodes:
-                    node_names.append(node.name)
-                hash_coll.append(hash(tuple(node_names)))
+                hasher.update_text(*(node.name for node in mat.node_tree.nodes))
 
-        return hash(tuple(hash_coll))
+        return hasher.intdigest()
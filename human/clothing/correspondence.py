@@ -0,0 +1,251 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+"""Stores the correspondence between cloth vertices and the body they were made for.
+
+Deforming clothing to the human needs, for each cloth vertex, the nearest vertex of
+the rest-pose body (the base mesh or the "Male" shape key) and the offset to it.
+The rest shapes don't change when the user moves sliders, so this correspondence is
+only computed once and saved as point attributes on the cloth mesh. A hash of the
+exact local cloth coordinates and the cloth-to-body matrix are saved next to it, so
+edited or moved meshes are detected. Clothing saved to the library has the
+correspondence baked in, see `bake_correspondence`.
+
+All coordinates are in the local space of the body object, making the stored
+correspondence independent of where the human is placed in the scene.
+"""
+
+from typing import Iterable, Literal, Optional
+
+import bpy
+import numpy as np
+from HumGen3D.backend import hg_log
+from HumGen3D.common.geometry import (
+    build_distance_dict,
+    matrix_multiplication,
+    world_coords_from_obj,
+)
+from HumGen3D.common.hashing import ContentHasher
+from HumGen3D.common.type_aliases import DistanceArrays, GenderStr
+
+INDEX_ATTRIBUTE = "hg_body_index_{}"
+OFFSET_ATTRIBUTE = "hg_body_offset_{}"
+HASH_PROPERTY = "hg_body_hash_{}"
+MATRIX_PROPERTY = "hg_body_matrix_{}"
+MATRIX_TOLERANCE = 1e-5
+
+
+def body_rest_coords(body_obj: bpy.types.Object, gender: GenderStr) -> np.ndarray:
+    """Get the local coordinates of the body without any livekeys or shape keys.
+
+    Args:
+        body_obj (bpy.types.Object): Body object of the human
+        gender (GenderStr): Gender to get the base shape of
+
+    Returns:
+        np.ndarray: Local coordinates of the body, shape (n, 3)
+    """
+    if gender == "female":
+        verts = body_obj.data.vertices
+    else:
+        verts = body_obj.data.shape_keys.key_blocks["Male"].data
+    return world_coords_from_obj(body_obj, data=verts, local=True)
+
+
+def cloth_coords_in_body_space(
+    cloth_obj: bpy.types.Object, body_obj: bpy.types.Object
+) -> np.ndarray:
+    """Get the base coordinates of the cloth in the local space of the body.
+
+    Args:
+        cloth_obj (bpy.types.Object): Cloth object
+        body_obj (bpy.types.Object): Body object of the human
+
+    Returns:
+        np.ndarray: Cloth coordinates, shape (n, 3)
+    """
+    cloth_coords_world = world_coords_from_obj(cloth_obj)
+    return matrix_multiplication(body_obj.matrix_world.inverted(), cloth_coords_world)
+
+
+def cloth_to_body_matrix(
+    cloth_obj: bpy.types.Object, body_obj: bpy.types.Object
+) -> np.ndarray:
+    """Get the matrix from the local space of the cloth to that of the body.
+
+    Args:
+        cloth_obj (bpy.types.Object): Cloth object
+        body_obj (bpy.types.Object): Body object of the human
+
+    Returns:
+        np.ndarray: Flattened 4x4 matrix, shape (16,)
+    """
+    matrix = body_obj.matrix_world.inverted() @ cloth_obj.matrix_world
+    return np.array(matrix, dtype=np.float64).ravel()
+
+
+def correspondence_hash(mesh: bpy.types.Mesh, body_vert_count: int) -> str:
+    """Hash the cloth coordinates a correspondence is computed for.
+
+    The exact local coordinates are hashed, without rounding, so the hash only
+    changes when the mesh itself changes. Where the cloth is relative to the body is
+    checked separately, with a tolerance, see `cloth_to_body_matrix`.
+
+    Args:
+        mesh (bpy.types.Mesh): Mesh data of the cloth object
+        body_vert_count (int): Vertex count of the body the indices point to
+
+    Returns:
+        str: Hexdigest to compare against the stored hash
+    """
+    hasher = ContentHasher()
+    hasher.update_attribute(mesh.vertices, "co")
+    hasher.update_array(np.array([body_vert_count], dtype=np.int64))
+    return format(hasher.intdigest() & 0xFFFFFFFFFFFFFFFF, "016x")
+
+
+def read_correspondence(
+    mesh: bpy.types.Mesh,
+    gender: GenderStr,
+    expected_hash: str,
+    body_matrix: np.ndarray,
+) -> Optional[DistanceArrays]:
+    """Read the stored correspondence of this mesh, if it is still valid.
+
+    Args:
+        mesh (bpy.types.Mesh): Mesh data of the cloth object
+        gender (GenderStr): Gender of the body the correspondence was built for
+        expected_hash (str): Output of `correspondence_hash` for the current mesh
+        body_matrix (np.ndarray): Output of `cloth_to_body_matrix` for the cloth
+
+    Returns:
+        Optional[DistanceArrays]: Nearest body indices and offsets, None if there is
+            no stored correspondence or if the mesh changed since it was stored.
+    """
+    if mesh.get(HASH_PROPERTY.format(gender)) != expected_hash:
+        return None
+    stored_matrix = mesh.get(MATRIX_PROPERTY.format(gender))
+    if stored_matrix is None or not np.allclose(
+        np.array(stored_matrix, dtype=np.float64), body_matrix, atol=MATRIX_TOLERANCE
+    ):
+        return None
+
+    index_attr = mesh.attributes.get(INDEX_ATTRIBUTE.format(gender))
+    offset_attr = mesh.attributes.get(OFFSET_ATTRIBUTE.format(gender))
+    if not index_attr or not offset_attr:
+        return None
+
+    vert_count = len(mesh.vertices)
+    body_idxs = np.empty(vert_count, dtype=np.int32)
+    index_attr.data.foreach_get("value", body_idxs)
+    offsets = np.empty(vert_count * 3, dtype=np.float32)
+    offset_attr.data.foreach_get("vector", offsets)
+
+    return body_idxs, offsets.reshape((-1, 3)).astype(np.float64)
+
+
+def write_correspondence(
+    mesh: bpy.types.Mesh,
+    gender: GenderStr,
+    coords_hash: str,
+    body_matrix: np.ndarray,
+    distance_arrays: DistanceArrays,
+) -> None:
+    """Store the correspondence as point attributes on the cloth mesh.
+
+    Args:
+        mesh (bpy.types.Mesh): Mesh data of the cloth object
+        gender (GenderStr): Gender of the body the correspondence was built for
+        coords_hash (str): Output of `correspondence_hash` for this mesh
+        body_matrix (np.ndarray): Output of `cloth_to_body_matrix` for the cloth
+        distance_arrays (DistanceArrays): Output of `build_distance_dict`
+    """
+    body_idxs, offsets = distance_arrays
+    index_attr = _new_attribute(mesh, INDEX_ATTRIBUTE.format(gender), "INT")
+    index_attr.data.foreach_set("value", np.asarray(body_idxs, dtype=np.int32))
+    offset_attr = _new_attribute(mesh, OFFSET_ATTRIBUTE.format(gender), "FLOAT_VECTOR")
+    offset_attr.data.foreach_set(
+        "vector", np.ascontiguousarray(offsets, dtype=np.float32).ravel()
+    )
+    mesh[HASH_PROPERTY.format(gender)] = coords_hash
+    mesh[MATRIX_PROPERTY.format(gender)] = body_matrix.tolist()
+
+
+def get_cloth_correspondence(
+    cloth_obj: bpy.types.Object, body_obj: bpy.types.Object, gender: GenderStr
+) -> DistanceArrays:
+    """Get the nearest rest body vertex and the offset to it for each cloth vertex.
+
+    Reads the correspondence stored on the cloth mesh. If it's missing or outdated,
+    it is built with a KD-tree and stored for the next call.
+
+    Args:
+        cloth_obj (bpy.types.Object): Cloth object
+        body_obj (bpy.types.Object): Body object of the human
+        gender (GenderStr): Gender of the human
+
+    Returns:
+        DistanceArrays: Nearest body indices and offsets, in body local space
+    """
+    coords_hash = correspondence_hash(cloth_obj.data, len(body_obj.data.vertices))
+    body_matrix = cloth_to_body_matrix(cloth_obj, body_obj)
+
+    distance_arrays = read_correspondence(
+        cloth_obj.data, gender, coords_hash, body_matrix
+    )
+    if distance_arrays is not None:
+        return distance_arrays
+
+    hg_log("Building cloth correspondence for", cloth_obj.name, level="DEBUG")
+    return _build_correspondence(cloth_obj, body_obj, gender, coords_hash, body_matrix)
+
+
+def bake_correspondence(
+    cloth_obj: bpy.types.Object,
+    body_obj: bpy.types.Object,
+    genders: Iterable[GenderStr] = ("male", "female"),
+) -> None:
+    """Store the correspondence to the rest body of each gender on the cloth mesh.
+
+    Used when saving clothing, so loading it later doesn't need any KD-tree work.
+    The correspondence is always built from the base shape of the cloth, exactly
+    like `get_cloth_correspondence` rebuilds it when the stored one is outdated.
+
+    Args:
+        cloth_obj (bpy.types.Object): Cloth object
+        body_obj (bpy.types.Object): Body object the cloth is fitted to, needs
+            the "Male" shape key for baking the male correspondence
+        genders (Iterable[GenderStr]): Genders to bake for. Defaults to both.
+    """
+    coords_hash = correspondence_hash(cloth_obj.data, len(body_obj.data.vertices))
+    body_matrix = cloth_to_body_matrix(cloth_obj, body_obj)
+    for gender in genders:
+        _build_correspondence(cloth_obj, body_obj, gender, coords_hash, body_matrix)
+
+
+def _build_correspondence(
+    cloth_obj: bpy.types.Object,
+    body_obj: bpy.types.Object,
+    gender: GenderStr,
+    coords_hash: str,
+    body_matrix: np.ndarray,
+) -> DistanceArrays:
+    distance_arrays = build_distance_dict(
+        body_rest_coords(body_obj, gender),
+        cloth_coords_in_body_space(cloth_obj, body_obj),
+    )
+    write_correspondence(
+        cloth_obj.data, gender, coords_hash, body_matrix, distance_arrays
+    )
+    return distance_arrays
+
+
+def _new_attribute(
+    mesh: bpy.types.Mesh, name: str, attr_type: Literal["INT", "FLOAT_VECTOR"]
+) -> bpy.types.Attribute:
+    attr = mesh.attributes.get(name)
+    if attr and (attr.data_type != attr_type or attr.domain != "POINT"):
+        mesh.attributes.remove(attr)
+        attr = None
+    if not attr:
+        attr = mesh.attributes.new(name, attr_type, "POINT")
+    return attr
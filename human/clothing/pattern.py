@@ -3,19 +3,19 @@
 """Contains PatternSettings, for changing patterns on individual clothing items."""
 
 import os
-import random
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal, cast
 
 import bpy
 from bpy.types import ShaderNode  # type:ignore
-from HumGen3D.common.type_aliases import C
+from HumGen3D.common.type_aliases import RNG, C
 
 if TYPE_CHECKING:
     from HumGen3D.human.human import Human
 
 from HumGen3D.backend import get_prefs
 from HumGen3D.common.decorators import injected_context
+from HumGen3D.common.rng import choice
 from HumGen3D.human.common_baseclasses.pcoll_content import PreviewCollectionContent
 
 
@@ -117,15 +117,19 @@ class PatternSettings(PreviewCollectionContent):
         img_node.image = pattern
 
     @injected_context
-    def set_random(self, obj: bpy.types.Object, context: C = None) -> None:
+    def set_random(
+        self, obj: bpy.types.Object, context: C = None, rng: RNG = None
+    ) -> None:
         """Set a random pattern as active on the passed object.
 
         Args:
             obj (bpy.types.Object): Object to add pattern to.
             context (C): Blender context. bpy.context if not provided.
+            rng (RNG): Numpy generator to draw values from, for reproducible results.
+                Defaults to a new randomly seeded generator.
         """
         options = self.get_options(context)
-        chosen = random.choice(options)
+        chosen = choice(options, rng)
         self.set(chosen, obj)
 
     def remove(self, obj: bpy.types.Object) -> None:
@@ -9,7 +9,7 @@ import bpy
 import numpy as np
 from bpy.types import Context, Image, Object
 from HumGen3D.common.memory_management import hg_delete
-from HumGen3D.common.type_aliases import DistanceDict
+from HumGen3D.common.type_aliases import DistanceArrays
 
 if TYPE_CHECKING:
     from HumGen3D.human.human import Human
@@ -25,6 +25,7 @@ from HumGen3D.common.geometry import (
     deform_obj_from_difference,
     world_coords_from_obj,
 )
+from HumGen3D.human.clothing.correspondence import bake_correspondence
 
 
 def is_valid_clothing_object(obj: bpy.types.Object) -> bool:
@@ -77,9 +78,7 @@ def _save_clothing(
         if thumbnail:
             save_thumb(gender_folder, thumbnail.name, name)
 
-    body_eval_coords_world = world_coords_from_obj(
-        human.objects.body, data=human.keys.all_deformation_shapekeys
-    )
+    body_eval_coords_world = human.keys.evaluated_coords(local=False)
 
     texture_folder = os.path.join(folder, "textures")
     _save_material_textures(objs, texture_folder)
@@ -116,7 +115,7 @@ def _export_for_gender(
     objs: Iterable[bpy.types.Object],
     open_when_finished: bool,
     gender: str,
-    obj_distance_dict: DistanceDict,
+    obj_distance_dict: dict[str, DistanceArrays],
     body_coords_world: np.ndarray,
 ) -> None:
     export_list = []
@@ -150,6 +149,8 @@ def _export_for_gender(
             obj_copy,
             as_shapekey=as_sk,
         )
+        # Only the file of this gender is written, so only its lookup is needed
+        bake_correspondence(obj_copy, human.objects.body, genders=(gender,))
 
         export_list.append(obj_copy)
 
@@ -3,7 +3,6 @@
 """Implements baseclass for all classes representing content collections."""
 
 import os
-import random
 from pathlib import Path
 from typing import List, Optional
 
@@ -11,7 +10,8 @@ import bpy
 from HumGen3D.backend import get_prefs, preview_collections
 from HumGen3D.common.decorators import injected_context
 from HumGen3D.common.exceptions import HumGenException
-from HumGen3D.common.type_aliases import BpyEnum, C
+from HumGen3D.common.rng import choice
+from HumGen3D.common.type_aliases import RNG, BpyEnum, C
 
 
 class PreviewCollectionContent:
@@ -66,19 +66,22 @@ class PreviewCollectionContent:
             self.set(active_item)
 
     @injected_context
-    def set_random(self, context: C = None, update_ui: bool = False) -> None:
+    def set_random(
+        self, context: C = None, update_ui: bool = False, rng: RNG = None
+    ) -> None:
         """Set this content type to a random content item.
 
-        This will use random.choice to select a random item from the output of
-        get_options().
+        This will select a random item from the output of get_options().
 
         Args:
             context (C): Blender context. bpy.context if not provided.
             update_ui (bool): Will also show the chosen item as the active
                 thumbnail in the template_icon_view. Defaults to False.
+            rng (RNG): Numpy generator to draw values from, for reproducible results.
+                Defaults to a new randomly seeded generator.
         """
         options = self.get_options(context)
-        chosen = random.choice(options)
+        chosen = choice(options, rng)
 
         # TODO make sure random is not the same as previous
         # TODO add catch for empty pcoll
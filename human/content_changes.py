@@ -0,0 +1,149 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+"""Tracks which parts of a human changed, so unchanged content isn't hashed again.
+
+Every part of a human that can be saved as custom content (pose, outfit, footwear,
+hair and face_hair) has a generation counter, stored on the rig so it survives
+saving and duplicating the human. The setters of these parts bump the counter with
+`bump_generation`.
+
+`content_hash` returns the hash of a part, but only computes it again if the
+generation of the part changed since the hash was last computed. Manual edits in the
+viewport don't go through the setters, so `invalidate_edited_content` drops the
+remembered hash of a part when the user edits its geometry in pose, particle edit,
+edit or sculpt mode.
+"""
+
+from typing import Any, Hashable, Optional
+
+import bpy
+from bpy.app.handlers import persistent
+from bpy.types import Object  # type:ignore
+
+GENERATIONS_PROP = "hg_generations"
+SUBSYSTEMS = ("pose", "outfit", "footwear", "hair", "face_hair")
+
+# (rig pointer, rig name, subsystem) -> (generation, hash), global for the session
+_checked_hashes: dict[tuple[int, str, str], tuple[int, str]] = {}
+
+
+def bump_generation(rig: Object, *subsystems: str) -> None:
+    """Mark parts of a human as changed.
+
+    Args:
+        rig (Object): Rig object of the human
+        *subsystems (str): Names of the changed parts, see SUBSYSTEMS
+    """
+    if GENERATIONS_PROP not in rig:
+        rig[GENERATIONS_PROP] = {}
+    generations = rig[GENERATIONS_PROP]
+    for subsystem in subsystems:
+        generations[subsystem] = generations.get(subsystem, 0) + 1
+
+
+def get_generation(rig: Object, subsystem: str) -> int:
+    """Get the amount of times this part of the human has been changed.
+
+    Args:
+        rig (Object): Rig object of the human
+        subsystem (str): Name of the part, see SUBSYSTEMS
+
+    Returns:
+        int: Generation counter of this part, 0 if it never changed
+    """
+    generations = rig.get(GENERATIONS_PROP)
+    if generations is None:
+        return 0
+    return int(generations.get(subsystem, 0))
+
+
+def content_hash(rig: Object, subsystem: str, content: Hashable) -> str:
+    """Get the hash of a part of the human, computed only if the part changed.
+
+    Args:
+        rig (Object): Rig object of the human
+        subsystem (str): Name of the part, see SUBSYSTEMS
+        content (Hashable): Object of the part to hash, for example human.pose
+
+    Returns:
+        str: Hash in the format used by Human.props.hashes
+    """
+    key = (rig.as_pointer(), rig.name, subsystem)
+    generation = get_generation(rig, subsystem)
+
+    checked = _checked_hashes.get(key)
+    if checked is not None and checked[0] == generation:
+        return checked[1]
+
+    hash_str = str(hash(content))
+    _checked_hashes[key] = (generation, hash_str)
+    return hash_str
+
+
+def clear_checked_hashes(subsystem: Optional[str] = None) -> None:
+    """Forget the remembered hashes, so `content_hash` computes them again.
+
+    Args:
+        subsystem (str, optional): Only forget the hashes of this part.
+            Defaults to None, meaning all parts.
+    """
+    if subsystem is None:
+        _checked_hashes.clear()
+        return
+
+    for key in [key for key in _checked_hashes if key[2] == subsystem]:
+        del _checked_hashes[key]
+
+
+# Modes in which the user edits the content of a human by hand
+EDIT_MODES = {"POSE", "PARTICLE", "EDIT_MESH", "SCULPT"}
+
+
+def _edited_subsystems(obj: Object, mode: str) -> tuple[str, ...]:
+    if mode == "POSE":
+        return ("pose",) if obj.HG.ishuman else ()
+    if mode == "PARTICLE":
+        return ("hair", "face_hair") if obj.type == "MESH" else ()
+    if "cloth" in obj:
+        return ("outfit",)
+    if "shoe" in obj:
+        return ("footwear",)
+    return ()
+
+
+def _owning_rig(obj: Object) -> Optional[Object]:
+    if obj.HG.ishuman:
+        return obj
+    if obj.parent and obj.parent.HG.ishuman:
+        return obj.parent
+    return None
+
+
+@persistent
+def invalidate_edited_content(scene: Any, depsgraph: bpy.types.Depsgraph) -> None:
+    """Handler that forgets the hashes of content the user edited in the viewport.
+
+    Only geometry updates in EDIT_MODES count. The setters change the
+    content in object mode, so the updates they cause don't throw away the hash
+    they just stored. Object transforms don't matter, the hashes are in local space.
+    """
+    mode = bpy.context.mode
+    if not _checked_hashes or mode not in EDIT_MODES:
+        return
+
+    for update in depsgraph.updates:
+        obj = update.id.original
+        if not update.is_updated_geometry or not isinstance(obj, Object):
+            continue
+
+        rig = _owning_rig(obj)
+        if rig is None:
+            continue
+        for subsystem in _edited_subsystems(obj, mode):
+            _checked_hashes.pop((rig.as_pointer(), rig.name, subsystem), None)
+
+
+@persistent
+def clear_checked_hashes_on_load(dummy: Any) -> None:
+    """Handler that forgets all hashes when another file is loaded."""
+    clear_checked_hashes()
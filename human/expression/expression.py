@@ -210,7 +210,7 @@ class ExpressionSettings(PreviewCollectionContent):
         for sk_name in data["body"]:
             sk_item = self._human.keys.get(sk_name)
             if sk_item:
-                self._human.objects.body.shape_key_remove(sk_item.as_bpy())
+                self._human.keys.remove_shapekey(sk_item.as_bpy())
 
         del self._human.objects.body["facial_rig"]
 
@@ -20,11 +20,11 @@ class HG_REMOVE_SHAPEKEY(bpy.types.Operator):
         return context.window_manager.invoke_confirm(self, event)
 
     def execute(self, context):
-        hg_rig = Human.from_existing(context.active_object).objects.rig
-        hg_body = hg_rig.HG.body_obj
+        human = Human.from_existing(context.active_object)
+        hg_body = human.objects.rig.HG.body_obj
 
         sk_delete = hg_body.data.shape_keys.key_blocks[self.shapekey]
-        hg_body.shape_key_remove(sk_delete)
+        human.keys.remove_shapekey(sk_delete)
 
         return {"FINISHED"}
 
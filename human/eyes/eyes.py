@@ -3,12 +3,13 @@
 """Implements class for manipulating the eyes of the human."""
 
 
-import random
 from typing import TYPE_CHECKING, Any, cast
 
 from bpy.types import Material, Object  # type:ignore
+from HumGen3D.common.rng import choice, get_rng, weighted_choice
 from HumGen3D.common.shadernode import NodeInput  # type:ignore
 from HumGen3D.common.shadernode import COLOR2_INPUT_NAME
+from HumGen3D.common.type_aliases import RNG
 from HumGen3D.human.common_baseclasses.prop_collection import PropCollection
 
 if TYPE_CHECKING:
@@ -53,6 +54,64 @@ A_CLASS = [
 ]
 
 
+def random_pupil_color(rng: RNG = None) -> tuple[float, float, float, float]:
+    """Pick a random pupil color based on worldwide statistics.
+
+    Args:
+        rng (RNG): Numpy generator to draw values from, for reproducible results.
+            Defaults to a new randomly seeded generator.
+
+    Returns:
+        tuple[float, float, float, float]: Linear rgba color
+    """
+    # If you think the numers used here are incorrect, please contact us at
+    # support@humgen3d.com
+
+    # Worldwide statistics, based on
+    # https://www.worldatlas.com/articles/which-eye-color-is-the-most-common-in-the-world.html
+
+    weighted_lists = {
+        79: T_CLASS,  # Brown
+        13: D_CLASS,  # Amber, Hazel and Green
+        3: C_CLASS,  # Grey
+        9: A_CLASS,  # Blue
+    }
+
+    rng = get_rng(rng)
+    pupil_color_hex = choice(
+        weighted_choice(
+            [lst for _, lst in weighted_lists.items()],
+            weights=list(weighted_lists),
+            rng=rng,
+        ),
+        rng,
+    )
+
+    return _hex_to_rgb(pupil_color_hex)
+
+
+def _srgb_to_linearrgb(c: float) -> float:
+    # Source: https://blender.stackexchange.com/questions/158896/how-set-hex-in-rgb-node-python?noredirect=1#comment269316_158896 # noqa
+    if c < 0:
+        return 0
+    elif c < 0.04045:
+        return c / 12.92
+    else:
+        return cast(float, ((c + 0.055) / 1.055) ** 2.4)
+
+
+def _hex_to_rgb(h: int, alpha: float = 1.0) -> tuple[float, float, float, float]:
+    # Source: https://blender.stackexchange.com/questions/158896/how-set-hex-in-rgb-node-python?noredirect=1#comment269316_158896 # noqa
+    r = (h & 0xFF0000) >> 16
+    g = (h & 0x00FF00) >> 8
+    b = h & 0x0000FF
+
+    return cast(
+        tuple[float, float, float, float],
+        tuple([_srgb_to_linearrgb(c / 0xFF) for c in (r, g, b)] + [alpha]),
+    )
+
+
 class EyeSettings:
     """Class for manipulating the eyes of the human.
 
@@ -101,35 +160,18 @@ class EyeSettings:
         """
         return self.inner_material.node_tree.nodes
 
-    def randomize(self) -> None:
-        """Randomizes the color of the pupils based on worlwide statistics."""
-        nodes = self.inner_material.node_tree.nodes
-
-        # If you think the numers used here are incorrect, please contact us at
-        # support@humgen3d.com
-
-        # Worldwide statistics, based on
-        # https://www.worldatlas.com/articles/which-eye-color-is-the-most-common-in-the-world.html
+    def randomize(self, rng: RNG = None) -> None:
+        """Randomizes the color of the pupils based on worlwide statistics.
 
-        weighted_lists = {
-            79: T_CLASS,  # Brown
-            13: D_CLASS,  # Amber, Hazel and Green
-            3: C_CLASS,  # Grey
-            9: A_CLASS,  # Blue
-        }
-
-        pupil_color_hex = random.choice(
-            random.choices(
-                [lst for _, lst in weighted_lists.items()],
-                weights=list(weighted_lists),
-            )[0]
-        )
-
-        pupil_color_rgb = self._hex_to_rgb(pupil_color_hex)
+        Args:
+            rng (RNG): Numpy generator to draw values from, for reproducible results.
+                Defaults to a new randomly seeded generator.
+        """
+        nodes = self.inner_material.node_tree.nodes
 
         nodes["HG_Eye_Color"].inputs[
             COLOR2_INPUT_NAME
-        ].default_value = pupil_color_rgb  # type:ignore
+        ].default_value = random_pupil_color(rng)  # type:ignore
 
     def as_dict(self) -> dict[str, tuple[float, float, float, float]]:
         """Returns the current eye settings as a dictionary.
@@ -157,25 +199,3 @@ class EyeSettings:
         self.sclera_color.value = data["sclera_color"]
 
         return []
-
-    def _srgb_to_linearrgb(self, c: float) -> float:
-        # Source: https://blender.stackexchange.com/questions/158896/how-set-hex-in-rgb-node-python?noredirect=1#comment269316_158896 # noqa
-        if c < 0:
-            return 0
-        elif c < 0.04045:
-            return c / 12.92
-        else:
-            return cast(float, ((c + 0.055) / 1.055) ** 2.4)
-
-    def _hex_to_rgb(
-        self, h: int, alpha: float = 1.0
-    ) -> tuple[float, float, float, float]:
-        # Source: https://blender.stackexchange.com/questions/158896/how-set-hex-in-rgb-node-python?noredirect=1#comment269316_158896 # noqa
-        r = (h & 0xFF0000) >> 16
-        g = (h & 0x00FF00) >> 8
-        b = h & 0x0000FF
-
-        return cast(
-            tuple[float, float, float, float],
-            tuple([self._srgb_to_linearrgb(c / 0xFF) for c in (r, g, b)] + [alpha]),
-        )
@@ -7,7 +7,8 @@ from typing import TYPE_CHECKING, List, Union
 import bpy
 import numpy as np
 from HumGen3D.common.decorators import injected_context
-from HumGen3D.common.type_aliases import C
+from HumGen3D.common.rng import get_rng
+from HumGen3D.common.type_aliases import RNG, C
 
 if TYPE_CHECKING:
     from HumGen3D.human.human import Human
@@ -17,6 +18,20 @@ from HumGen3D.human.keys.keys import LiveKeyItem, ShapeKeyItem
 from ..common_baseclasses.prop_collection import PropCollection
 
 
+def random_face_key_value(name: str, rng: np.random.Generator) -> float:
+    """Draw a random value for a facial proportion key.
+
+    Args:
+        name (str): Name of the key
+        rng (np.random.Generator): Generator to draw the value from
+
+    Returns:
+        float: Value for the key, with less variation for distance keys
+    """
+    scale = 0.2 if "distance" in name.lower() else 0.5
+    return float(rng.normal(loc=0, scale=scale))
+
+
 class FaceSettings(PropCollection):
     """Class for manipulating the facial proportions of the human."""
 
@@ -39,12 +54,7 @@ class FaceSettings(PropCollection):
         Args:
             context (C): Blender context. bpy.context if not provided.
         """
-        for key in self.keys:
-            if hasattr(key, "set_without_update"):
-                key.set_without_update(0)
-            else:
-                key.value = 0
-
+        self._human.keys.set_many({key.name: 0 for key in self.keys})
         self._human.keys.update_human_from_key_change(context)
 
     @injected_context
@@ -54,6 +64,7 @@ class FaceSettings(PropCollection):
         use_bell_curve: bool = False,
         use_locks: bool = False,
         context: C = None,
+        rng: RNG = None,
     ) -> None:
         """Randomize facial proportions.
 
@@ -64,8 +75,11 @@ class FaceSettings(PropCollection):
                 facial proportions. Defaults to False. Locks are in UI.
             use_bell_curve (bool): Whether to use a bell curve for randomization.
             context (C): Blender context. bpy.context if not provided.
+            rng (RNG): Numpy generator to draw values from, for reproducible results.
+                Defaults to a new randomly seeded generator.
         """
         locks = bpy.context.scene.HG3D.locks
+        rng = get_rng(rng)
 
         if subcategory.lower() == "all":
             keys = [
@@ -81,16 +95,9 @@ class FaceSettings(PropCollection):
                 if key.subcategory == subcategory
                 and not getattr(locks, key.subcategory, False)
             ]
-        all_v = 0.0
+        new_values = {}
         for key in keys:
-            if "distance" in key.name.lower():
-                new_value = np.random.normal(loc=0, scale=0.2)
-            else:
-                new_value = np.random.normal(loc=0, scale=0.5)
-            all_v += new_value
-            if hasattr(key, "set_without_update"):
-                key.set_without_update(new_value)
-            else:
-                key.value = new_value
+            new_values[key.name] = random_face_key_value(key.name, rng)
 
+        self._human.keys.set_many(new_values)
         self._human.keys.update_human_from_key_change(context)
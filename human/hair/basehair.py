@@ -5,11 +5,8 @@
 Used for the four subclasses of human.hair: regular_hair, eyebrows, eyelashes, face_hair
 """
 
-import contextlib
-import json
 import os
-import random
-from typing import Any, Literal, Optional, cast
+from typing import Any, Literal, Optional
 
 import bpy
 import numpy as np
@@ -20,14 +17,21 @@ from HumGen3D.common.collections import add_to_collection
 from HumGen3D.common.context import context_override
 from HumGen3D.common.decorators import disable_mesh_changing_modifiers, injected_context
 from HumGen3D.common.exceptions import HumGenException
-from HumGen3D.common.math import round_vector_to_tuple
+from HumGen3D.common.hashing import ContentHasher
+from HumGen3D.common.rng import choice
 from HumGen3D.common.shadernode import NodeInput
-from HumGen3D.common.type_aliases import C
+from HumGen3D.common.type_aliases import RNG, C
+from HumGen3D.common.vertex_groups import (
+    read_vertex_group_weights,
+    write_vertex_group_weights,
+)
 from HumGen3D.human import hair
 from HumGen3D.human.common_baseclasses.pcoll_content import PreviewCollectionContent
 from HumGen3D.human.common_baseclasses.prop_collection import PropCollection
 from HumGen3D.human.common_baseclasses.savable_content import SavableContent
+from HumGen3D.human.content_changes import bump_generation, content_hash
 from HumGen3D.human.hair.haircards import HairCollection
+from HumGen3D.human.hair.import_cache import hair_import_cache
 from HumGen3D.human.hair.saving import save_hair
 from HumGen3D.human.height.height import apply_armature
 from HumGen3D.human.keys.keys import apply_shapekeys
@@ -36,6 +40,15 @@ from mathutils import Matrix
 
 HAIR_NODE_NAME = "HG_Hair"
 
+# Lightness, redness and pepper & salt of the colors picked by randomize_color
+HAIR_COLORS = {
+    "blonde": (4.0, 0.8, 0.0),
+    "black": (0.0, 1.0, 0.0),
+    "dark_brown": (0.5, 1.0, 0.0),
+    "brown": (1.0, 1.0, 0.0),
+    "red": (3.0, 1.0, 0.0),
+}
+
 
 class BaseHair:
     """Base class used for all four hair subclasses.
@@ -249,18 +262,15 @@ class BaseHair:
     def delete_all(self) -> None:  # noqa
         raise NotImplementedError  # FIXME
 
-    def randomize_color(self) -> None:
-        """Randomize the color of the hair of this type."""
-        # TODO make system more elaborate
-        hair_color_dict = {
-            "blonde": (4.0, 0.8, 0.0),
-            "black": (0.0, 1.0, 0.0),
-            "dark_brown": (0.5, 1.0, 0.0),
-            "brown": (1.0, 1.0, 0.0),
-            "red": (3.0, 1.0, 0.0),
-        }
+    def randomize_color(self, rng: RNG = None) -> None:
+        """Randomize the color of the hair of this type.
 
-        hair_color = hair_color_dict[random.choice(list(hair_color_dict))]
+        Args:
+            rng (RNG): Numpy generator to draw values from, for reproducible results.
+                Defaults to a new randomly seeded generator.
+        """
+        # TODO make system more elaborate
+        hair_color = HAIR_COLORS[choice(list(HAIR_COLORS), rng)]
 
         for mat in self._human.objects.body.data.materials[1:]:
             nodes = mat.node_tree.nodes
@@ -309,16 +319,14 @@ class BaseHair:
         ps["tip"] = ps.tip_radius
 
     def __hash__(self) -> int:
-        key_data = []
+        hasher = ContentHasher()
         for particle_system in self.particle_systems:
-            for particle in particle_system.particles:
-                key_data.extend(
-                    [round_vector_to_tuple(k.co_local) for k in particle.hair_keys]
-                )
-                key_data.append(round_vector_to_tuple(particle.location, precision=8))
-                key_data.append(round_vector_to_tuple(particle.rotation, precision=4))
+            hasher.update_hair_keys(particle_system, decimals=2)
+            particles = particle_system.particles
+            hasher.update_attribute(particles, "location", decimals=8)
+            hasher.update_attribute(particles, "rotation", width=4, decimals=4)
 
-        return hash(tuple(key_data))
+        return hasher.intdigest()
 
 
 class ImportableHair(BaseHair, PreviewCollectionContent, SavableContent):
@@ -338,9 +346,7 @@ class ImportableHair(BaseHair, PreviewCollectionContent, SavableContent):
 
         self._active = preset
 
-        full_path = str(pref.filepath) + preset
-        with open(full_path) as f:
-            hair_data = json.load(f)
+        hair_data = hair_import_cache.load_json(str(pref.filepath) + preset)
 
         blendfile = hair_data["blend_file"]
         json_systems = hair_data["hair_systems"]
@@ -391,9 +397,14 @@ class ImportableHair(BaseHair, PreviewCollectionContent, SavableContent):
                 context, json_systems, hair_obj, ps_name  # type:ignore
             )
 
-        for vg in hair_obj.vertex_groups:
-            if vg.name.lower().startswith(("hair", "fh")):
-                self._transfer_vertexgroup(hair_obj, vg.name)
+        self._transfer_vertexgroups(
+            hair_obj,
+            [
+                vg.name
+                for vg in hair_obj.vertex_groups
+                if vg.name.lower().startswith(("hair", "fh"))
+            ],
+        )
         new_hair_systems = self._get_hair_systems_dict(hair_obj)
         context.view_layer.objects.active = self._human.objects.body
         for mod in new_hair_systems:
@@ -418,7 +429,19 @@ class ImportableHair(BaseHair, PreviewCollectionContent, SavableContent):
         hg_delete(hair_obj)
         remove_broken_drivers()
         human.hair._add_quality_props()
-        human.props.hashes[f"${self._pcoll_name}"] = str(hash(self))
+        bump_generation(human.objects.rig, self._pcoll_name)
+        human.props.hashes[f"${self._pcoll_name}"] = content_hash(
+            human.objects.rig, self._pcoll_name, self
+        )
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Remove the hair objects and preset files cached by `set()`.
+
+        The cache holds at most `hair_import_cache.max_objects` hair objects and is
+        cleared automatically before saving the .blend file.
+        """
+        hair_import_cache.clear()
 
     @injected_context
     def save_to_library(
@@ -463,16 +486,19 @@ class ImportableHair(BaseHair, PreviewCollectionContent, SavableContent):
         modifiers = self.modifiers
         for mod in modifiers:
             self._human.objects.body.modifiers.remove(mod)
+        bump_generation(self._human.objects.rig, self._pcoll_name)
 
     @injected_context
-    def randomize(self, context: C = None) -> None:
+    def randomize(self, context: C = None, rng: RNG = None) -> None:
         """Pick a random hairstyle from the library and apply it to the human.
 
         Args:
             context (C): Blender context. bpy.context if not provided.
+            rng (RNG): Numpy generator to draw values from, for reproducible results.
+                Defaults to a new randomly seeded generator.
         """
         preset_options = self.get_options(context)
-        chosen_preset = random.choice(preset_options)
+        chosen_preset = choice(preset_options, rng)
         self.set(chosen_preset, context)
 
     def _import_hair_obj(
@@ -489,18 +515,11 @@ class ImportableHair(BaseHair, PreviewCollectionContent, SavableContent):
         Returns:
             Object: body object that contains the hair systems
         """
-        # import hair object, linking it to the scene and collection
+        # copy the hair object from the import cache, linking it to the scene
         subfolder = "head" if hair_type == "head" else "face_hair"
         blendpath = os.path.join(pref.filepath, "hair", subfolder, blendfile)
 
-        with bpy.data.libraries.load(blendpath, link=False) as (_, data_to):
-            data_to.objects = ["HG_Body"]
-
-        hair_obj = data_to.objects[0]
-        scene = context.scene
-        scene.collection.objects.link(hair_obj)
-
-        return cast(bpy.types.Object, hair_obj)
+        return hair_import_cache.new_hair_obj(context, blendpath)
 
     def _morph_hair_obj_to_body_obj(
         self, context: bpy.types.Context, hair_obj: bpy.types.Object
@@ -576,26 +595,22 @@ class ImportableHair(BaseHair, PreviewCollectionContent, SavableContent):
             psys.display_step = json_sett["path_steps"]
             psys.render_step = json_sett["path_steps"]
 
-    def _transfer_vertexgroup(self, from_obj: bpy.types.Object, vg_name: str) -> None:
-        """Copies vertex groups from one object to the other.
+    def _transfer_vertexgroups(
+        self, from_obj: bpy.types.Object, vg_names: list[str]
+    ) -> None:
+        """Copies vertex groups from one object to the body.
+
+        Both objects need to have the same vertex count and order.
 
         Args:
-            from_obj (Object): object to transfer vertex group from
-            vg_name  (str)   : name of vertex group to transfer
+            from_obj (Object): object to transfer vertex groups from
+            vg_names (list[str]): names of the vertex groups to transfer
         """
-        vert_dict = {}
-        for vert_idx, _ in enumerate(from_obj.data.vertices):
-            with contextlib.suppress(Exception):
-                vg = from_obj.vertex_groups[
-                    vg_name
-                ]  # type:ignore[index, call-overload]
-                vert_dict[vert_idx] = vg.weight(vert_idx)
-
-        target_vg = self._human.objects.body.vertex_groups.new(name=vg_name)
-        # fmt: off
-        for v in vert_dict:
-            target_vg.add([v, ], vert_dict[v], "ADD")
-        # fmt: on
+        weights = read_vertex_group_weights(from_obj, vg_names)
+        body_vgs = self._human.objects.body.vertex_groups
+        for vg_name, vg_weights in zip(vg_names, weights.T):
+            target_vg = body_vgs.new(name=vg_name)
+            write_vertex_group_weights(target_vg, vg_weights)
 
     def _get_hair_systems_dict(
         self, hair_obj: bpy.types.Object
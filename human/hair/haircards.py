@@ -1,6 +1,5 @@
 """Implements class for generating haircards from a particle system."""
 
-import contextlib
 import json
 import os
 import random
@@ -22,6 +21,7 @@ from HumGen3D.common.geometry import (
 from HumGen3D.common.math import create_kdtree, normalize
 from HumGen3D.common.memory_management import hg_delete
 from HumGen3D.common.type_aliases import C
+from HumGen3D.common.vertex_groups import read_vertex_group_weights
 from HumGen3D.extern.rdp import rdp
 
 if TYPE_CHECKING:
@@ -46,21 +46,17 @@ class HairCollection:
         """
         self.mx_world_hair_obj = hair_obj.matrix_world
 
-        body_world_coords_eval = world_coords_from_obj(
-            human.objects.body, data=human.keys.all_deformation_shapekeys, local=False
-        )
-        body_local_coords_eval = world_coords_from_obj(
-            human.objects.body, data=human.keys.all_deformation_shapekeys, local=True
-        )
+        body_world_coords_eval = human.keys.evaluated_coords(local=False)
+        body_local_coords_eval = human.keys.evaluated_coords(local=True)
         self.kd = create_kdtree(body_world_coords_eval)
         self.kd_local = create_kdtree(body_local_coords_eval)
 
         self.hair_coords = world_coords_from_obj(hair_obj)
-        nearest_vert_idx = np.array([self.kd.find(co)[1] for co in self.hair_coords])
+        nearest_vert_idx, _ = self.kd.query(self.hair_coords)
         verts = human.objects.body.data.vertices
-        self.nearest_normals = np.array(
-            [tuple(verts[idx].normal.normalized()) for idx in nearest_vert_idx]
-        )
+        normals = np.empty(len(verts) * 3, dtype=np.float64)
+        verts.foreach_get("normal", normals)
+        self.nearest_normals = normalize(normals.reshape((-1, 3))[nearest_vert_idx])
 
         bm = bmesh.new()  # type:ignore[call-arg]
         bm.from_mesh(hair_obj.data)
@@ -197,17 +193,20 @@ class HairCollection:
     def _compute_new_face_vert_idxs(
         hair_co_len: int, hair_coords: np.ndarray
     ) -> tuple[np.ndarray, np.ndarray]:
-        faces = np.empty((len(hair_coords), hair_co_len - 1, 4), dtype=np.int64)
-
-        for i in range(hair_coords.shape[0]):
-            for j in range(hair_co_len - 1):
-                corr = i * hair_co_len * 2
-                faces[i, j, :] = (
-                    corr + hair_co_len * 2 - j - 1,
-                    corr + hair_co_len * 2 - j - 2,
-                    corr + j + 1,
-                    corr + j,
-                )
+        # Each hair has hair_co_len verts on both sides of the card, every segment
+        # connects two verts on one side to the opposite two on the other side
+        segment = np.arange(hair_co_len - 1, dtype=np.int64)
+        segment_faces = np.stack(
+            (
+                hair_co_len * 2 - segment - 1,
+                hair_co_len * 2 - segment - 2,
+                segment + 1,
+                segment,
+            ),
+            axis=-1,
+        )
+        hair_offsets = np.arange(len(hair_coords), dtype=np.int64) * hair_co_len * 2
+        faces = hair_offsets[:, None, None] + segment_faces[None]
         faces_parallel = faces.copy()
         return faces, faces_parallel
 
@@ -296,50 +295,44 @@ class HairCollection:
             if not obj.data.polygons:
                 continue
 
-            vert_loop_dict = self._create_vert_loop_dict(obj, uv_layer)
-
-            self._set_vert_group_uvs(hairzone_uv_dict, vert_len, obj, vert_loop_dict)
+            vert_uvs = self._compute_vert_uvs(hairzone_uv_dict, vert_len, obj)
 
-    @staticmethod
-    def _create_vert_loop_dict(
-        obj: bpy.types.Object, uv_layer: bpy.types.MeshUVLoopLayer
-    ) -> dict[int, list[bpy.types.MeshUVLoop]]:
-        vert_loop_dict: dict[int, list[bpy.types.MeshUVLoop]] = {}
-
-        for poly in obj.data.polygons:
-            for vert_idx, loop_idx in zip(poly.vertices, poly.loop_indices):
-                loop = uv_layer.data[loop_idx]  # type:ignore
-                if vert_idx not in vert_loop_dict:
-                    vert_loop_dict[vert_idx] = [
-                        loop,
-                    ]
-                else:
-                    vert_loop_dict[vert_idx].append(loop)
-        return vert_loop_dict
+            loops = obj.data.loops
+            loop_vert_idxs = np.empty(len(loops), dtype=np.int64)
+            loops.foreach_get("vertex_index", loop_vert_idxs)
+            uv_layer.data.foreach_set(
+                "uv", vert_uvs[loop_vert_idxs].astype(np.float32).ravel()
+            )
 
     @staticmethod
-    def _set_vert_group_uvs(
+    def _compute_vert_uvs(
         hairzone_uv_dict: dict[str, dict[str, dict[str, UVCoords]]],  # noqa
         vert_len: int,
         obj: bpy.types.Object,
-        vert_loop_dict: dict[int, list[bpy.types.MeshUVLoop]],
-    ) -> None:
-        verts = obj.data.vertices
-        for i in range(0, len(verts), vert_len * 2):
-            vert_count = vert_len * 2
-            hair_verts = verts[i : i + vert_count]  # noqa
+    ) -> np.ndarray:
+        """Map every haircard to a random zone of the haircard texture.
+
+        Args:
+            hairzone_uv_dict (dict[str, dict[str, dict[str, UVCoords]]]): Texture
+                zones, divided in long and short and in wide and narrow hairs.
+            vert_len (int): Amount of verts on each side of the haircards
+            obj (bpy.types.Object): Haircard object made by `create_mesh`
 
-            vert_pairs = []
-            for vert in hair_verts[:vert_len]:
-                vert_pairs.append((vert.index, vert_count - vert.index - 1))
+        Returns:
+            np.ndarray: UV coordinate of each vertex, shape (n, 2)
+        """
+        verts = obj.data.vertices
+        vert_count = vert_len * 2
+        coords = np.empty(len(verts) * 3, dtype=np.float64)
+        verts.foreach_get("co", coords)
+        hair_coords = coords.reshape((-1, vert_count, 3))
 
-            vert_pairs = zip(  # type:ignore
-                [v.index for v in hair_verts[:vert_len]],
-                list(reversed([v.index for v in hair_verts[vert_len:]])),
-            )
+        lengths = np.linalg.norm(hair_coords[:, 0] - hair_coords[:, vert_len], axis=1)
+        widths = np.linalg.norm(hair_coords[:, 0] - hair_coords[:, -1], axis=1)
 
-            length = (hair_verts[0].co - hair_verts[vert_len].co).length
-            width = (hair_verts[0].co - hair_verts[-1].co).length
+        # Zone as (x_min, y_min, x_max, y_max) for each hair
+        zones = np.empty((len(hair_coords), 4), dtype=np.float64)
+        for i, (length, width) in enumerate(zip(lengths, widths)):
             if length > 0.05:
                 subdict = random.choice(list(hairzone_uv_dict["long"].values()))
                 if width > 0.02:
@@ -354,24 +347,21 @@ class HairCollection:
                     chosen_zone = random.choice(subdict["narrow"])
 
             bottom_left, top_right = chosen_zone
+            zones[i] = (*bottom_left, *top_right)
 
-            for i, (vert_left, vert_right) in enumerate(vert_pairs):
-                left_loops = vert_loop_dict[vert_left]
-                right_loops = vert_loop_dict[vert_right]
-
-                x_min = bottom_left[0]
-                x_max = top_right[0]
-
-                y_min = bottom_left[1]
-                y_max = top_right[1]
-                y_diff = y_max - y_min
-
-                y_relative = i / (vert_len - 1)
-                for loop in left_loops:
-                    loop.uv = (x_max, y_min + y_diff * y_relative)
+        # The first half of the verts of a hair runs up one side of the card, the
+        # second half runs back down the other side
+        vert_position = np.arange(vert_count)
+        segment = np.where(
+            vert_position < vert_len, vert_position, vert_count - 1 - vert_position
+        )
+        y_relative = segment / max(vert_len - 1, 1)
+        is_left = vert_position < vert_len
 
-                for loop in right_loops:
-                    loop.uv = (x_min, y_min + y_diff * y_relative)
+        x_min, y_min, x_max, y_max = (zones[:, i, None] for i in range(4))
+        u = np.where(is_left[None], x_max, x_min)
+        v = y_min + (y_max - y_min) * y_relative[None]
+        return np.stack((u, v), axis=-1).reshape((-1, 2))
 
     def add_material(self) -> None:
         """Add a material to all hair objects."""
@@ -420,14 +410,12 @@ class HairCollection:
         body_obj = human.objects.body
         vert_count = len(body_obj.data.vertices)
 
-        vg_aggregate = np.zeros(vert_count, dtype=np.float32)
-
-        for vg, vg_weight in density_vertex_groups:
-            vg_values = np.zeros(vert_count, dtype=np.float32)
-            for i in range(vert_count):
-                with contextlib.suppress(RuntimeError):
-                    vg_values[i] = vg.weight(i) * vg_weight
-            vg_aggregate += vg_values
+        if density_vertex_groups:
+            vgs, vg_factors = zip(*density_vertex_groups)
+            vg_weights = read_vertex_group_weights(body_obj, vgs)
+            vg_aggregate = vg_weights @ np.array(vg_factors, dtype=np.float32)
+        else:
+            vg_aggregate = np.zeros(vert_count, dtype=np.float32)
 
         vg_aggregate = np.round(vg_aggregate, 4)
         vg_aggregate = np.clip(vg_aggregate, 0, 1)
@@ -447,14 +435,8 @@ class HairCollection:
         haircap_obj.location = human.location
         context.scene.collection.objects.link(haircap_obj)
 
-        body_obj_eval_coords = world_coords_from_obj(
-            human.objects.body, data=human.keys.all_deformation_shapekeys, local=True
-        )
-        body_coords = np.empty(
-            len(human.objects.body.data.vertices) * 3, dtype=np.float64
-        )
-        human.objects.body.data.vertices.foreach_get("co", body_coords)
-        body_coords = body_coords.reshape((-1, 3))
+        body_obj_eval_coords = human.keys.evaluated_coords(local=True)
+        body_coords = human.keys.evaluated_coords(key_names=())
         haircap_coords = np.empty(len(haircap_obj.data.vertices) * 3, dtype=np.float64)
         haircap_obj.data.vertices.foreach_get("co", haircap_coords)
         haircap_coords = haircap_coords.reshape((-1, 3))
@@ -467,10 +449,11 @@ class HairCollection:
         haircap_coords_world = world_coords_from_obj(haircap_obj)
         bm = None
         if haircap_type in ("Scalp", "Beard"):
-            for i, vert_world_co in enumerate(haircap_coords_world):
-                nearest_vert_index = self.kd.find(vert_world_co)[1]
-                value = vg_aggregate[nearest_vert_index]
-                vc.data[i].color = (value, value, value, 1)
+            nearest_vert_idxs, _ = self.kd.query(haircap_coords_world)
+            values = vg_aggregate[nearest_vert_idxs]
+            colors = np.ones((len(values), 4), dtype=np.float32)
+            colors[:, :3] = values[:, None]
+            vc.data.foreach_set("color", colors.ravel())
 
             bm = bmesh.new()  # type:ignore[call-arg]
             bm.from_mesh(haircap_obj.data)
@@ -0,0 +1,148 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+"""Keeps imported hair source objects and hair preset JSON files for this session.
+
+Setting a hairstyle appends the "HG_Body" object holding the hair systems from the
+.blend file of the style. The first time a .blend file is used, the appended object is
+unlinked from the scene and kept as a hidden source object. Later uses of the same
+file get a copy of the source object, so only the body dependent steps (morphing to
+the body and transferring the hair systems) are done again.
+
+Source objects are identified by object name, so they are imported again after undo
+or loading another file. They are removed before saving, so they never end up in the
+.blend files of the user. The least recently used source objects are removed when
+more than `max_objects` are cached.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Optional
+
+import bpy
+from bpy.app.handlers import persistent
+from bpy.types import Context, Object
+
+SOURCE_PREFIX = "HG_HAIR_SOURCE_"
+
+
+class HairImportCache:
+    """Hidden hair source objects per .blend file and parsed hair preset JSON."""
+
+    def __init__(self, max_objects: int = 8) -> None:
+        self.max_objects = max_objects
+        self._object_names: OrderedDict[str, str] = OrderedDict()
+        self._json: dict[str, tuple[float, dict[str, Any]]] = {}
+
+    def load_json(self, filepath: str) -> dict[str, Any]:
+        """Get the contents of a hair preset JSON file, parsed only once per change.
+
+        Args:
+            filepath (str): Absolute path of the JSON file
+
+        Returns:
+            dict[str, Any]: Contents of the JSON file. This dict is shared between
+                calls, so it should not be changed.
+        """
+        mtime = os.path.getmtime(filepath)
+        cached = self._json.get(filepath)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        with open(filepath) as f:
+            hair_data = json.load(f)
+        self._json[filepath] = (mtime, hair_data)
+        return hair_data
+
+    def new_hair_obj(self, context: Context, blendpath: str) -> Object:
+        """Get a copy of the hair source object of this .blend file.
+
+        Args:
+            context (Context): Blender context
+            blendpath (str): Absolute path of the .blend file containing the
+                "HG_Body" object with the hair systems.
+
+        Returns:
+            Object: Copy of the source object, linked to the scene
+        """
+        source = self._get_source(blendpath)
+        if source is None:
+            source = self._import_source(blendpath)
+
+        hair_obj = source.copy()
+        hair_obj.data = source.data.copy()
+        hair_obj.use_fake_user = False
+        hair_obj.name = source.name[len(SOURCE_PREFIX) :]
+        # The settings are changed when transferring the hair to the body
+        for psys in hair_obj.particle_systems:
+            psys.settings = psys.settings.copy()
+
+        context.scene.collection.objects.link(hair_obj)
+        return hair_obj
+
+    def clear(self) -> None:
+        """Remove all source objects from Blender and forget the parsed JSON files."""
+        for name in self._object_names.values():
+            obj = bpy.data.objects.get(name)
+            if obj:
+                _remove_source(obj)
+        self._object_names.clear()
+        self._json.clear()
+
+    def _get_source(self, blendpath: str) -> Optional[Object]:
+        name = self._object_names.get(blendpath)
+        if name is None:
+            return None
+
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            self._object_names.pop(blendpath)
+            return None
+
+        self._object_names.move_to_end(blendpath)
+        return obj
+
+    def _import_source(self, blendpath: str) -> Object:
+        with bpy.data.libraries.load(blendpath, link=False) as (_, data_to):
+            data_to.objects = ["HG_Body"]
+
+        source = data_to.objects[0]
+        source.use_fake_user = True
+        source.name = SOURCE_PREFIX + os.path.splitext(os.path.basename(blendpath))[0]
+
+        self._object_names[blendpath] = source.name
+        while len(self._object_names) > max(self.max_objects, 1):
+            _, oldest_name = self._object_names.popitem(last=False)
+            oldest = bpy.data.objects.get(oldest_name)
+            if oldest:
+                _remove_source(oldest)
+
+        return source
+
+    def __contains__(self, blendpath: str) -> bool:
+        return self._get_source(blendpath) is not None
+
+    def __len__(self) -> int:
+        return len(self._object_names)
+
+
+def _remove_source(obj: Object) -> None:
+    mesh = obj.data
+    settings = [psys.settings for psys in obj.particle_systems]
+    bpy.data.objects.remove(obj)
+    if mesh and not mesh.users:
+        bpy.data.meshes.remove(mesh)
+    for psys_settings in settings:
+        if not psys_settings.users:
+            bpy.data.particles.remove(psys_settings)
+
+
+@persistent
+def clear_hair_cache_on_save(dummy: Any) -> None:
+    """Handler that removes the hair source objects before the file is saved."""
+    hair_import_cache.clear()
+
+
+hair_import_cache = HairImportCache()  # global cache used by ImportableHair.set
@@ -2,14 +2,13 @@
 
 """Implements class for changing the height of the human."""
 
-import random
 from typing import TYPE_CHECKING, cast
 
 import bpy
 from HumGen3D.common.context import context_override
 from HumGen3D.common.decorators import injected_context
-from HumGen3D.common.geometry import world_coords_from_obj
-from HumGen3D.common.type_aliases import C
+from HumGen3D.common.rng import get_rng
+from HumGen3D.common.type_aliases import RNG, C
 from HumGen3D.human.keys.key_slider_update import HG3D_OT_SLIDER_SUBSCRIBE
 from mathutils import Vector
 
@@ -33,6 +32,138 @@ def apply_armature(obj: bpy.types.Object) -> None:
         bpy.ops.object.modifier_apply(modifier=mod_name)
 
 
+class BoneVertexMap:
+    """Vertices each bone is fitted to, read once from the bone custom properties.
+
+    Bones with "head_verts" and "tail_verts" properties are placed on the centroid
+    of these body vertices, offset by "head_relative_co" and "tail_relative_co". The
+    vertex indices are stored as flat arrays with the start offset of each bone, so the
+    centroids of all bones are computed with one np.add.reduceat.
+    """
+
+    def __init__(self, rig: bpy.types.Object) -> None:
+        bones = [
+            bone
+            for bone in rig.data.bones
+            if "head_verts" in bone
+            and len(bone["head_verts"])
+            and len(bone["tail_verts"])
+        ]
+        self.bone_names = [bone.name for bone in bones]
+        self.bone_idxs = np.array(
+            [rig.data.bones.find(name) for name in self.bone_names], dtype=np.int64
+        )
+        self._head = self._flatten([list(bone["head_verts"]) for bone in bones])
+        self._tail = self._flatten([list(bone["tail_verts"]) for bone in bones])
+        self._head_offset = np.array(
+            [list(bone["head_relative_co"]) for bone in bones], dtype=np.float64
+        ).reshape((-1, 3))
+        self._tail_offset = np.array(
+            [list(bone["tail_relative_co"]) for bone in bones], dtype=np.float64
+        ).reshape((-1, 3))
+
+    @staticmethod
+    def _flatten(vert_lists: list[list[int]]) -> tuple[np.ndarray, np.ndarray]:
+        counts = np.array([len(verts) for verts in vert_lists], dtype=np.int64)
+        flat_idxs = np.fromiter(
+            (idx for verts in vert_lists for idx in verts),
+            dtype=np.int64,
+            count=int(counts.sum()),
+        )
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+        return flat_idxs, starts
+
+    @staticmethod
+    def _centroids(
+        coords: np.ndarray, flat_idxs: np.ndarray, starts: np.ndarray
+    ) -> np.ndarray:
+        if not len(starts):
+            return np.empty((0, 3), dtype=np.float64)
+        sums = np.add.reduceat(coords[flat_idxs], starts, axis=0)
+        counts = np.diff(np.append(starts, len(flat_idxs)))
+        return cast(np.ndarray, sums / counts[:, None])
+
+    def fitted_coords(self, body_coords: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Head and tail positions of the mapped bones for these body coordinates.
+
+        Args:
+            body_coords (np.ndarray): Body vertex coordinates, shape (n, 3)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Heads and tails in armature space, both
+                shape (bone count, 3) in the order of `bone_names`
+        """
+        heads = self._centroids(body_coords, *self._head) + self._head_offset
+        tails = self._centroids(body_coords, *self._tail) + self._tail_offset
+        return heads, tails
+
+    def current_coords(self, rig: bpy.types.Object) -> tuple[np.ndarray, np.ndarray]:
+        """Current rest heads and tails of the mapped bones, readable in object mode.
+
+        Args:
+            rig (bpy.types.Object): Rig to read the bones of
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Heads and tails, see `fitted_coords`
+        """
+        bones = rig.data.bones
+        heads = np.empty(len(bones) * 3, dtype=np.float64)
+        tails = np.empty(len(bones) * 3, dtype=np.float64)
+        bones.foreach_get("head_local", heads)
+        bones.foreach_get("tail_local", tails)
+        return (
+            heads.reshape((-1, 3))[self.bone_idxs],
+            tails.reshape((-1, 3))[self.bone_idxs],
+        )
+
+    def set_edit_bone_coords(
+        self, rig: bpy.types.Object, heads: np.ndarray, tails: np.ndarray
+    ) -> None:
+        """Write heads and tails to the edit bones. The rig needs to be in edit mode.
+
+        Args:
+            rig (bpy.types.Object): Rig in edit mode
+            heads (np.ndarray): Heads as returned by `fitted_coords`
+            tails (np.ndarray): Tails as returned by `fitted_coords`
+        """
+        edit_bones = rig.data.edit_bones
+        edit_idxs = [edit_bones.find(name) for name in self.bone_names]
+
+        all_heads = np.empty(len(edit_bones) * 3, dtype=np.float32)
+        all_tails = np.empty(len(edit_bones) * 3, dtype=np.float32)
+        edit_bones.foreach_get("head", all_heads)
+        edit_bones.foreach_get("tail", all_tails)
+
+        all_heads = all_heads.reshape((-1, 3))
+        all_tails = all_tails.reshape((-1, 3))
+        all_heads[edit_idxs] = heads
+        all_tails[edit_idxs] = tails
+
+        edit_bones.foreach_set("head", all_heads.ravel())
+        edit_bones.foreach_set("tail", all_tails.ravel())
+
+
+# (armature data pointer, armature name, bone count) -> map, filled on first use
+_bone_vertex_maps: dict[tuple[int, str, int], BoneVertexMap] = {}
+
+
+def get_bone_vertex_map(rig: bpy.types.Object) -> BoneVertexMap:
+    """Get the bone to vertex mapping of this rig, building it on first use.
+
+    Args:
+        rig (bpy.types.Object): Rig of the human
+
+    Returns:
+        BoneVertexMap: Mapping of the bones of this rig
+    """
+    key = (rig.data.as_pointer(), rig.data.name, len(rig.data.bones))
+    if key not in _bone_vertex_maps:
+        if len(_bone_vertex_maps) > 64:
+            _bone_vertex_maps.clear()
+        _bone_vertex_maps[key] = BoneVertexMap(rig)
+    return _bone_vertex_maps[key]
+
+
 class HeightSettings:
     """Class for changing height of human."""
 
@@ -135,24 +266,23 @@ class HeightSettings:
             context (C): Blender context. bpy.context if not provided.
         """
         # FIXME symmetry
-        body = self._human.objects.body
         rig = self._human.objects.rig
 
-        vert_count = len(body.data.vertices)
-        body_key_coords = np.empty(vert_count * 3, dtype=np.float64)
-        self._human.objects.body.data.vertices.foreach_get("co", body_key_coords)
-
-        permanent_key_coords = np.empty(vert_count * 3, dtype=np.float64)
-        self._human.keys.permanent_key.data.foreach_get("co", permanent_key_coords)
+        keys = self._human.keys
+        eval_coords = keys.evaluated_coords(
+            key_names=[keys.permanent_key.name, keys.temp_key.name]
+        )
 
-        temp_key_coords = np.empty(vert_count * 3, dtype=np.float64)
-        self._human.keys.temp_key.data.foreach_get("co", temp_key_coords)
-        temp_value = self._human.keys.temp_key.value
+        bone_map = get_bone_vertex_map(rig)
+        heads, tails = bone_map.fitted_coords(eval_coords)
 
-        eval_coords = (
-            temp_key_coords - body_key_coords
-        ) * temp_value + permanent_key_coords
-        eval_coords = eval_coords.reshape((-1, 3))
+        # Bone rest positions can only be changed in edit mode, so skip the mode
+        # switch when the bones are already in place
+        current_heads, current_tails = bone_map.current_coords(rig)
+        if np.allclose(heads, current_heads, atol=1e-6) and np.allclose(
+            tails, current_tails, atol=1e-6
+        ):
+            return
 
         # Context override for mode_set does not work, see #T88051
         old_active = context.view_layer.objects.active
@@ -166,21 +296,8 @@ class HeightSettings:
 
         with context_override(context, rig, [rig]):
             bpy.ops.object.mode_set(mode="EDIT")
-        for ebone in rig.data.edit_bones:
-            if "head_verts" not in ebone:
-                continue
-
-            target_verts_head = ebone["head_verts"]
-            centroid_co = centroid(eval_coords[target_verts_head])
-            vert_vec_head = Vector(ebone["head_relative_co"])
-
-            ebone.head = centroid_co + vert_vec_head
 
-            target_verts_tail = ebone["tail_verts"]
-            centroid_co = centroid(eval_coords[target_verts_tail])
-            vert_vec_tail = Vector(ebone["tail_relative_co"])
-
-            ebone.tail = centroid_co + vert_vec_tail
+        bone_map.set_edit_bone_coords(rig, heads, tails)
 
         with context_override(context, rig, [rig]):
             bpy.ops.object.mode_set(mode="OBJECT")
@@ -191,22 +308,22 @@ class HeightSettings:
             obj.select_set(True)
 
     @injected_context
-    def randomize(self, context: C = None) -> None:
+    def randomize(self, context: C = None, rng: RNG = None) -> None:
         """Randomize human height.
 
         Args:
             context (C): Blender context. bpy.context if not provided.
+            rng (RNG): Numpy generator to draw values from, for reproducible results.
+                Defaults to a new randomly seeded generator.
         """
-        chosen_height_cm = random.uniform(150, 200)
+        chosen_height_cm = float(get_rng(rng).uniform(150, 200))
         self.set(chosen_height_cm, context)
 
     def _correct_eyes(self) -> None:
         """Corrects eyes to fit the new height."""
         eye_obj = self._human.objects.eyes
 
-        body_world_coords = world_coords_from_obj(
-            self._human.objects.body, data=self._human.keys.all_deformation_shapekeys
-        )
+        body_world_coords = self._human.keys.evaluated_coords(local=False)
         eye_width = np.linalg.norm(body_world_coords[1109] - body_world_coords[7010])
         eye_size_value = 94 * eye_width - 2.0
         sks = self._human.objects.eyes.data.shape_keys.key_blocks
@@ -23,6 +23,7 @@ from HumGen3D.common import find_hg_rig, is_legacy
 from HumGen3D.common.context import context_override
 from HumGen3D.common.type_aliases import BpyEnum, C, GenderStr
 from HumGen3D.human.age import AgeSettings
+from HumGen3D.human.content_changes import content_hash
 from HumGen3D.human.materials import MaterialSettings
 from HumGen3D.user_interface.documentation.feedback_func import ShowMessageBox
 from mathutils import Vector
@@ -46,9 +47,14 @@ from .objects import ObjectCollection
 from .pose.pose import PoseSettings, remove_broken_constraints  # type:ignore
 from .process.process import ProcessSettings
 from .skin.skin import SkinSettings
+from .template_cache import template_cache
 
 import HumGen3D
 
+# Sections of Human.as_dict() that can be passed in a spec, see Human.from_spec
+SPEC_SECTIONS = ("age", "keys", "skin", "eyes", "height", "hair", "clothing")
+
+
 class Human:
     """Python representation of a Human Generator human.
 
@@ -199,6 +205,82 @@ class Human:
 
         gender = preset.split(os.sep)[1]
 
+        human = cls._from_preset_data(
+            preset_data, gender, context, from_batch_generator=from_batch_generator
+        )
+        human._active = preset
+
+        return human
+
+    @classmethod
+    @verify_addon
+    @injected_context
+    def from_spec(
+        cls,
+        spec: dict[str, Any],
+        context: C = None,
+        prettify_eevee: bool = True,
+    ) -> Human:
+        """Creates human in Blender from a spec dictionary and returns Human instance.
+
+        A spec contains the gender, optionally a "preset" to start from and any of
+        the sections of `Human.as_dict()`, which override the values of the preset.
+        Pose and expression can be set with the "pose" and "expression" keys. Other
+        keys, like the "seed" of specs made by the batch generator, are ignored.
+
+        Args:
+            spec (dict[str, Any]): The spec, for example from
+                `BatchHumanGenerator.iter_specs()` or `HumGen3D.batch.read_jsonl()`
+            context (C): The Blender context. Defaults to bpy.context if None
+            prettify_eevee (bool): If True, the AO and Strip settings will be set to
+                settings that look nicer. Defaults to True
+
+        Returns:
+            Human: A Human instance
+
+        Raises:
+            HumGenException: If the spec doesn't contain a valid gender.
+        """
+        gender = spec.get("gender")
+        if gender not in ("male", "female"):
+            raise HumGenException(f"Spec contains invalid gender '{gender}'")
+
+        if prettify_eevee:
+            set_eevee_ao_and_strip(context)
+
+        preset = spec.get("preset")
+        preset_data: dict[str, Any] = {}
+        if preset:
+            preset_path = os.path.join(get_prefs().filepath, preset)
+            with open(preset_path) as json_file:
+                preset_data = json.load(json_file)
+
+        for attr in SPEC_SECTIONS:
+            if attr in spec:
+                preset_data[attr] = _merge_spec_section(
+                    preset_data.get(attr), spec[attr]
+                )
+
+        human = cls._from_preset_data(preset_data, gender, context)
+        if "height" in preset_data:
+            human.height.set_from_dict(preset_data["height"], context)
+        if spec.get("pose"):
+            human.pose.set(spec["pose"], context)
+        if spec.get("expression"):
+            human.expression.set(spec["expression"])
+        if preset:
+            human._active = preset
+
+        return human
+
+    @classmethod
+    def _from_preset_data(
+        cls,
+        preset_data: dict[str, Any],
+        gender: GenderStr,
+        context: Context,
+        from_batch_generator: bool = False,
+    ) -> Human:
         human = cls._import_human(context, gender)
 
         def scrub(obj: dict[Any, Any], bad_key: str) -> None:
@@ -238,12 +320,12 @@ class Human:
         from HumGen3D import bl_info
 
         human.props.version = HumGen3D.__version__
-        human.props.hashes["$pose"] = str(hash(human.pose))
-        human.props.hashes["$outfit"] = str(hash(human.clothing.outfit))
-        human.props.hashes["$footwear"] = str(hash(human.clothing.footwear))
-        human.props.hashes["$hair"] = str(hash(human.hair.regular_hair))
-
-        human._active = preset
+        rig = human.objects.rig
+        hashes = human.props.hashes
+        hashes["$pose"] = content_hash(rig, "pose", human.pose)
+        hashes["$outfit"] = content_hash(rig, "outfit", human.clothing.outfit)
+        hashes["$footwear"] = content_hash(rig, "footwear", human.clothing.footwear)
+        hashes["$hair"] = content_hash(rig, "hair", human.hair.regular_hair)
 
         if get_prefs().sss_by_default:
             human.skin.set_subsurface_scattering(True, context=context)
@@ -553,6 +635,24 @@ class Human:
     # TODO this method is too broad
     @classmethod
     def _import_human(cls, context: Context, gender: str) -> Human:
+        """Get a new base human, copied from the cached template of this gender.
+
+        The template is imported from HG_HUMAN.blend by `_import_human_from_file`
+        the first time a human of this gender is made, see `template_cache`.
+
+        Args:
+            context: The context of the current scene.
+            gender: "male" or "female"
+
+        Returns:
+            A Human object
+        """
+        return template_cache.new_human(
+            context, gender, cls._import_human_from_file  # type:ignore[arg-type]
+        )
+
+    @classmethod
+    def _import_human_from_file(cls, context: Context, gender: str) -> Human:
         """Import human from HG_HUMAN.blend.
 
         It imports the human model from the HG_Human.blend file, sets it up correctly,
@@ -698,7 +798,7 @@ class Human:
         """
         return_dict = {}
 
-        for attr in ("age", "keys", "skin", "eyes", "height", "hair", "clothing"):
+        for attr in SPEC_SECTIONS:
             return_dict[attr] = getattr(self, attr).as_dict()
 
         return return_dict
@@ -965,3 +1065,22 @@ class Human:
             str: string representation of this object
         """
         return f"Human '{self.name}' [{self.gender.capitalize()}] instance."
+
+
+def _merge_spec_section(base: Any, override: Any) -> Any:
+    """Recursively update the dicts of a preset section with those of a spec.
+
+    Args:
+        base (Any): Section of the preset, None if the preset doesn't have it
+        override (Any): Section of the spec, takes precedence
+
+    Returns:
+        Any: Merged section
+    """
+    if not isinstance(base, dict) or not isinstance(override, dict):
+        return override
+
+    merged = dict(base)
+    for key, value in override.items():
+        merged[key] = _merge_spec_section(base.get(key), value)
+    return merged
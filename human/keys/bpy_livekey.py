@@ -12,7 +12,12 @@ from bpy.props import FloatProperty, StringProperty  # type:ignore
 from HumGen3D.common.exceptions import HumGenException
 from HumGen3D.human.human import Human
 from HumGen3D.human.keys.key_slider_update import HG3D_OT_SLIDER_SUBSCRIBE
-from HumGen3D.human.keys.keys import _get_starting_coordinates
+from HumGen3D.human.keys.keys import (
+    LiveKeyItem,
+    bump_key_generation,
+    _get_starting_coordinates,
+    _load_sparse_key,
+)
 
 
 def get_livekey(self: BpyLiveKey) -> float:
@@ -92,30 +97,31 @@ def set_livekey(self: BpyLiveKey, value: float) -> None:
         return
 
     (
-        vert_count,
         obj_coords,
+        new_key_indices,
         new_key_relative_coords,
         new_key_coords,
     ) = _get_starting_coordinates(human, self.path)
 
-    permanent_key_coords = np.empty(vert_count * 3, dtype=np.float64)
+    permanent_key_coords = np.empty_like(obj_coords)
     human.keys.permanent_key.data.foreach_get("co", permanent_key_coords)
     permanent_key_coords = _add_temp_key_to_permanent_key_coords(
-        human, temp_key, vert_count, obj_coords, permanent_key_coords
+        human, temp_key, obj_coords, permanent_key_coords
     )
 
     # Correct for previous value if this shape key has been added before
     current_sk_values = human.props.sk_values
     if temp_key and name in current_sk_values:
         old_value = current_sk_values[name]
-        permanent_key_coords -= new_key_relative_coords * old_value
+        permanent_key_coords[new_key_indices] -= new_key_relative_coords * old_value
 
     # Write the coordinates to the permanent_key
     human.keys.permanent_key.data.foreach_set("co", permanent_key_coords)
 
     # Write the coordinates to the temp_key
-    human.keys.temp_key.data.foreach_set("co", new_key_coords)
-    human.keys.temp_key.name = "LIVE_KEY_TEMP_" + name
+    temp_key.data.foreach_set("co", new_key_coords)
+    temp_key.name = "LIVE_KEY_TEMP_" + name
+    bump_key_generation()
 
     temp_key.value = value
 
@@ -132,17 +138,24 @@ def _run_modal() -> None:
 def _add_temp_key_to_permanent_key_coords(
     human: "Human",
     temp_key: bpy.types.ShapeKey,
-    vert_count: int,
     obj_coords: np.ndarray,
     permanent_key_coords: np.ndarray,
 ) -> np.ndarray:
-    temp_key_coords = np.empty(vert_count * 3, dtype=np.float64)
-    human.keys.temp_key.data.foreach_get("co", temp_key_coords)
+    old_temp_key_name = temp_key.name.replace("LIVE_KEY_TEMP_", "")
+    old_livekey = human.keys.get(old_temp_key_name) if old_temp_key_name else None
 
-    relative_temp_coords = temp_key_coords - obj_coords
-    permanent_key_coords += relative_temp_coords * temp_key.value
+    # The temp key contains the body coordinates plus the livekey, so only the
+    # vector members changed by the livekey have to be added.
+    if isinstance(old_livekey, LiveKeyItem):
+        indices, relative_coordinates = _load_sparse_key(old_livekey.path)
+        permanent_key_coords[indices] += relative_coordinates * temp_key.value
+    elif temp_key.value:
+        temp_key_coords = np.empty_like(obj_coords)
+        temp_key.data.foreach_get("co", temp_key_coords)
+
+        relative_temp_coords = temp_key_coords - obj_coords
+        permanent_key_coords += relative_temp_coords * temp_key.value
 
-    old_temp_key_name = temp_key.name.replace("LIVE_KEY_TEMP_", "")
     human.props.sk_values[old_temp_key_name] = temp_key.value
     return permanent_key_coords
 
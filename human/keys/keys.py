@@ -7,15 +7,17 @@ Internal part (bpy side) is implemented in bpy_livekeys.py
 
 from __future__ import annotations
 
-import hashlib
 import os
 import re
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Iterable, List, Literal, Optional, Union, cast
 
 import bpy
 import numpy as np
+from bpy.app.handlers import persistent
 from bpy.types import Object, ShapeKey  # type:ignore
 from HumGen3D.common.decorators import injected_context
+from HumGen3D.common.hashing import ContentHasher
 from HumGen3D.common.type_aliases import C
 from HumGen3D.user_interface.panel_functions import prettify
 from ...backend.properties.randomize_locks import RandomizeLockProps, get_prop
@@ -24,96 +26,147 @@ if TYPE_CHECKING:
     from HumGen3D.human.human import Human
 
 from HumGen3D.backend import get_prefs, hg_log
+from HumGen3D.backend.content_catalog import get_catalog
 from HumGen3D.human.common_baseclasses.savable_content import SavableContent
+from HumGen3D.human.keys.livekey_cache import livekey_cache
+from HumGen3D.human.keys.livekey_pack import livekey_info_from_path, livekey_packs
+
 if TYPE_CHECKING:
     from .bpy_livekey import BpyLiveKey
 
 
 def _get_starting_coordinates(
     human: Human, path: str
-) -> tuple[int, np.ndarray, np.ndarray, np.ndarray]:
-    import time
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Get the body coordinates and the coordinates of the body with this livekey.
 
-    t0 = time.perf_counter()
+    Args:
+        human (Human): Human to get the body coordinates of
+        path (str): Path of the livekey, relative to the Human Generator folder
 
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Flat body coordinates,
+            changed vector member indices of the livekey, relative coordinates for
+            these indices and flat coordinates of the body with the livekey applied.
+    """
     body = human.objects.body
     vert_count = len(body.data.vertices)
-    obj_coords = np.empty(vert_count * 3, dtype=np.float64)
+    obj_coords = np.empty(vert_count * 3, dtype=_coordinate_dtype())
     body.data.vertices.foreach_get("co", obj_coords)
 
-    t1 = time.perf_counter()
-    print(f"[_get_starting_coordinates] foreach_get coords: {t1 - t0:.4f}s")
-
     # Load coordinates of livekey that is being changed
-    filepath = os.path.join(get_prefs().filepath, path)
-    new_key_relative_coords = import_npz_key(vert_count, filepath)
-
-    t2 = time.perf_counter()
-    print(f"[_get_starting_coordinates] import_npz_key: {t2 - t1:.4f}s")
+    indices, relative_coordinates = _load_sparse_key(path)
 
-    new_key_coords = obj_coords + new_key_relative_coords
+    new_key_coords = obj_coords.copy()
+    new_key_coords[indices] += relative_coordinates
 
-    t3 = time.perf_counter()
-    print(f"[_get_starting_coordinates] add coords: {t3 - t2:.4f}s")
-    print(f"[_get_starting_coordinates] total: {t3 - t0:.4f}s")
-
-    return vert_count, obj_coords, new_key_relative_coords, new_key_coords
+    return obj_coords, indices, relative_coordinates, new_key_coords
 
 
 def import_npz_key(
-    vert_count: int, filepath: str
-) -> np.ndarray[Any, np.dtype[np.float64]]:
+    vert_count: int, filepath: str, dtype: type = np.float64
+) -> np.ndarray[Any, np.dtype[Any]]:
     """Import coordinates from .npz file.
 
+    The decoded file is kept in `livekey_cache`, so repeated imports of the same key
+    don't read the file from disk again. Note that this expands the key to a dense
+    array, for adding a key to existing coordinates the sparse data returned by
+    `livekey_cache.get()` is faster.
+
     Args:
         vert_count (int): number of vertices in the mesh
         filepath (str): Path to the .npz file
+        dtype (type): Data type of the returned array. Defaults to np.float64.
 
     Returns:
         np.ndarray: coordinates of the shape key deformation.
     """
-    npz_dict = np.load(filepath)
-    new_key_relative_coords = np.zeros(vert_count * 3, dtype=np.float64)
-    new_key_relative_coords[npz_dict["indices"]] = npz_dict["relative_coordinates"]
+    indices, relative_coordinates = livekey_cache.get(filepath)
+    new_key_relative_coords = np.zeros(vert_count * 3, dtype=dtype)
+    new_key_relative_coords[indices] = relative_coordinates
     return new_key_relative_coords
 
 
-def update_livekey_collection() -> None:
-    """Updates the livekeys collection inside context.window_manager.
+def _coordinate_dtype() -> type:
+    """Data type used for coordinate arrays in livekey operations.
+
+    Blender stores coordinates as single precision, so float32 skips a conversion
+    and halves the memory of the arrays at the cost of accumulating rounding errors
+    in the permanent key.
 
-    Updates it to contain all livekeys present in the Human Generator folder structure.
+    Returns:
+        type: np.float32 if enabled in the preferences, else np.float64
     """
-    bpy.context.window_manager.livekeys.clear()
+    return np.float32 if get_prefs().livekey_float32 else np.float64
 
-    subcategories = []
 
-    folder = os.path.join(get_prefs().filepath, "livekeys")
-    for root, _, files in os.walk(folder):
+def _load_sparse_key(path: str) -> tuple[np.ndarray, np.ndarray]:
+    """Get the changed vector member indices and deltas of a livekey.
+
+    Reads from the livekey packs if the key is packed, else from the loose .npz file.
+
+    Args:
+        path (str): Path of the livekey, relative to the Human Generator folder
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: indices and relative coordinates
+    """
+    packed = livekey_packs.get(path)
+    if packed is not None:
+        return packed
+    return livekey_cache.get(os.path.join(get_prefs().filepath, path))
+
+
+def update_livekey_collection() -> None:
+    """Updates the livekeys collection inside context.window_manager.
+
+    Updates it to contain all livekeys present in the Human Generator folder structure,
+    both from livekey packs and from loose .npz files.
+    """
+    livekeys = bpy.context.window_manager.livekeys
+    livekeys.clear()
+    livekey_cache.invalidate()
+    bump_key_generation()
+
+    hg_folder = get_prefs().filepath
+    livekey_packs.load(hg_folder)
+
+    # The catalog only lists folders again when their modification time changed
+    folder = os.path.join(hg_folder, "livekeys")
+    loose_paths = []
+    for root, _, files in get_catalog(hg_folder).walk(folder):
         for file in files:
             if not file.endswith(".npz"):
                 continue
-            item = bpy.context.window_manager.livekeys.add()
-            if file.startswith(("male_", "female_")) or os.path.splitext(file)[
-                0
-            ].endswith(("_male", "_female")):
-                item.gender = "female" if "female" in file else "male"
-                item.name = file[:-4].replace(f"{item.gender}_", "")
-            else:
-                item.name = file[:-4]
-            abspath = os.path.join(root, file)
-            relpath = os.path.relpath(abspath, folder).split(os.sep)
+            path = os.path.relpath(os.path.join(root, file), hg_folder)
+            # Loose files take precedence, they are newer than the pack
+            livekey_packs.discard(path)
+            loose_paths.append(path)
 
-            if len(relpath) >= 3:
-                category, subcategory, *_ = relpath
-            else:
-                category = relpath[0]
-                subcategory = ""
+    subcategories = []
 
-            subcategories.append(subcategory)
+    def add_item(
+        path: str, name: str, gender: str, category: str, subcategory: str
+    ) -> None:
+        item = livekeys.add()
+        item.name = name
+        item.gender = gender
+        item.category = category
+        item.subcategory = subcategory
+        item.path = path
+        subcategories.append(subcategory)
+
+    for path, entry in livekey_packs.items():
+        add_item(
+            path,
+            entry["name"],
+            entry["gender"],
+            entry["category"],
+            entry["subcategory"],
+        )
 
-            item.category = category
-            item.subcategory = subcategory
-            item.path = os.path.relpath(abspath, get_prefs().filepath)
+    for path in loose_paths:
+        add_item(path, *livekey_info_from_path(os.path.relpath(path, "livekeys")))
 
     from HumGen3D.backend.properties.ui_properties import UserInterfaceProps
 
@@ -131,6 +184,66 @@ def update_livekey_collection() -> None:
             setattr(RandomizeLockProps, category, get_prop())
 
 
+_key_generation = 0
+# (body pointer, body name, mesh pointer) -> name index of the keys of the body
+_key_indexes: dict[tuple[int, str, int], _KeyIndex] = {}
+_livekey_path_index: dict[str, int] = {}  # livekey path -> index in collection
+
+_coords_generation = 0
+# (body pointer, body name, mesh pointer) -> coordinate arrays of the body
+_coords_caches: dict[tuple[int, str, int], _CoordsCache] = {}
+_was_editing_mesh = False  # If the last depsgraph update was in edit or sculpt mode
+
+# Shape keys that are not part of the base shape of the human
+NON_DEFORMATION_PREFIXES = ("Basis", "cor_", "eyeLook", "expr_")
+
+
+def bump_key_generation() -> None:
+    """Invalidate the cached key name indexes of all humans.
+
+    Called when livekeys or shape keys of the body are added, removed or renamed. The
+    KeySettings methods for this already call it.
+    """
+    global _key_generation
+    _key_generation += 1
+    _key_indexes.clear()
+    _livekey_path_index.clear()
+    bump_coords_generation()
+
+
+def bump_coords_generation() -> None:
+    """Invalidate the cached coordinates of `KeySettings.evaluated_coords()`.
+
+    Called when the coordinates of the body vertices or of its shape keys are changed.
+    `bump_key_generation` already calls it.
+    """
+    global _coords_generation
+    _coords_generation += 1
+    _coords_caches.clear()
+
+
+@persistent
+def invalidate_coords_on_undo(dummy: Any) -> None:
+    """Handler that invalidates the cached coordinates after undo, redo or loading."""
+    bump_coords_generation()
+
+
+@persistent
+def invalidate_coords_on_edit(scene: Any, depsgraph: bpy.types.Depsgraph) -> None:
+    """Handler that invalidates the cached coordinates when meshes are edited by hand.
+
+    Edit and sculpt mode change vertex and shape key coordinates without going
+    through the add-on. Leaving edit mode writes the mesh back, so the first update
+    after editing counts as well.
+    """
+    global _was_editing_mesh
+    editing = bpy.context.mode in ("EDIT_MESH", "SCULPT")
+    if (editing or _was_editing_mesh) and _coords_caches:
+        if any(update.is_updated_geometry for update in depsgraph.updates):
+            bump_coords_generation()
+    _was_editing_mesh = editing
+
+
 def transfer_shapekey(sk: bpy.types.ShapeKey, to_obj: bpy.types.Object) -> None:
     """Transfer shapekey to another object.
 
@@ -144,6 +257,7 @@ def transfer_shapekey(sk: bpy.types.ShapeKey, to_obj: bpy.types.Object) -> None:
 
     sk.data.foreach_get("co", old_sk_data)
     new_sk.data.foreach_set("co", old_sk_data)
+    bump_key_generation()
 
 
 # MODULE
@@ -158,6 +272,7 @@ def apply_shapekeys(ob: bpy.types.Object) -> None:
         return
 
     bpy.ops.object.shape_key_add(from_mix=True)
+    bump_key_generation()
     ob.active_shape_key.value = 1.0
     ob.active_shape_key.name = "All shape"
 
@@ -169,6 +284,7 @@ def apply_shapekeys(ob: bpy.types.Object) -> None:
 
     ob.shape_key_remove(ob.active_shape_key)
     ob.shape_key_remove(ob.active_shape_key)
+    bump_key_generation()
 
 
 class KeyItem:
@@ -280,30 +396,7 @@ class LiveKeyItem(KeyItem):
         Args:
             value (float): value to set the livekey to
         """
-        (
-            vert_count,
-            obj_coords,
-            new_key_relative_coords,
-            new_key_coords,
-        ) = _get_starting_coordinates(self._human, self.path)
-
-        # Set temp key to base coordinates if it's the same as the key being set.
-        temp_key = self._human.keys.temp_key
-        if temp_key and self.name == temp_key.name.replace("LIVE_KEY_TEMP_", ""):
-            temp_key.data.foreach_set("co", obj_coords.reshape((-1)))
-
-        current_sk_values = self._human.props.sk_values
-        old_value = (
-            current_sk_values[self.name] * -1 if self.name in current_sk_values else 0
-        )
-
-        permanent_key_coords = np.empty(vert_count * 3, dtype=np.float64)
-        self._human.keys.permanent_key.data.foreach_get("co", permanent_key_coords)
-        permanent_key_coords += new_key_relative_coords * (old_value + value)
-
-        self._human.keys.permanent_key.data.foreach_set("co", permanent_key_coords)
-
-        self._human.props.sk_values[self.name] = value
+        self._human.keys.set_many({self.name: value})
 
     def to_shapekey(self) -> ShapeKeyItem:
         """Convert this livekey to a Blender shape key on the human.
@@ -311,10 +404,9 @@ class LiveKeyItem(KeyItem):
         Returns:
             ShapeKeyItem: shapekey item representing the converted livekey
         """
-        filepath = os.path.join(get_prefs().filepath, self.as_bpy().path)
         body = self._human.objects.body
         vert_count = len(body.data.vertices)
-        new_key_relative_coords = import_npz_key(vert_count, filepath)
+        indices, relative_coordinates = _load_sparse_key(self.path)
 
         if self.category:
             if self.subcategory:
@@ -324,11 +416,11 @@ class LiveKeyItem(KeyItem):
                 name = f"{self.category[0]}_{self.name}"
         else:
             name = self.name
-        obj_coords = np.empty(vert_count * 3, dtype=np.float64)
-        body.data.vertices.foreach_get("co", obj_coords)
+        new_key_coords = np.empty(vert_count * 3, dtype=_coordinate_dtype())
+        body.data.vertices.foreach_get("co", new_key_coords)
+        new_key_coords[indices] += relative_coordinates
 
-        new_key_coords = obj_coords + new_key_relative_coords
-        key = self._human.objects.body.shape_key_add(name=name)
+        key = self._human.keys.add_shapekey(name)
         key.slider_max = 2
         key.slider_min = -2
 
@@ -346,9 +438,15 @@ class LiveKeyItem(KeyItem):
         """
         # Get livekey based on path instead of name as the name is not unique for
         # multi-gender keys.
-        livekey = next(
-            key for key in bpy.context.window_manager.livekeys if key.path == self.path
-        )
+        livekeys = bpy.context.window_manager.livekeys
+        idx = _livekey_path_index.get(self.path)
+        if idx is None or idx >= len(livekeys) or livekeys[idx].path != self.path:
+            _livekey_path_index.clear()
+            _livekey_path_index.update(
+                {key.path: i for i, key in enumerate(livekeys)}
+            )
+            idx = _livekey_path_index[self.path]
+        livekey = livekeys[idx]
         return cast("BpyLiveKey", livekey)
 
     def draw_prop(
@@ -382,6 +480,11 @@ class LiveKeyItem(KeyItem):
         return "LiveKey " + super().__repr__()
 
 
+SK_NAME_PATTERN = re.compile(
+    "^((?P<category>[^_])[_\{])?((?P<subcategory>.+)\}_)?(?P<name>.*)"  # noqa
+)
+
+
 class ShapeKeyItem(KeyItem, SavableContent):
     """Item representing a Blender shape key on the human."""
 
@@ -394,10 +497,7 @@ class ShapeKeyItem(KeyItem, SavableContent):
     }
 
     def __init__(self, sk_name: str, human: "Human") -> None:
-        pattern = re.compile(
-            "^((?P<category>[^_])[_\{])?((?P<subcategory>.+)\}_)?(?P<name>.*)"  # noqa
-        )
-        match = pattern.match(sk_name)
+        match = SK_NAME_PATTERN.match(sk_name)
         groupdict = match.groupdict()
         category_code = groupdict.get("category")
         category = self.category_dict[category_code] if category_code else ""
@@ -493,11 +593,13 @@ class ShapeKeyItem(KeyItem, SavableContent):
             indices=changed_idxs,
             relative_coordinates=relative_coordinates[changed_idxs],
         )
+        livekey_cache.invalidate(os.path.join(path, f"{name}.npz"))
 
         if delete_original:
-            body.shape_key_remove(sk)
+            self._human.keys.remove_shapekey(sk)
         else:
             sk.name = f"{category.lower()[0]}_{{{subcategory}}}_{name}"
+            bump_key_generation()
 
         update_livekey_collection()
 
@@ -523,10 +625,54 @@ class ShapeKeyItem(KeyItem, SavableContent):
         return "ShapeKey " + super().__repr__()
 
     def __hash__(self) -> int:
-        data = self.as_bpy().data
-        coords = np.empty(len(data) * 3, dtype=np.float64)  # type:ignore[arg-type]
-        data.foreach_get("co", coords)
-        return int(hashlib.sha1(data).hexdigest(), 16)  # type:ignore[arg-type] # noqa
+        hasher = ContentHasher()
+        hasher.update_attribute(self.as_bpy().data, "co")
+        return hasher.intdigest()
+
+
+class _KeyIndex:
+    """Lists of all keys of a human with a name lookup, cached in `_key_indexes`."""
+
+    def __init__(
+        self,
+        signature: tuple[Any, ...],
+        livekeys: List[LiveKeyItem],
+        shapekeys: List[ShapeKeyItem],
+    ) -> None:
+        self.signature = signature
+        self.livekeys = livekeys
+        self.shapekeys = shapekeys
+        self.temp_key_name: Optional[str] = None
+
+        # First key with a name wins, same as searching through all_keys
+        self.by_name: dict[str, Union[LiveKeyItem, ShapeKeyItem]] = {}
+        for key in [*livekeys, *shapekeys]:
+            self.by_name.setdefault(key.name, key)
+
+
+class _CoordsCache:
+    """Shape key coordinates of a body and their mix, cached in `_coords_caches`."""
+
+    MAX_MIXES = 4
+
+    def __init__(self, signature: tuple[Any, ...]) -> None:
+        self.signature = signature
+        self.key_coords: dict[Optional[str], np.ndarray] = {}
+        # Mix signature -> local coordinates, (mix, matrix) signature -> world
+        self.local: OrderedDict[tuple[Any, ...], np.ndarray] = OrderedDict()
+        self.world: OrderedDict[tuple[Any, ...], np.ndarray] = OrderedDict()
+
+    def remember(
+        self,
+        mixes: OrderedDict[tuple[Any, ...], np.ndarray],
+        signature: tuple[Any, ...],
+        coords: np.ndarray,
+    ) -> np.ndarray:
+        coords.flags.writeable = False
+        mixes[signature] = coords
+        while len(mixes) > self.MAX_MIXES:
+            mixes.popitem(last=False)
+        return coords
 
 
 class KeySettings:
@@ -551,6 +697,53 @@ class KeySettings:
         Returns:
             List[LiveKeyItem]: List of all livekeys
         """
+        return list(self._index.livekeys)
+
+    @property
+    def all_shapekeys(self) -> List[ShapeKeyItem]:
+        """A list of all ShapeKeyItems of this human.
+
+        Returns:
+            List[ShapeKeyItem]: List of all shapekeys
+        """
+        return list(self._index.shapekeys)
+
+    @property
+    def _index(self) -> _KeyIndex:
+        """Cached index of the keys of this human, rebuilt when keys have changed.
+
+        Returns:
+            _KeyIndex: Index with lists of all keys and a name lookup dict
+        """
+        body = self._human.objects.body
+        # Pointers can be reused after undo, so the names are part of the key
+        cache_key = (body.as_pointer(), body.name, body.data.as_pointer())
+        index = _key_indexes.get(cache_key)
+        if index is not None and index.signature == self._index_signature():
+            return index
+
+        if not len(bpy.context.window_manager.livekeys):
+            # Bumps the key generation, so the signature is taken after this
+            update_livekey_collection()
+
+        livekeys = self._build_livekeys()
+        shapekeys = self._build_shapekeys()
+        index = _KeyIndex(self._index_signature(), livekeys, shapekeys)
+        _key_indexes[cache_key] = index
+        return index
+
+    def _index_signature(self) -> tuple[Any, ...]:
+        body = self._human.objects.body
+        shape_keys = body.data.shape_keys
+        return (
+            _key_generation,
+            self._human.objects.rig.as_pointer(),
+            self._human.gender,
+            len(shape_keys.key_blocks) if shape_keys else 0,
+            len(bpy.context.window_manager.livekeys),
+        )
+
+    def _build_livekeys(self) -> List[LiveKeyItem]:
         livekeys = []
         for key in bpy.context.window_manager.livekeys:
             # Skip gendered keys
@@ -566,18 +759,10 @@ class KeySettings:
                 )
             )
 
-        if not livekeys:
-            update_livekey_collection()
         return livekeys
 
-    @property
-    def all_shapekeys(self) -> List[ShapeKeyItem]:
-        """A list of all ShapeKeyItems of this human.
-
-        Returns:
-            List[ShapeKeyItem]: List of all shapekeys
-        """
-        shapekeys = []
+    def _build_shapekeys(self) -> List[ShapeKeyItem]:
+        shapekeys: List[ShapeKeyItem] = []
         if not self._human.objects.body.data.shape_keys:
             return shapekeys
         for sk in self._human.objects.body.data.shape_keys.key_blocks:
@@ -609,13 +794,106 @@ class KeySettings:
         Returns:
             List[ShapeKeyItem]: List of all shapekeys
         """
-        SKIP_SUFFIXES = ("Basis", "cor_", "eyeLook", "expr_")
         return [
             sk
             for sk in self.all_shapekeys
-            if not sk.as_bpy().name.startswith(SKIP_SUFFIXES)
+            if not sk.as_bpy().name.startswith(NON_DEFORMATION_PREFIXES)
         ]
 
+    def evaluated_coords(
+        self, local: bool = True, key_names: Optional[Iterable[str]] = None
+    ) -> np.ndarray:
+        """Body coordinates with all deformation shape keys mixed in.
+
+        Same result as `world_coords_from_obj` with `all_deformation_shapekeys`, but
+        computed once and shared until the shape keys, their values or the body
+        change. The returned array is read-only, copy it before changing it.
+
+        Args:
+            local (bool): Return local coordinates of the body instead of world
+                coordinates. Defaults to True.
+            key_names (Iterable[str], optional): Only mix in these shape keys, at
+                their current value. Pass an empty list for the coordinates of the
+                body without shape keys. Defaults to all deformation shape keys.
+
+        Returns:
+            np.ndarray: Coordinates with shape (vertex count, 3)
+        """
+        cache = self._coords_cache
+        body = self._human.objects.body
+        shape_keys = body.data.shape_keys
+        key_blocks = shape_keys.key_blocks if shape_keys else ()
+        if key_names is None:
+            mixed_keys = [
+                key
+                for key in key_blocks
+                if not key.name.startswith(NON_DEFORMATION_PREFIXES)
+            ]
+        else:
+            mixed_keys = [key_blocks[name] for name in key_names]
+        mix_signature = tuple((key.name, key.value) for key in mixed_keys if key.value)
+
+        local_coords = cache.local.get(mix_signature)
+        if local_coords is None:
+            base_coords = self._shape_key_coords(None)
+            local_coords = base_coords.copy()
+            for name, value in mix_signature:
+                local_coords += (self._shape_key_coords(name) - base_coords) * value
+            cache.remember(cache.local, mix_signature, local_coords)
+
+        if local:
+            return local_coords
+
+        mx = body.matrix_world
+        world_signature = (mix_signature, tuple(tuple(row) for row in mx))
+        world_coords = cache.world.get(world_signature)
+        if world_coords is None:
+            mx_arr = np.array(mx)
+            world_coords = local_coords @ mx_arr[:3, :3].T + mx_arr[:3, 3]
+            cache.remember(cache.world, world_signature, world_coords)
+        return world_coords
+
+    def _shape_key_coords(self, name: Optional[str]) -> np.ndarray:
+        """Cached, read-only coordinates of a shape key of the body.
+
+        Args:
+            name (Optional[str]): Name of the shape key, None for the vertices
+
+        Returns:
+            np.ndarray: Coordinates with shape (vertex count, 3)
+        """
+        cache = self._coords_cache
+        coords = cache.key_coords.get(name)
+        if coords is None:
+            body = self._human.objects.body
+            if name is None:
+                data = body.data.vertices
+            else:
+                data = body.data.shape_keys.key_blocks[name].data
+            coords = np.empty(len(data) * 3, dtype=np.float64)
+            data.foreach_get("co", coords)
+            coords = coords.reshape((-1, 3))
+            coords.flags.writeable = False
+            cache.key_coords[name] = coords
+        return coords
+
+    @property
+    def _coords_cache(self) -> _CoordsCache:
+        body = self._human.objects.body
+        shape_keys = body.data.shape_keys
+        signature = (
+            _coords_generation,
+            len(body.data.vertices),
+            len(shape_keys.key_blocks) if shape_keys else 0,
+        )
+        # Pointers can be reused after undo, so the names are part of the key
+        cache_key = (body.as_pointer(), body.name, body.data.as_pointer())
+        cache = _coords_caches.get(cache_key)
+        if cache is None or cache.signature != signature:
+            cache = _CoordsCache(signature)
+            _coords_caches[cache_key] = cache
+        return cache
+
     @property
     def temp_key(self) -> bpy.types.ShapeKey:
         """The temporary shape key used for livekeying. Points to the Blender key.
@@ -623,18 +901,28 @@ class KeySettings:
         Returns:
             bpy.types.ShapeKey: The temporary shape key
         """
-        temp_key = next(
-            (sk for sk in self.all_shapekeys if sk.name.startswith("LIVE_KEY_TEMP_")),
-            None,
+        shape_keys = self._human.objects.body.data.shape_keys
+        index = self._index
+        temp_key = (
+            shape_keys.key_blocks.get(index.temp_key_name)
+            if shape_keys and index.temp_key_name
+            else None
         )
+        # Temp key is renamed to the livekey it contains, so check the cached name
+        if not temp_key or not temp_key.name.startswith("LIVE_KEY_TEMP_"):
+            temp_key = next(
+                (
+                    sk
+                    for sk in (shape_keys.key_blocks if shape_keys else [])
+                    if sk.name.startswith("LIVE_KEY_TEMP_")
+                ),
+                None,
+            )
         if not temp_key:
-            temp_key = self._human.objects.body.shape_key_add(
-                name="LIVE_KEY_TEMP_"
-            )  # type:ignore[assignment]
+            temp_key = self.add_shapekey("LIVE_KEY_TEMP_")
             temp_key.slider_max = 10
             temp_key.slider_min = -10
-        else:
-            temp_key = temp_key.as_bpy()  # type:ignore[assignment]
+        index.temp_key_name = temp_key.name
         return cast(bpy.types.ShapeKey, temp_key)
 
     @property
@@ -698,18 +986,18 @@ class KeySettings:
 
         vert_count = len(obj.data.vertices)
 
-        relative_sk_co = import_npz_key(vert_count, npz_filepath)
-        vert_co = np.empty(vert_count * 3, dtype=np.float64)
+        indices, relative_coordinates = livekey_cache.get(npz_filepath)
+        vert_co = np.empty(vert_count * 3, dtype=_coordinate_dtype())
         obj.data.vertices.foreach_get("co", vert_co)
+        vert_co[indices] += relative_coordinates
 
         name = os.path.basename(os.path.splitext(npz_filepath)[0])
 
         sk = obj.shape_key_add(name=name)
         sk.interpolation = "KEY_LINEAR"
+        bump_key_generation()
 
-        adjusted_vert_co = vert_co + relative_sk_co
-
-        sk.data.foreach_set("co", adjusted_vert_co)
+        sk.data.foreach_set("co", vert_co)
 
         return sk
 
@@ -736,27 +1024,108 @@ class KeySettings:
             list[str]: List of errors that occurred during setting the values
         """
         errors = []
-        for key_name, value in key_dict.items():
-            if value == 0 and key_name != "Male":
+        key_dict = {
+            key_name: value
+            for key_name, value in key_dict.items()
+            if value != 0 or key_name == "Male"
+        }
+        for key_name in self.set_many(key_dict):
+            if key_name.startswith(("LIVE_KEY_TEMP_", "height_")):
                 continue
-            key = self.get(key_name)
-            if key:
-                if hasattr(key, "set_without_update"):
-                    key.set_without_update(value)
-                else:
-                    key.value = value
-            else:
-                if key_name.startswith(("LIVE_KEY_TEMP_", "height_")):
-                    continue
-                hg_log(
-                    f"Could not find key '{key_name}' while setting values", "WARNING"
-                )
-                errors.append("Key not found: " + key_name)
+            hg_log(f"Could not find key '{key_name}' while setting values", "WARNING")
+            errors.append("Key not found: " + key_name)
 
         self.update_human_from_key_change(context)
 
         return errors
 
+    def set_many(self, key_dict: dict[str, float]) -> list[str]:
+        """Set the values of multiple keys at once without updating the human.
+
+        All livekeys are added to the permanent key in a single pass, meaning the
+        body and permanent key coordinates are only read and written once, no matter
+        how many livekeys are set. Shape keys are set directly.
+
+        Call `update_human_from_key_change()` when done with setting your keys.
+
+        Args:
+            key_dict (dict[str, float]): Dictionary of key names and values to set
+
+        Returns:
+            list[str]: Names of the keys that could not be found
+        """
+        keys_by_name = self._index.by_name
+
+        livekeys = []
+        not_found = []
+        for key_name, value in key_dict.items():
+            key = keys_by_name.get(key_name)
+            if key is None:
+                not_found.append(key_name)
+            elif isinstance(key, LiveKeyItem):
+                livekeys.append((key, value))
+            else:
+                key.value = value
+
+        if livekeys:
+            self._add_livekeys_to_permanent_key(livekeys)
+
+        return not_found
+
+    def _add_livekeys_to_permanent_key(
+        self, livekeys: list[tuple[LiveKeyItem, float]]
+    ) -> None:
+        body = self._human.objects.body
+        vert_count = len(body.data.vertices)
+        current_sk_values = self._human.props.sk_values
+
+        temp_key = self.temp_key
+        temp_key_name = temp_key.name.replace("LIVE_KEY_TEMP_", "")
+
+        all_indices = []
+        all_deltas = []
+        for key, value in livekeys:
+            # The livekey loaded in the temp key is not part of the permanent key,
+            # so reset the temp key and add the full value to the permanent key.
+            if temp_key_name and key.name == temp_key_name:
+                obj_coords = np.empty(vert_count * 3, dtype=_coordinate_dtype())
+                body.data.vertices.foreach_get("co", obj_coords)
+                temp_key.data.foreach_set("co", obj_coords)
+                temp_key.name = "LIVE_KEY_TEMP_"
+                bump_key_generation()
+                temp_key.value = 0
+                temp_key_name = ""
+                old_value = 0.0
+            elif key.name in current_sk_values:
+                old_value = current_sk_values[key.name]
+            else:
+                old_value = 0.0
+
+            current_sk_values[key.name] = value
+            if value == old_value:
+                continue
+
+            indices, relative_coordinates = _load_sparse_key(key.path)
+            all_indices.append(indices)
+            all_deltas.append(relative_coordinates * (value - old_value))
+
+        if not all_indices:
+            return
+
+        permanent_key = self.permanent_key
+        all_indices_arr = np.concatenate(all_indices)
+        all_deltas_arr = np.concatenate(all_deltas)
+
+        permanent_key_coords = np.empty(vert_count * 3, dtype=_coordinate_dtype())
+        permanent_key.data.foreach_get("co", permanent_key_coords)
+        # Only touch the vector members that are changed by any of the livekeys
+        changed_idxs, inverse = np.unique(all_indices_arr, return_inverse=True)
+        permanent_key_coords[changed_idxs] += np.bincount(
+            inverse, weights=all_deltas_arr, minlength=len(changed_idxs)
+        )
+        permanent_key.data.foreach_set("co", permanent_key_coords)
+        bump_coords_generation()
+
     @injected_context
     def update_human_from_key_change(self, context: C = None) -> None:
         """Update the human mesh from the current live key values.
@@ -801,6 +1170,8 @@ class KeySettings:
             if sk.name.lower().startswith(opposite_gender) and sk.name != "Male":
                 hg_body.shape_key_remove(sk)
 
+        bump_key_generation()
+
     def _add_driver(
         self, target_sk: bpy.types.ShapeKey, sett_dict: dict[str, str]
     ) -> bpy.types.Driver:
@@ -826,13 +1197,48 @@ class KeySettings:
 
         return driver
 
+    def add_shapekey(self, name: str, from_mix: bool = True) -> bpy.types.ShapeKey:
+        """Add a new Blender shape key to the body of this human.
+
+        Use this instead of `body.shape_key_add()` to keep the key lookup up to date.
+
+        Args:
+            name (str): Name of the new shape key
+            from_mix (bool): Create the new shape key from the current mix of shape
+                keys. Defaults to True.
+
+        Returns:
+            bpy.types.ShapeKey: The newly created shape key
+        """
+        sk = self._human.objects.body.shape_key_add(name=name, from_mix=from_mix)
+        bump_key_generation()
+        return cast(bpy.types.ShapeKey, sk)
+
+    def remove_shapekey(self, sk: bpy.types.ShapeKey) -> None:
+        """Remove a Blender shape key from the body of this human.
+
+        Use this instead of `body.shape_key_remove()` to keep the key lookup up to
+        date.
+
+        Args:
+            sk (bpy.types.ShapeKey): The shape key to remove
+        """
+        self._human.objects.body.shape_key_remove(sk)
+        bump_key_generation()
+
     def __getitem__(self, name: str) -> Union[LiveKeyItem, ShapeKeyItem]:
-        try:
-            return next(key for key in self.all_keys if key.name == name)
-        except StopIteration:
+        key = self._index.by_name.get(name)
+        if isinstance(key, ShapeKeyItem):
+            # Shape key might have been renamed or removed outside of the add-on
+            key_blocks = self._human.objects.body.data.shape_keys.key_blocks
+            if key_blocks.get(key.sk_name) is None:
+                bump_key_generation()
+                key = self._index.by_name.get(name)
+
+        if key is None:
             hg_log(f"{self.all_keys = }", level="DEBUG")
-            # pylint: disable-next=raise-missing-from
             raise KeyError(f"Key '{name}' not found")
+        return key
 
     def __iter__(self) -> Iterable[Union[ShapeKeyItem, LiveKeyItem]]:
         yield from self.all_keys
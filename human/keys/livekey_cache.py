@@ -0,0 +1,141 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+"""Implements a size-bounded in-memory cache for decoded livekey files.
+
+Livekeys are stored as compressed .npz files containing the changed vector member
+indices and the relative coordinates for those indices. Decompressing these files
+every time a livekey is set is slow, so the sparse arrays are kept in memory here.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from typing import Any, Optional
+
+import numpy as np
+
+SparseKey = tuple[np.ndarray, np.ndarray]
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class LiveKeyCache:
+    """LRU cache of sparse (indices, relative_coordinates) pairs of livekey files.
+
+    Entries are keyed by the absolute filepath and the modification time of the file,
+    so a livekey that is overwritten on disk is automatically read again.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, SparseKey]] = OrderedDict()
+        self._size = 0
+
+    def get(self, filepath: str) -> SparseKey:
+        """Get the sparse arrays of the livekey at the given path.
+
+        Reads the file from disk if it's not in the cache or if it has been
+        modified since it was cached.
+
+        Args:
+            filepath (str): Absolute path to the .npz file
+
+        Returns:
+            SparseKey: Tuple of (indices, relative_coordinates). Both are one
+                dimensional and read-only, the indices point to individual vector
+                members of a flattened coordinate array.
+        """
+        mtime = os.path.getmtime(filepath)
+        entry = self._entries.get(filepath)
+        if entry is not None and entry[0] == mtime:
+            self.hits += 1
+            self._entries.move_to_end(filepath)
+            return entry[1]
+
+        self.misses += 1
+        if entry is not None:
+            self._remove(filepath)
+
+        sparse_key = read_npz(filepath)
+        self._add(filepath, mtime, sparse_key)
+        return sparse_key
+
+    def invalidate(self, filepath: Optional[str] = None) -> None:
+        """Remove cached entries.
+
+        Args:
+            filepath (str, optional): Only remove the entry of this file. If None, the
+                whole cache is cleared. Defaults to None.
+        """
+        if filepath is None:
+            self._entries.clear()
+            self._size = 0
+        elif filepath in self._entries:
+            self._remove(filepath)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Statistics of this cache, useful for checking its effectiveness.
+
+        Returns:
+            dict[str, Any]: Dict with hits, misses, entries, size_bytes and max_bytes
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "size_bytes": self._size,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _add(self, filepath: str, mtime: float, sparse_key: SparseKey) -> None:
+        nbytes = _nbytes(sparse_key)
+        if nbytes > self.max_bytes:
+            return
+
+        self._entries[filepath] = (mtime, sparse_key)
+        self._size += nbytes
+        while self._size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def _remove(self, filepath: str) -> None:
+        _, sparse_key = self._entries.pop(filepath)
+        self._size -= _nbytes(sparse_key)
+
+    def __contains__(self, filepath: str) -> bool:
+        return filepath in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def read_npz(filepath: str) -> SparseKey:
+    """Read the sparse arrays of a livekey from a .npz file.
+
+    Args:
+        filepath (str): Absolute path to the .npz file
+
+    Returns:
+        SparseKey: Tuple of one dimensional (indices, relative_coordinates)
+    """
+    with np.load(filepath) as npz_dict:
+        # Indices are saved as output of np.nonzero, so they have an extra dimension
+        indices = np.ascontiguousarray(npz_dict["indices"]).ravel()
+        relative_coordinates = np.ascontiguousarray(
+            npz_dict["relative_coordinates"]
+        ).ravel()
+
+    indices.flags.writeable = False
+    relative_coordinates.flags.writeable = False
+    return indices, relative_coordinates
+
+
+def _nbytes(sparse_key: SparseKey) -> int:
+    return sum(arr.nbytes for arr in sparse_key)
+
+
+livekey_cache = LiveKeyCache()  # global cache used by all livekey operations
@@ -0,0 +1,302 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+"""Implements packed livekey libraries, merging many livekeys into a single file.
+
+A livekey pack (.hglk) is an uncompressed binary file with this layout:
+
+    magic (4 bytes) | version (uint32) | header size (uint64) | header (JSON) |
+    indices (int32[count]) | relative coordinates (float64[count])
+
+The JSON header maps the path of each livekey, relative to the Human Generator
+folder, to its name, gender, category, subcategory, offset and length inside the
+index and coordinate arrays. The arrays are opened with np.memmap, so reading a
+livekey from a pack does not open any file and does not copy any data.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+
+from .livekey_cache import SparseKey, read_npz
+
+PACK_EXTENSION = ".hglk"
+PACK_MAGIC = b"HGLK"
+PACK_VERSION = 1
+
+_PREAMBLE_SIZE = 16
+_INDEX_DTYPE = np.dtype("<i4")
+_COORDINATE_DTYPE = np.dtype("<f8")
+
+LiveKeyInfo = tuple[str, str, str, str]
+
+
+def livekey_info_from_path(relpath: str) -> LiveKeyInfo:
+    """Get name, gender, category and subcategory of a livekey from its path.
+
+    Args:
+        relpath (str): Path of the livekey file, relative to the livekeys folder
+
+    Returns:
+        LiveKeyInfo: Tuple of name, gender, category and subcategory. Gender is an
+            empty string for keys that are used by both genders.
+    """
+    parts = relpath.replace("\\", "/").split("/")
+    file = parts[-1]
+
+    gender = ""
+    if file.startswith(("male_", "female_")) or os.path.splitext(file)[0].endswith(
+        ("_male", "_female")
+    ):
+        gender = "female" if "female" in file else "male"
+        name = file[:-4].replace(f"{gender}_", "")
+    else:
+        name = file[:-4]
+
+    if len(parts) >= 3:
+        category, subcategory, *_ = parts
+    else:
+        category = parts[0]
+        subcategory = ""
+
+    return name, gender, category, subcategory
+
+
+def _align(size: int, alignment: int = 8) -> int:
+    return (size + alignment - 1) // alignment * alignment
+
+
+def _to_key(path: str) -> str:
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def write_livekey_pack(
+    pack_path: str, hg_folder: str, livekey_paths: Iterable[str]
+) -> int:
+    """Merge the passed .npz livekeys into a single livekey pack.
+
+    Args:
+        pack_path (str): Path to write the .hglk file to
+        hg_folder (str): Human Generator folder the livekey paths are relative to
+        livekey_paths (Iterable[str]): Paths of the .npz livekeys, relative to the
+            Human Generator folder
+
+    Returns:
+        int: Number of livekeys written to the pack
+    """
+    livekeys_folder = os.path.join(hg_folder, "livekeys")
+
+    entries = {}
+    all_indices = []
+    all_coordinates = []
+    offset = 0
+    for path in sorted(livekey_paths):
+        abspath = os.path.join(hg_folder, path)
+        indices, relative_coordinates = read_npz(abspath)
+        name, gender, category, subcategory = livekey_info_from_path(
+            os.path.relpath(abspath, livekeys_folder)
+        )
+        entries[_to_key(path)] = {
+            "name": name,
+            "gender": gender,
+            "category": category,
+            "subcategory": subcategory,
+            "offset": offset,
+            "length": len(indices),
+        }
+        all_indices.append(indices.astype(_INDEX_DTYPE))
+        all_coordinates.append(relative_coordinates.astype(_COORDINATE_DTYPE))
+        offset += len(indices)
+
+    header = json.dumps({"count": offset, "entries": entries}).encode("utf-8")
+    header += b" " * (_align(len(header)) - len(header))
+    index_size = offset * _INDEX_DTYPE.itemsize
+
+    with open(pack_path, "wb") as f:
+        f.write(PACK_MAGIC)
+        f.write(np.uint32(PACK_VERSION).tobytes())
+        f.write(np.uint64(len(header)).tobytes())
+        f.write(header)
+        if offset:
+            np.concatenate(all_indices).tofile(f)
+            f.write(b"\0" * (_align(index_size) - index_size))
+            np.concatenate(all_coordinates).tofile(f)
+
+    return len(entries)
+
+
+def pack_content_pack(
+    hg_folder: str, cpack_json_path: str, remove_loose: bool = True
+) -> Optional[str]:
+    """Merge all livekeys of an installed content pack into a livekey pack.
+
+    The pack is saved in the livekeys folder with the name of the content pack.
+
+    Args:
+        hg_folder (str): Human Generator folder
+        cpack_json_path (str): Path to the .json file of the content pack
+        remove_loose (bool): Remove the packed .npz files and replace them by the
+            pack in the file list of the content pack. Loose files take precedence
+            over packed ones, so the pack is only used when this is True.
+            Defaults to True.
+
+    Returns:
+        Optional[str]: Path of the written pack, None if the content pack does not
+            contain any livekeys.
+    """
+    with open(cpack_json_path) as f:
+        cpack_data = json.load(f)
+
+    file_list = cpack_data.get("files", [])
+    livekey_files = [
+        path
+        for path in file_list
+        if path.endswith(".npz") and path.lstrip("/\\").startswith("livekeys")
+    ]
+    if not livekey_files:
+        return None
+
+    pack_name = os.path.splitext(os.path.basename(cpack_json_path))[0]
+    pack_path = os.path.join(hg_folder, "livekeys", pack_name + PACK_EXTENSION)
+    livekey_paths = [path.lstrip("/\\") for path in livekey_files]
+    write_livekey_pack(pack_path, hg_folder, livekey_paths)
+
+    if remove_loose:
+        for path in livekey_paths:
+            os.remove(os.path.join(hg_folder, path))
+
+        pack_relpath = "/" + _to_key(os.path.relpath(pack_path, hg_folder))
+        cpack_data["files"] = [
+            path for path in file_list if path not in livekey_files
+        ] + [pack_relpath]
+        with open(cpack_json_path, "w") as f:
+            json.dump(cpack_data, f, indent=4)
+
+    return pack_path
+
+
+class LiveKeyPack:
+    """A single opened livekey pack, reading from a memory-mapped file."""
+
+    def __init__(self, pack_path: str) -> None:
+        self.path = pack_path
+        with open(pack_path, "rb") as f:
+            preamble = f.read(_PREAMBLE_SIZE)
+            if len(preamble) != _PREAMBLE_SIZE or preamble[:4] != PACK_MAGIC:
+                raise ValueError(f"Not a livekey pack: {pack_path}")
+            version = int(np.frombuffer(preamble[4:8], dtype="<u4")[0])
+            if version > PACK_VERSION:
+                raise ValueError(f"Unsupported livekey pack version {version}")
+            header_size = int(np.frombuffer(preamble[8:16], dtype="<u8")[0])
+            header = json.loads(f.read(header_size).decode("utf-8"))
+
+        self.entries: dict[str, dict[str, Any]] = header["entries"]
+        count = header["count"]
+
+        index_offset = _PREAMBLE_SIZE + header_size
+        coordinate_offset = index_offset + _align(count * _INDEX_DTYPE.itemsize)
+        if count:
+            self._indices = np.memmap(
+                pack_path, _INDEX_DTYPE, "r", index_offset, (count,)
+            )
+            self._coordinates = np.memmap(
+                pack_path, _COORDINATE_DTYPE, "r", coordinate_offset, (count,)
+            )
+        else:
+            self._indices = np.empty(0, dtype=_INDEX_DTYPE)
+            self._coordinates = np.empty(0, dtype=_COORDINATE_DTYPE)
+
+    def get(self, path: str) -> Optional[SparseKey]:
+        """Get the sparse arrays of the livekey with this path.
+
+        Args:
+            path (str): Path of the livekey, relative to the Human Generator folder
+
+        Returns:
+            Optional[SparseKey]: Views of (indices, relative_coordinates) into the
+                memory-mapped file, None if the livekey is not in this pack.
+        """
+        entry = self.entries.get(_to_key(path))
+        if entry is None:
+            return None
+        start = entry["offset"]
+        end = start + entry["length"]
+        return self._indices[start:end], self._coordinates[start:end]
+
+
+class LiveKeyPackRegistry:
+    """All livekey packs found in the livekeys folder of the Human Generator folder.
+
+    Loose .npz livekeys take precedence over packed ones, see `discard()`.
+    """
+
+    def __init__(self) -> None:
+        self._packs: list[LiveKeyPack] = []
+        self._lookup: dict[str, LiveKeyPack] = {}
+
+    def load(self, hg_folder: str) -> None:
+        """Open all .hglk packs in the livekeys folder, replacing previous ones.
+
+        Args:
+            hg_folder (str): Human Generator folder
+        """
+        self.clear()
+        folder = os.path.join(hg_folder, "livekeys")
+        if not os.path.isdir(folder):
+            return
+
+        for file in sorted(os.listdir(folder)):
+            if not file.endswith(PACK_EXTENSION):
+                continue
+            pack = LiveKeyPack(os.path.join(folder, file))
+            self._packs.append(pack)
+            for key in pack.entries:
+                self._lookup[key] = pack
+
+    def get(self, path: str) -> Optional[SparseKey]:
+        """Get the sparse arrays of a packed livekey.
+
+        Args:
+            path (str): Path of the livekey, relative to the Human Generator folder
+
+        Returns:
+            Optional[SparseKey]: Tuple of (indices, relative_coordinates), None if
+                this livekey is not in any of the packs.
+        """
+        pack = self._lookup.get(_to_key(path))
+        return pack.get(path) if pack else None
+
+    def discard(self, path: str) -> None:
+        """Stop reading this livekey from the packs, used when a loose file exists.
+
+        Args:
+            path (str): Path of the livekey, relative to the Human Generator folder
+        """
+        self._lookup.pop(_to_key(path), None)
+
+    def items(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Iterate over the paths and header entries of all available packed keys.
+
+        Yields:
+            tuple[str, dict[str, Any]]: Path relative to the Human Generator folder
+                and the header entry with name, gender, category and subcategory.
+        """
+        for key, pack in self._lookup.items():
+            yield os.path.join(*key.split("/")), pack.entries[key]
+
+    def clear(self) -> None:
+        """Close all packs."""
+        self._packs.clear()
+        self._lookup.clear()
+
+    def __contains__(self, path: str) -> bool:
+        return _to_key(path) in self._lookup
+
+    def __len__(self) -> int:
+        return len(self._lookup)
+
+
+livekey_packs = LiveKeyPackRegistry()  # global registry used by all livekey operations
@@ -12,6 +12,7 @@ from HumGen3D.common.decorators import injected_context
 from HumGen3D.common.type_aliases import C
 from HumGen3D.human.common_baseclasses.pcoll_content import PreviewCollectionContent
 from HumGen3D.human.common_baseclasses.savable_content import SavableContent
+from HumGen3D.human.content_changes import bump_generation, content_hash
 
 from .rigify import RigifySettings
 
@@ -84,7 +85,8 @@ class PoseSettings(PreviewCollectionContent, SavableContent):
         if not pref.debug_mode:
             hg_delete(hg_pose)
 
-        self._human.props.hashes["$pose"] = str(hash(self))
+        bump_generation(hg_rig, "pose")
+        self._human.props.hashes["$pose"] = content_hash(hg_rig, "pose", self)
 
     def get_posebone_by_original_name(self, original_name: str) -> bpy.types.PoseBone:
         bone = next(
@@ -11,15 +11,15 @@ import numpy as np
 from HumGen3D.common import find_multiple_in_list
 from HumGen3D.common.context import context_override
 from HumGen3D.common.decorators import injected_context
+from HumGen3D.common.exceptions import HumGenException
 from HumGen3D.common.objects import (
     apply_sk_to_mesh,
     delete_object,
     duplicate_object,
     remove_all_shapekeys,
-    transfer_as_shape_key,
 )
 from HumGen3D.common.type_aliases import C  # type: ignore
-from HumGen3D.human.keys.keys import apply_shapekeys
+from HumGen3D.human.keys.keys import apply_shapekeys, bump_coords_generation
 
 if TYPE_CHECKING:
     from HumGen3D.backend.properties.scene_main_properties import HG_SETTINGS
@@ -64,6 +64,37 @@ NON_TOPOLOGY_CHANGING_MODIFIERS = {
     "SOFT_BODY",
 }
 
+# Restored on the shape keys after applying topology changing modifiers, the slider
+# range is set before the value because the value is clamped to it
+SHAPE_KEY_SETTINGS = (
+    "slider_min",
+    "slider_max",
+    "value",
+    "vertex_group",
+    "interpolation",
+    "mute",
+)
+
+# Modifiers that only move vertices, so the result can be written to the shape keys
+DEFORM_MODIFIERS = {
+    "ARMATURE",
+    "CAST",
+    "CURVE",
+    "DISPLACE",
+    "HOOK",
+    "LAPLACIANDEFORM",
+    "LATTICE",
+    "MESH_DEFORM",
+    "SHRINKWRAP",
+    "SIMPLE_DEFORM",
+    "SMOOTH",
+    "CORRECTIVE_SMOOTH",
+    "LAPLACIANSMOOTH",
+    "SURFACE_DEFORM",
+    "WARP",
+    "WAVE",
+}
+
 
 @injected_context
 def apply_modifiers(human, context: C = None) -> None:  # noqa CCR001
@@ -87,50 +118,146 @@ def apply_modifiers(human, context: C = None) -> None:  # noqa CCR001
             apply_selected_modifiers(modifiers_to_apply, obj, context)
             continue
 
-        # if not modifiers_to_apply.issubset(NON_TOPOLOGY_CHANGING_MODIFIERS):
-        apply_topology_changing_modifiers(context, modifiers_to_apply, obj, human)
-        # else:
-        #    quick_apply_modifiers(modifiers_to_apply, obj) todo
+        if modifiers_to_apply.issubset(DEFORM_MODIFIERS):
+            quick_apply_modifiers(context, modifiers_to_apply, obj)
+        else:
+            apply_topology_changing_modifiers(context, modifiers_to_apply, obj, human)
 
     human.hair.set_connected(True)
+    bump_coords_generation()
     refresh_modapply(None, context)
 
 
+def quick_apply_modifiers(context, modifier_types, obj):
+    """Apply deform modifiers by writing the deformed coordinates to each shape key.
+
+    The shape keys, their drivers and settings stay as they are, only their
+    coordinates change.
+    """
+    modifiers = _modifiers_to_apply(modifier_types, obj, context)
+    if not modifiers:
+        return
+
+    all_key_coords = _evaluated_shape_key_coords(context, obj, modifiers)
+    if all_key_coords.shape[1] != len(obj.data.vertices) * 3:
+        raise HumGenException(f"Modifiers changed the vertex count of {obj.name}")
+
+    key_blocks = obj.data.shape_keys.key_blocks
+    for sk, key_coords in zip(key_blocks, all_key_coords):
+        sk.data.foreach_set("co", key_coords)
+    obj.data.vertices.foreach_set("co", all_key_coords[0])
+
+    for mod in modifiers:
+        obj.modifiers.remove(mod)
+
+    for sk in key_blocks:
+        if sk.name.startswith("LIVE_KEY"):
+            apply_sk_to_mesh(sk, obj)
+    obj.data.update()
+
+
 def apply_topology_changing_modifiers(context, modifier_types, obj, human):
-    sk_cache_object = duplicate_object(obj, context)
+    modifiers = _modifiers_to_apply(modifier_types, obj, context)
+    if not modifiers:
+        return
+
+    all_key_coords = _evaluated_shape_key_coords(context, obj, modifiers)
+    key_blocks = obj.data.shape_keys.key_blocks
+    key_names = [sk.name for sk in key_blocks]
+    relative_key_names = [sk.relative_key.name for sk in key_blocks]
+    key_settings = [
+        {attr: getattr(sk, attr) for attr in SHAPE_KEY_SETTINGS} for sk in key_blocks
+    ]
     driver_dict = build_driver_dict(obj)
     remove_all_shapekeys(obj)
     apply_selected_modifiers(modifier_types, obj, context)
-    for sk in sk_cache_object.data.shape_keys.key_blocks:
-        if sk.name.startswith("Basis"):
+
+    if all_key_coords.shape[1] != len(obj.data.vertices) * 3:
+        raise HumGenException(
+            f"Applied modifiers on {obj.name} don't match the evaluated shape keys"
+        )
+
+    # The first key is the reference key, it gets the coordinates of the mesh
+    for i, name in enumerate(key_names):
+        new_sk = obj.shape_key_add(name=name, from_mix=False)
+        if i == 0:
             continue
 
-        temp_sk_object = duplicate_object(sk_cache_object, context)
-        temp_sk_object.name = sk.name
-        sk_value = sk.value
-        remove_all_shapekeys(temp_sk_object, apply_last=sk.name)
-        apply_selected_modifiers(modifier_types, temp_sk_object, context)
-        transfer_as_shape_key(temp_sk_object, obj)
-        new_sk = obj.data.shape_keys.key_blocks[sk.name]
-        new_sk.value = sk_value
-        if sk.name in driver_dict:
-            human.keys._add_driver(new_sk, driver_dict[sk.name])
-        if sk.name.startswith("LIVE_KEY"):
-            apply_sk_to_mesh(new_sk, obj)
-        delete_object(temp_sk_object)
+        new_sk.data.foreach_set("co", all_key_coords[i])
+        for attr, value in key_settings[i].items():
+            setattr(new_sk, attr, value)
+        if name in driver_dict:
+            human.keys._add_driver(new_sk, driver_dict[name])
 
-    delete_object(sk_cache_object)
+    key_blocks = obj.data.shape_keys.key_blocks
+    for sk, relative_key_name in zip(key_blocks, relative_key_names):
+        sk.relative_key = key_blocks[relative_key_name]
+    for sk in key_blocks:
+        if sk.name.startswith("LIVE_KEY"):
+            apply_sk_to_mesh(sk, obj)
+
+
+def _evaluated_shape_key_coords(context, obj, modifiers) -> np.ndarray:
+    """Evaluate the modifiers on the coordinates of every shape key of the object.
+
+    Uses a single temporary copy of the object without shape keys, with only the
+    passed modifiers enabled. The coordinates of each key are written to its mesh
+    and read back from the evaluated mesh.
+
+    Returns:
+        np.ndarray: Flat evaluated coordinates, shape (key count, vertex count * 3)
+    """
+    key_blocks = obj.data.shape_keys.key_blocks
+    mod_names = {mod.name for mod in modifiers}
+
+    temp_obj = duplicate_object(obj, context)
+    temp_obj.hide_viewport = False
+    temp_obj.shape_key_clear()
+    for mod in temp_obj.modifiers:
+        mod.show_viewport = mod.name in mod_names
+
+    key_coords = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+    all_key_coords = None
+    try:
+        for i, sk in enumerate(key_blocks):
+            sk.data.foreach_get("co", key_coords)
+            temp_obj.data.vertices.foreach_set("co", key_coords)
+            temp_obj.data.update()
+
+            temp_eval = temp_obj.evaluated_get(context.evaluated_depsgraph_get())
+            eval_mesh = temp_eval.to_mesh()
+            try:
+                eval_len = len(eval_mesh.vertices) * 3
+                if all_key_coords is None:
+                    all_key_coords = np.empty((len(key_blocks), eval_len), np.float32)
+                elif eval_len != all_key_coords.shape[1]:
+                    raise HumGenException(
+                        f"Modifiers on {obj.name} change the topology differently "
+                        "per shape key"
+                    )
+                eval_mesh.vertices.foreach_get("co", all_key_coords[i])
+            finally:
+                temp_eval.to_mesh_clear()
+    finally:
+        delete_object(temp_obj)
+
+    return all_key_coords
+
+
+def _modifiers_to_apply(modifier_types, obj, context):
+    apply_hidden = context.scene.HG3D.process.modapply.apply_hidden
+    return [
+        mod
+        for mod in obj.modifiers
+        if mod.type in modifier_types
+        and (apply_hidden or (mod.show_render and mod.show_viewport))
+    ]
 
 
 def apply_selected_modifiers(modifier_types, obj, context):
-    for mod in reversed(obj.modifiers):
-        if not mod.type in modifier_types:
-            continue
-        if (
-            not mod.show_render or not mod.show_viewport
-        ) and not context.scene.HG3D.process.modapply.apply_hidden:
-            continue
-        mod_name = mod.name
+    # Applied in stack order, each modifier is then the first one when applied
+    modifiers = _modifiers_to_apply(modifier_types, obj, context)
+    for mod_name in [mod.name for mod in modifiers]:
         with context_override(context, obj, [obj]):
             bpy.ops.object.modifier_apply(modifier=mod_name)
         assert mod_name not in obj.modifiers
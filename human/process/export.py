@@ -11,6 +11,7 @@ from HumGen3D.common.type_aliases import C
 from HumGen3D.common.objects import apply_sk_to_mesh
 from HumGen3D.common.decorators import deprecated
 from HumGen3D.common.exceptions import HumGenException
+from HumGen3D.human.keys.keys import bump_coords_generation
 
 if TYPE_CHECKING:
     from HumGen3D.human.human import Human
@@ -90,6 +91,9 @@ def exporter(exporter_func):
 
                 body.shape_key_remove(sk)
 
+        # The vertices and shape keys were written directly, drop cached coordinates
+        bump_coords_generation()
+
     return wrapper
 
 
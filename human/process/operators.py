@@ -17,6 +17,7 @@ from HumGen3D.backend.preferences.preference_func import get_prefs
 from HumGen3D.backend.properties.process_props import get_preset_list
 from HumGen3D.common import find_multiple_in_list
 from HumGen3D.common.collections import add_to_collection
+from HumGen3D.human.content_changes import clear_checked_hashes
 from HumGen3D.human.human import Human
 from HumGen3D.human.process.apply_modifiers import apply_modifiers
 from HumGen3D.human.process.process import ProcessSettings
@@ -184,6 +185,8 @@ class HG_OT_PROCESS(bpy.types.Operator):
 
         for callback in temp_depsgraph_callbacks:
             bpy.app.handlers.depsgraph_update_post.append(callback)
+        # Changes made while the callbacks were removed were not tracked
+        clear_checked_hashes()
 
         return {"FINISHED"}
 
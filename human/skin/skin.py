@@ -5,7 +5,6 @@
 from __future__ import annotations
 
 import os
-import random
 import shutil
 import subprocess
 import sys
@@ -16,7 +15,8 @@ import bpy
 from bpy.types import Material, ShaderNode, bpy_prop_collection  # type:ignore
 from HumGen3D.backend import get_prefs, hg_log
 from HumGen3D.common.shadernode import FACTOR_INPUT_NAME, NodeInput
-from HumGen3D.common.type_aliases import C
+from HumGen3D.common.rng import choice, get_rng
+from HumGen3D.common.type_aliases import RNG, C
 from HumGen3D.human.common_baseclasses.pcoll_content import PreviewCollectionContent
 from HumGen3D.user_interface.documentation.feedback_func import ShowMessageBox
 from HumGen3D.common.exceptions import HumGenException
@@ -28,6 +28,9 @@ from ...common.os import correct_presetpath
 if TYPE_CHECKING:
     from ..human import Human
 
+# Values picked from when randomizing freckles, splotches and beard shadow
+SPOT_PROBABILITIES = (0, 0, 0, 0, 0, 0, 0.2, 0.3, 0.5)
+
 
 class MaleSkin:
     """Subclass of human.skin for exposing controls for male specific skin settings."""
@@ -123,8 +126,14 @@ class SkinSettings:
             gender_specific_class = FemaleSkin  # type:ignore[assignment]
         return gender_specific_class(self.nodes)
 
-    def randomize(self) -> None:
-        """Randomize the skin material of the human."""
+    def randomize(self, rng: RNG = None) -> None:
+        """Randomize the skin material of the human.
+
+        Args:
+            rng (RNG): Numpy generator to draw values from, for reproducible results.
+                Defaults to a new randomly seeded generator.
+        """
+        rng = get_rng(rng)
         mat = self.material
         nodes = self.nodes
 
@@ -138,25 +147,25 @@ class SkinSettings:
                 )
                 mat[f"skin_tone_default_{input_idx}"] = default_value  # type:ignore
 
-            new_value = random.uniform(default_value * 0.8, default_value * 1.2)
+            new_value = float(rng.uniform(default_value * 0.8, default_value * 1.2))
             nodes["Skin_tone"].inputs[  # type:ignore
                 input_idx
             ].default_value = new_value
 
-        probability_list = [0, 0, 0, 0, 0, 0, 0.2, 0.3, 0.5]
+        probability_list = SPOT_PROBABILITIES
 
         # Freckles and splotches
         nodes["Freckles_control"].inputs[  # type:ignore
             3
-        ].default_value = random.choice(probability_list)
+        ].default_value = choice(probability_list, rng)
         nodes["Splotches_control"].inputs[  # type:ignore
             3
-        ].default_value = random.choice(  # type:ignore
-            probability_list
+        ].default_value = choice(  # type:ignore
+            probability_list, rng
         )
 
         if self._human.gender == "male":
-            beard_shadow_value = random.choice(probability_list) * 2
+            beard_shadow_value = choice(probability_list, rng) * 2
             nodes["Gender_Group"].inputs[  # type:ignore[index]
                 2
             ].default_value = beard_shadow_value
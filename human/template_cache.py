@@ -0,0 +1,190 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+"""Keeps a prepared base human per gender, so new humans don't re-read HG_HUMAN.blend.
+
+Importing the base human from HG_HUMAN.blend and making it gender specific is slow.
+The first human of each gender is imported and processed as before, after which its
+objects are unlinked from the scene and kept as a hidden template. New humans are
+made by copying the template datablocks and redirecting all pointers to the copies,
+the same way `Human.duplicate` does.
+
+Templates are identified by object name, so they are rebuilt automatically after
+undo or loading another file. They are removed before saving, so they never end up
+in the .blend files of the user.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import bpy
+from bpy.app.handlers import persistent
+from bpy.types import Context, Object
+from HumGen3D.common.collections import add_to_collection
+from HumGen3D.common.type_aliases import GenderStr
+
+if TYPE_CHECKING:
+    from HumGen3D.human.human import Human
+
+TEMPLATE_PREFIX = "HG_TEMPLATE_"
+
+
+class HumanTemplateCache:
+    """Hidden, already gender-processed base humans to copy new humans from."""
+
+    def __init__(self) -> None:
+        self._object_names: dict[str, list[str]] = {}
+
+    def new_human(
+        self,
+        context: Context,
+        gender: GenderStr,
+        import_func: Callable[[Context, GenderStr], "Human"],
+    ) -> "Human":
+        """Get a new human, copied from the template of this gender.
+
+        Args:
+            context (Context): Blender context
+            gender (GenderStr): Gender of the human
+            import_func (Callable[[Context, GenderStr], Human]): Function that imports
+                and prepares a human from HG_HUMAN.blend, used to build the template
+                if it doesn't exist yet.
+
+        Returns:
+            Human: The new human, linked to the scene at the 3D cursor
+        """
+        from HumGen3D.human.human import Human
+
+        template_objs = self._get_template(gender)
+        if template_objs is None:
+            human = import_func(context, gender)
+            template_objs = self._store_template(human, gender)
+
+        rig_copy = _copy_human_objects(template_objs, context)
+        rig_copy.HG.ishuman = True
+        rig_copy.location = context.scene.cursor.location
+
+        return Human(rig_copy)
+
+    def clear(self) -> None:
+        """Remove all templates from Blender."""
+        for names in self._object_names.values():
+            for name in names:
+                obj = bpy.data.objects.get(name)
+                if obj:
+                    _remove_object(obj)
+        self._object_names.clear()
+
+    def _get_template(self, gender: GenderStr) -> Optional[list[Object]]:
+        names = self._object_names.get(gender)
+        if not names:
+            return None
+
+        objs = [bpy.data.objects.get(name) for name in names]
+        if not all(objs):
+            self._object_names.pop(gender)
+            return None
+        return objs  # type:ignore[return-value]
+
+    def _store_template(self, human: "Human", gender: GenderStr) -> list[Object]:
+        rig = human.objects.rig
+        objs = [rig, *rig.children]
+        for obj in objs:
+            for collection in list(obj.users_collection):
+                collection.objects.unlink(obj)
+            obj.use_fake_user = True
+            obj.name = TEMPLATE_PREFIX + obj.name
+
+        rig.HG.ishuman = False
+        self._object_names[gender] = [obj.name for obj in objs]
+        return objs
+
+    def __contains__(self, gender: GenderStr) -> bool:
+        return self._get_template(gender) is not None
+
+
+def _copy_human_objects(template_objs: list[Object], context: Context) -> Object:
+    """Copy the template objects, including everything that's changed per human.
+
+    Args:
+        template_objs (list[Object]): Rig followed by its children
+        context (Context): Blender context
+
+    Returns:
+        Object: The copied rig
+    """
+    id_map: dict[Any, Any] = {}
+    for obj in template_objs:
+        obj_copy = obj.copy()
+        obj_copy.data = obj.data.copy()
+        obj_copy.use_fake_user = False
+        obj_copy.name = obj.name[len(TEMPLATE_PREFIX) :]
+        id_map[obj] = obj_copy
+        id_map[obj.data] = obj_copy.data
+        if getattr(obj.data, "shape_keys", None):
+            id_map[obj.data.shape_keys] = obj_copy.data.shape_keys
+
+        for slot in obj_copy.material_slots:
+            if slot.material:
+                if slot.material not in id_map:
+                    id_map[slot.material] = slot.material.copy()
+                slot.material = id_map[slot.material]
+
+        for psys in obj_copy.particle_systems:
+            if psys.settings not in id_map:
+                id_map[psys.settings] = psys.settings.copy()
+            psys.settings = id_map[psys.settings]
+
+    rig_copy = id_map[template_objs[0]]
+    for obj in template_objs:
+        obj_copy = id_map[obj]
+        if obj.parent in id_map:
+            obj_copy.parent = id_map[obj.parent]
+        _remap_pointers(obj_copy, id_map)
+
+        context.scene.collection.objects.link(obj_copy)
+        add_to_collection(context, obj_copy)
+
+    rig_copy.HG.body_obj = id_map.get(rig_copy.HG.body_obj, rig_copy.HG.body_obj)
+    return rig_copy
+
+
+def _remap_pointers(obj: Object, id_map: dict[Any, Any]) -> None:
+    for mod in obj.modifiers:
+        if getattr(mod, "object", None) in id_map:
+            mod.object = id_map[mod.object]
+
+    if obj.pose:
+        for pose_bone in obj.pose.bones:
+            for constraint in pose_bone.constraints:
+                if getattr(constraint, "target", None) in id_map:
+                    constraint.target = id_map[constraint.target]
+
+    shape_keys = getattr(obj.data, "shape_keys", None)
+    for id_data in (obj, obj.data, shape_keys):
+        if not id_data or not id_data.animation_data:
+            continue
+        for driver in id_data.animation_data.drivers:
+            for var in driver.driver.variables:
+                for target in var.targets:
+                    if target.id in id_map:
+                        target.id = id_map[target.id]
+
+
+def _remove_object(obj: Object) -> None:
+    data = obj.data
+    bpy.data.objects.remove(obj)
+    if data and not data.users:
+        if isinstance(data, bpy.types.Mesh):
+            bpy.data.meshes.remove(data)
+        elif isinstance(data, bpy.types.Armature):
+            bpy.data.armatures.remove(data)
+
+
+@persistent
+def clear_templates_on_save(dummy: Any) -> None:
+    """Handler that removes the templates before the file is saved."""
+    template_cache.clear()
+
+
+template_cache = HumanTemplateCache()  # global cache used by Human.from_preset
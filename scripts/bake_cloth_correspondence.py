@@ -0,0 +1,71 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+# Bakes the cloth-to-body correspondence into the clothing .blend files of the
+# library, so loading them doesn't need to build a KD-tree. Run with the addon enabled:
+#   blender -b --python scripts/bake_cloth_correspondence.py -- [folders]
+# Upgrades the outfits and footwear folders of the HG library if no folders are passed.
+
+import contextlib
+import os
+import sys
+
+import bpy  # type:ignore
+from HumGen3D.backend import get_prefs
+from HumGen3D.human.clothing.correspondence import bake_correspondence
+
+
+def _import_body(hg_folder):
+    blendfile = os.path.join(hg_folder, "models", "HG_HUMAN.blend")
+    with bpy.data.libraries.load(blendfile, link=False) as (_, data_to):
+        data_to.objects = ["HG_Body"]
+
+    body_obj = data_to.objects[0]
+    bpy.context.scene.collection.objects.link(body_obj)
+    body_obj.parent = None
+    body_obj.matrix_world.identity()
+    return body_obj
+
+
+def bake_file(filepath, hg_folder):
+    bpy.ops.wm.open_mainfile(filepath=filepath)
+
+    cloth_objs = [obj for obj in bpy.data.objects if obj.type == "MESH"]
+    if not cloth_objs:
+        return 0
+
+    body_obj = _import_body(hg_folder)
+    for obj in cloth_objs:
+        bake_correspondence(obj, body_obj)
+
+    body_mesh = body_obj.data
+    bpy.data.objects.remove(body_obj)
+    bpy.data.meshes.remove(body_mesh)
+
+    bpy.ops.wm.save_mainfile()
+    with contextlib.suppress(OSError):
+        os.remove(filepath.replace(".blend", ".blend1"))
+
+    return len(cloth_objs)
+
+
+def main():
+    hg_folder = get_prefs().filepath
+
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    folders = argv or [
+        os.path.join(hg_folder, "outfits"),
+        os.path.join(hg_folder, "footwear"),
+    ]
+
+    for folder in folders:
+        for root, _, files in os.walk(folder):
+            for file in files:
+                if not file.endswith(".blend"):
+                    continue
+                filepath = os.path.join(root, file)
+                count = bake_file(filepath, hg_folder)
+                print(f"Baked correspondence of {count} objects in {filepath}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+# Generates humans in parallel background Blender processes. Run with the addon enabled:
+#   blender -b --python scripts/batch_generate.py -- --count 100 --output <folder>
+# See --help for the other options.
+
+import argparse
+import sys
+
+from HumGen3D.batch_generator.generator import BatchHumanGenerator
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="batch_generate.py")
+    parser.add_argument("--count", type=int, required=True)
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--pose-type", default="a_pose")
+    parser.add_argument("--format", choices=("blend", "fbx", "glb"), default="blend")
+    parser.add_argument("--no-clothing", action="store_true")
+    parser.add_argument("--no-hair", action="store_true")
+    parser.add_argument("--no-expression", action="store_true")
+    args = parser.parse_args(argv)
+
+    generator = BatchHumanGenerator(
+        add_clothing=not args.no_clothing,
+        add_hair=not args.no_hair,
+        add_expression=not args.no_expression,
+    )
+
+    def report(finished, total, message):
+        status = message.get("filepath") or message.get("error")
+        print(f"[{finished}/{total}] human {message['index']}: {status}")
+
+    generator.generate_many(
+        args.count,
+        args.output,
+        workers=args.workers,
+        seed=args.seed,
+        pose_type=args.pose_type,
+        export_format=args.format,
+        progress_callback=report,
+    )
+
+
+if __name__ == "__main__":
+    main()
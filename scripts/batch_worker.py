@@ -0,0 +1,21 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+# Background worker started by HumGen3D.batch_generator.workers.run_batch_workers:
+#   blender --background --python scripts/batch_worker.py -- <job file>
+
+import json
+import sys
+
+from HumGen3D.batch_generator.workers import run_worker
+
+
+def main():
+    job_path = sys.argv[sys.argv.index("--") + 1]
+    with open(job_path) as f:
+        job = json.load(f)
+
+    run_worker(job)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+# Compares mesh.from_pydata with Python tuples, the old path of obj_from_pydata,
+# against the numpy builder mesh_from_arrays, on a haircard-like strip mesh.
+# Run with the addon enabled:
+#   blender -b --python scripts/benchmark_mesh_construction.py -- [quad count]
+
+import sys
+import time
+
+import bpy
+import numpy as np
+from HumGen3D.common.geometry import mesh_from_arrays
+
+VERTS_PER_SIDE = 8
+
+
+def strip_mesh_data(quad_count: int) -> tuple[np.ndarray, np.ndarray]:
+    strip_count = max(1, quad_count // (VERTS_PER_SIDE - 1))
+    segment = np.arange(VERTS_PER_SIDE - 1)
+    segment_faces = np.stack(
+        (
+            VERTS_PER_SIDE * 2 - segment - 1,
+            VERTS_PER_SIDE * 2 - segment - 2,
+            segment + 1,
+            segment,
+        ),
+        axis=-1,
+    )
+    offsets = np.arange(strip_count) * VERTS_PER_SIDE * 2
+    faces = (offsets[:, None, None] + segment_faces[None]).reshape((-1, 4))
+    verts = np.random.default_rng(0).random((strip_count * VERTS_PER_SIDE * 2, 3))
+    return verts, faces
+
+
+def from_pydata_with_tuples(verts: np.ndarray, faces: np.ndarray) -> bpy.types.Mesh:
+    mesh = bpy.data.meshes.new(name="benchmark_pydata")
+    mesh.from_pydata([tuple(co) for co in verts], [], [tuple(f) for f in faces])
+    mesh.update()
+    for f in mesh.polygons:
+        f.use_smooth = True
+    return mesh
+
+
+def timed(func, *args):  # noqa
+    start = time.perf_counter()
+    mesh = func(*args)
+    duration = time.perf_counter() - start
+    return mesh, duration
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    quad_count = int(argv[0]) if argv else 300_000
+
+    verts, faces = strip_mesh_data(quad_count)
+    print(f"Building {len(faces)} quads from {len(verts)} vertices")
+
+    old_mesh, old_time = timed(from_pydata_with_tuples, verts, faces)
+    new_mesh, new_time = timed(mesh_from_arrays, "benchmark_arrays", verts, faces)
+
+    assert len(old_mesh.polygons) == len(new_mesh.polygons)
+    assert len(old_mesh.edges) == len(new_mesh.edges)
+
+    print(f"from_pydata with tuples: {old_time:.3f}s")
+    print(f"mesh_from_arrays:        {new_time:.3f}s ({old_time / new_time:.1f}x)")
+
+    bpy.data.meshes.remove(old_mesh)
+    bpy.data.meshes.remove(new_mesh)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+# Merges the loose .npz livekeys of installed content packs into .hglk livekey packs.
+# Run with the addon enabled:
+#   blender -b --python scripts/pack_livekeys.py -- [content pack .json names]
+# Packs all installed content packs containing livekeys if no names are passed.
+
+import os
+import sys
+
+from HumGen3D.backend import get_prefs
+from HumGen3D.human.keys.livekey_pack import pack_content_pack
+
+
+def main():
+    hg_folder = get_prefs().filepath
+    json_folder = os.path.join(hg_folder, "content_packs")
+
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    json_files = argv or [f for f in os.listdir(json_folder) if f.endswith(".json")]
+
+    for json_file in json_files:
+        pack_path = pack_content_pack(hg_folder, os.path.join(json_folder, json_file))
+        if pack_path:
+            print(f"Packed livekeys of {json_file} into {pack_path}")
+
+
+if __name__ == "__main__":
+    main()
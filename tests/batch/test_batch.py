@@ -1,7 +1,17 @@
+import os
+
+import bpy
+
 from HumGen3D.human.human import Human
 from HumGen3D.tests.test_fixtures import *
 import pytest
+from HumGen3D.batch import read_jsonl, write_jsonl
 from HumGen3D.batch_generator.generator import BatchHumanGenerator
+from HumGen3D.batch_generator.workers import (
+    apply_generator_settings,
+    generator_settings,
+    run_worker,
+)
 
 
 @pytest.mark.parametrize("gender", ["male", "female"])
@@ -79,3 +89,110 @@ def test_batch_texture_resolution(resolution, context):
     generator.texture_resolution = resolution
     generated_human = generator.generate_human(context)
     assert resolution_names[resolution] in generated_human.skin.texture._active.lower()
+
+
+def test_batch_worker(tmp_path, context):
+    generator = BatchHumanGenerator(add_hair=False)
+    generator.texture_resolution = "low"
+    settings = generator_settings(generator)
+
+    other_generator = BatchHumanGenerator()
+    apply_generator_settings(other_generator, settings)
+    assert generator_settings(other_generator) == settings
+
+    job = {
+        "settings": settings,
+        "indices": [0],
+        "seed": 10,
+        "pose_type": "a_pose",
+        "export_format": "blend",
+        "output_folder": str(tmp_path),
+    }
+    run_worker(job)
+    assert os.path.isfile(os.path.join(tmp_path, "human_00000.blend"))
+
+
+def test_batch_worker_cleans_up_failed_export(tmp_path, context):
+    generator = BatchHumanGenerator(add_hair=False, add_clothing=False)
+    job = {
+        "settings": generator_settings(generator),
+        "indices": [0],
+        "seed": 10,
+        "pose_type": "a_pose",
+        "export_format": "unknown",
+        "output_folder": str(tmp_path),
+    }
+    object_count = len(bpy.data.objects)
+    run_worker(job)
+    assert not os.listdir(tmp_path)
+    assert len(bpy.data.objects) == object_count
+
+
+def test_batch_seed(context):
+    generator = BatchHumanGenerator(add_hair=False, seed=42)
+    first_human = generator.generate_human(context)
+    first_human.delete()
+    second_human = generator.generate_human(context)
+    second_human.delete()
+    first_record, second_record = generator.manifest
+    assert (first_record["seed"], second_record["seed"]) == (42, 43)
+
+    other_generator = BatchHumanGenerator(add_hair=False)
+    human = other_generator.generate_human(context, seed=42)
+    record = other_generator.manifest[0]
+    for name in ("gender", "preset", "height", "clothing", "expression", "keys"):
+        assert record[name] == first_record[name]
+    assert human.height.centimeters == pytest.approx(record["height"]["set"], abs=1)
+
+
+def test_batch_specs(tmp_path, context):
+    generator = BatchHumanGenerator(seed=7)
+    specs = list(generator.iter_specs(3, pose_type="t_pose"))
+    assert [spec["seed"] for spec in specs] == [7, 8, 9]
+    assert list(BatchHumanGenerator(seed=7).iter_specs(3, "t_pose")) == specs
+
+    path = os.path.join(tmp_path, "specs.jsonl")
+    assert write_jsonl(path, iter(specs)) == 3
+    read_specs = list(read_jsonl(path))
+    assert [spec["preset"] for spec in read_specs] == [s["preset"] for s in specs]
+
+    spec = read_specs[0]
+    human = Human.from_spec(spec, context)
+    assert human.gender == spec["gender"]
+    assert human._active == spec["preset"]
+    assert human.height.centimeters == pytest.approx(spec["height"]["set"], abs=1)
+    assert human.clothing.outfit.objects
+    assert "t_pose" in human.pose._active.lower()
+
+
+def test_batch_specs_respect_locks(context):
+    livekeys = context.window_manager.livekeys
+    locks = context.scene.HG3D.locks
+    subcategory = next(
+        key.subcategory
+        for key in livekeys
+        if key.category == "face_proportions" and hasattr(locks, key.subcategory)
+    )
+    locked_names = {key.name for key in livekeys if key.subcategory == subcategory}
+
+    setattr(locks, subcategory, True)
+    try:
+        for spec in BatchHumanGenerator(seed=3).iter_specs(2):
+            assert not locked_names & set(spec["keys"])
+    finally:
+        setattr(locks, subcategory, False)
+
+
+def test_batch_human_matches_spec(context):
+    spec = next(BatchHumanGenerator(add_hair=False, seed=5).iter_specs(1))
+
+    generator = BatchHumanGenerator(add_hair=False, seed=5)
+    human = generator.generate_human(context)
+    record = generator.manifest[0]
+    for name in ("seed", "gender", "preset", "height", "expression"):
+        assert record.get(name) == spec.get(name)
+    assert human.gender == spec["gender"]
+    assert human.height.centimeters == pytest.approx(spec["height"]["set"], abs=1)
+    for name, value in spec["keys"].items():
+        assert record["keys"][name] == pytest.approx(value, abs=1e-3)
+    human.delete()
@@ -0,0 +1,33 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+import bpy
+import numpy as np
+import pytest
+from HumGen3D.common.geometry import mesh_from_arrays
+
+
+@pytest.mark.parametrize("as_array", [True, False])
+def test_mesh_from_arrays(as_array):
+    verts = np.array(
+        [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0], [3, 3, 3]]
+    )
+    faces = [[0, 1, 2, 3], [1, 4, 5, 2]]
+    if as_array:
+        faces = np.array(faces)
+    else:
+        faces.append([4, 6, 5])
+
+    mesh = mesh_from_arrays("test_mesh", verts, edges=[[0, 6]], faces=faces)
+    try:
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        assert np.allclose(coords.reshape((-1, 3)), verts)
+
+        assert [list(poly.vertices) for poly in mesh.polygons] == [
+            list(face) for face in faces
+        ]
+        assert all(poly.use_smooth for poly in mesh.polygons)
+        assert (0, 6) in {tuple(sorted(edge.vertices)) for edge in mesh.edges}
+        assert not mesh.validate()
+    finally:
+        bpy.data.meshes.remove(mesh)
@@ -0,0 +1,44 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+import bpy
+import numpy as np
+from HumGen3D.common.geometry import hash_mesh_object, mesh_from_arrays
+from HumGen3D.common.hashing import ContentHasher
+
+
+def _digest(array, decimals=None):
+    hasher = ContentHasher()
+    hasher.update_array(array, decimals)
+    return hasher.intdigest()
+
+
+def test_content_hasher_arrays():
+    coords = np.random.default_rng(0).random((20, 3))
+
+    assert _digest(coords) == _digest(coords.copy())
+    assert _digest(coords) != _digest(coords.reshape((30, 2)))
+    assert _digest(coords, decimals=3) == _digest(coords + 1e-6, decimals=3)
+    assert _digest(coords, decimals=3) != _digest(coords + 1e-2, decimals=3)
+    assert _digest(np.array([0.0]), decimals=2) == _digest(np.array([-0.0]), 2)
+
+    hasher_a, hasher_b = ContentHasher(), ContentHasher()
+    hasher_a.update_text("ab", "c")
+    hasher_b.update_text("a", "bc")
+    assert hasher_a.intdigest() != hasher_b.intdigest()
+
+
+def test_hash_mesh_object_shape_keys():
+    verts = np.random.default_rng(0).random((10, 3))
+    mesh = mesh_from_arrays("test_hash_mesh", verts, edges=[], faces=[])
+    obj = bpy.data.objects.new("test_hash_obj", mesh)
+    try:
+        obj.shape_key_add(name="Basis")
+        key = obj.shape_key_add(name="key")
+        hash_before = hash_mesh_object(obj)
+        assert hash_mesh_object(obj) == hash_before
+
+        key.data[3].co.x += 1
+        assert hash_mesh_object(obj) != hash_before
+    finally:
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
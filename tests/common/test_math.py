@@ -0,0 +1,43 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+import numpy as np
+import pytest
+from HumGen3D.common.math import NearestNeighbors, cKDTree
+
+
+@pytest.mark.parametrize("backend", ["mathutils", "scipy"])
+@pytest.mark.parametrize("k", [1, 4])
+def test_nearest_neighbors(backend, k):
+    if backend == "scipy" and cKDTree is None:
+        pytest.skip("SciPy not installed")
+
+    rng = np.random.default_rng(0)
+    points = rng.random((2000, 3))
+    queries = np.vstack((rng.random((500, 3)), [[10, 10, 10]]))
+
+    idxs, distances = NearestNeighbors(points, backend).query(queries, k)
+
+    all_distances = np.linalg.norm(queries[:, None] - points[None], axis=2)
+    expected_idxs = np.argsort(all_distances, axis=1)[:, :k]
+    expected_distances = np.take_along_axis(all_distances, expected_idxs, axis=1)
+    if k == 1:
+        expected_idxs = expected_idxs[:, 0]
+        expected_distances = expected_distances[:, 0]
+
+    assert np.array_equal(idxs, expected_idxs)
+    assert np.allclose(distances, expected_distances)
+
+
+@pytest.mark.parametrize("backend", ["mathutils", "scipy"])
+def test_nearest_neighbors_find(backend):
+    if backend == "scipy" and cKDTree is None:
+        pytest.skip("SciPy not installed")
+
+    points = np.random.default_rng(0).random((100, 3))
+    nn = NearestNeighbors(points, backend)
+    expected_idx = int(np.argmin(np.linalg.norm(points - 0.5, axis=1)))
+
+    co, idx, dist = nn.find((0.5, 0.5, 0.5))
+    assert idx == expected_idx
+    assert np.isclose(dist, np.linalg.norm(points[expected_idx] - 0.5))
+    assert [found[1] for found in nn.find_n((0.5, 0.5, 0.5), 1)] == [expected_idx]
@@ -0,0 +1,34 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+import bpy
+import numpy as np
+from HumGen3D.common.geometry import mesh_from_arrays
+from HumGen3D.common.vertex_groups import (
+    read_vertex_group_weights,
+    write_vertex_group_weights,
+)
+
+
+def test_vertex_group_weights_round_trip():
+    verts = np.random.default_rng(0).random((10, 3))
+    mesh = mesh_from_arrays("test_vg_mesh", verts, edges=[], faces=[])
+    obj = bpy.data.objects.new("test_vg_obj", mesh)
+    try:
+        weights = np.array([0, 0.5, 0.5, 1, 0, 0.25, 0.5, 0, 1, 0.75])
+        vg_a = obj.vertex_groups.new(name="a")
+        vg_b = obj.vertex_groups.new(name="b")
+        obj.vertex_groups.new(name="unused")
+
+        assert write_vertex_group_weights(vg_a, weights) == 4
+        vg_b.add([2, 4], 0.3, "REPLACE")
+
+        result = read_vertex_group_weights(obj, [vg_a, "b"])
+        assert result.shape == (10, 2)
+        assert np.allclose(result[:, 0], weights)
+        assert np.allclose(result[:, 1], [0, 0, 0.3, 0, 0.3, 0, 0, 0, 0, 0])
+
+        # Vertices with a weight of 0 are not added to the group at all
+        assert [v.index for v in mesh.vertices if v.groups] == [1, 2, 3, 4, 5, 6, 8, 9]
+    finally:
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
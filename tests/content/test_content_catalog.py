@@ -0,0 +1,54 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+import os
+
+from HumGen3D.backend.content_catalog import CATALOG_NAME, ContentCatalog
+
+
+def _walk_result(walker):
+    return sorted((root, sorted(dirs), sorted(files)) for root, dirs, files in walker)
+
+
+def test_content_catalog(tmp_path):
+    for relpath in (
+        "hair/head/male/Short/a.json",
+        "hair/head/male/b.json",
+        "poses/c.blend",
+    ):
+        (tmp_path / relpath).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relpath).touch()
+
+    hair_folder = str(tmp_path / "hair")
+    catalog = ContentCatalog(str(tmp_path))
+    assert _walk_result(catalog.walk(hair_folder)) == _walk_result(os.walk(hair_folder))
+    assert (tmp_path / CATALOG_NAME).exists()
+
+    # A new catalog reads the index from disk and only lists changed folders again
+    (tmp_path / "hair/head/male/d.json").touch()
+    catalog = ContentCatalog(str(tmp_path))
+    assert _walk_result(catalog.walk(hair_folder)) == _walk_result(os.walk(hair_folder))
+    assert catalog.listdir(str(tmp_path / "hair/head/male")) == [
+        "Short",
+        "b.json",
+        "d.json",
+    ]
+    assert catalog.listdir(str(tmp_path / "missing")) is None
+
+
+def test_content_catalog_concurrent_saves(tmp_path):
+    (tmp_path / "poses").mkdir()
+    (tmp_path / "poses" / "a.blend").touch()
+
+    # Two processes on the same content folder, each with its own catalog
+    catalogs = [ContentCatalog(str(tmp_path)) for _ in range(2)]
+    for catalog in catalogs:
+        catalog.listdir(str(tmp_path / "poses"))
+    for catalog in catalogs:
+        catalog._changed = True
+        catalog.save()
+        assert catalog._writable
+
+    assert sorted(os.listdir(tmp_path)) == [CATALOG_NAME, "poses"]
+    assert ContentCatalog(str(tmp_path)).listdir(str(tmp_path / "poses")) == [
+        "a.blend"
+    ]
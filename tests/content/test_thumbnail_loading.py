@@ -0,0 +1,22 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+
+# flake8:noqa: F811
+
+from HumGen3D.backend.preview_collections import preview_collections, thumbnail_loader
+from HumGen3D.tests.test_fixtures import *
+
+
+def test_lazy_thumbnails(context):
+    pcoll = preview_collections["outfit"]
+    pcoll.pcoll.clear()
+    pcoll.populate(context, "male")
+
+    enum = pcoll.pcoll["outfit"]
+    placeholder_icon = enum[0][3]
+    assert len(enum) > 1
+    assert all(item[3] == placeholder_icon for item in enum[1:])
+
+    while thumbnail_loader.tick() is not None:
+        pass
+
+    assert all(item[3] != placeholder_icon for item in pcoll.pcoll["outfit"][1:])
@@ -4,12 +4,28 @@
 import os
 
 import bpy
+import numpy as np
 import pytest  # type:ignore
 from pytest_lazyfixture import lazy_fixture
 from HumGen3D.backend.preferences.preference_func import get_prefs
 from HumGen3D.common.exceptions import HumGenException
-from HumGen3D.common.geometry import hash_mesh_object
+from HumGen3D.common.geometry import (
+    build_distance_dict,
+    deform_obj_from_difference,
+    hash_mesh_object,
+    matrix_multiplication,
+    world_coords_from_obj,
+)
 from HumGen3D.common.objects import import_objects_to_scene_collection
+from HumGen3D.human.clothing.correspondence import (
+    HASH_PROPERTY,
+    bake_correspondence,
+    body_rest_coords,
+    cloth_to_body_matrix,
+    correspondence_hash,
+    get_cloth_correspondence,
+    read_correspondence,
+)
 from HumGen3D.tests.test_fixtures import *
 from HumGen3D.tests.test_fixtures import (
     ALL_HUMAN_FIXTURES,
@@ -57,6 +73,113 @@ def test_add_obj(human):
     assert hash_mesh_object(test_cloth_obj) == hash_mesh_object(reference_cloth_obj)
 
 
+@pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
+def test_deform_obj_from_difference(human):
+    body_coords = world_coords_from_obj(human.objects.body)
+    target_obj = human.objects.eyes.copy()
+    target_obj.data = target_obj.data.copy()
+    target_coords = world_coords_from_obj(target_obj)
+
+    body_idxs, offsets = build_distance_dict(body_coords, target_coords)
+    assert body_idxs.shape == (len(target_coords),)
+    assert offsets.shape == target_coords.shape
+
+    deform_obj_from_difference(
+        "test_deform", (body_idxs, offsets), body_coords + (0, 0, 1), target_obj, True
+    )
+    sk = target_obj.data.shape_keys.key_blocks["test_deform"]
+    deformed_coords = world_coords_from_obj(target_obj, data=sk.data)
+    assert np.allclose(deformed_coords, target_coords + (0, 0, 1), atol=1e-4)
+
+    mesh = target_obj.data
+    bpy.data.objects.remove(target_obj)
+    bpy.data.meshes.remove(mesh)
+
+
+@pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
+def test_cloth_correspondence(human, context):
+    options = human.clothing.outfit.get_options(context)
+    human.clothing.outfit.set(options[1], context)
+
+    body_obj = human.objects.body
+    for obj in human.clothing.outfit.objects:
+        assert HASH_PROPERTY.format(human.gender) in obj.data
+        body_idxs, offsets = get_cloth_correspondence(obj, body_obj, human.gender)
+        assert len(body_idxs) == len(offsets) == len(obj.data.vertices)
+
+    old_hashes = {
+        obj.name: obj.data[HASH_PROPERTY.format(human.gender)]
+        for obj in human.clothing.outfit.objects
+    }
+    human.keys.update_human_from_key_change(context)
+    for obj in human.clothing.outfit.objects:
+        assert obj.data[HASH_PROPERTY.format(human.gender)] == old_hashes[obj.name]
+
+
+@pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
+def test_cloth_correspondence_validation(human, context):
+    options = human.clothing.outfit.get_options(context)
+    human.clothing.outfit.set(options[1], context)
+
+    body_obj = human.objects.body
+    obj = human.clothing.outfit.objects[0]
+    coords_hash = correspondence_hash(obj.data, len(body_obj.data.vertices))
+    body_matrix = cloth_to_body_matrix(obj, body_obj)
+    assert read_correspondence(obj.data, human.gender, coords_hash, body_matrix)
+
+    # Float noise in the placement doesn't matter, moving the cloth does
+    nudged = body_matrix.copy()
+    nudged[3] += 1e-7
+    assert read_correspondence(obj.data, human.gender, coords_hash, nudged)
+    nudged[3] += 0.1
+    assert not read_correspondence(obj.data, human.gender, coords_hash, nudged)
+
+    obj.data.vertices[0].co.x += 1e-4
+    new_hash = correspondence_hash(obj.data, len(body_obj.data.vertices))
+    assert new_hash != coords_hash
+    assert not read_correspondence(obj.data, human.gender, new_hash, body_matrix)
+    obj.data.vertices[0].co.x -= 1e-4
+
+
+@pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
+def test_opposite_gender_bake_matches_rebuild(human, context):
+    options = human.clothing.outfit.get_options(context)
+    human.clothing.outfit.set(options[1], context)
+
+    body_obj = human.objects.body
+    gender = "female" if human.gender == "male" else "male"
+    obj = human.clothing.outfit.objects[0]
+    obj_copy = obj.copy()
+    obj_copy.data = obj.data.copy()
+    context.collection.objects.link(obj_copy)
+    try:
+        # Same steps as saving the cloth for the opposite gender
+        distance_dict = build_distance_dict(
+            human.keys.evaluated_coords(local=False), world_coords_from_obj(obj)
+        )
+        rest_coords_world = matrix_multiplication(
+            body_obj.matrix_world, body_rest_coords(body_obj, gender)
+        )
+        deform_obj_from_difference(
+            "Opposite gender",
+            distance_dict,
+            rest_coords_world,
+            obj_copy,
+            as_shapekey=True,
+        )
+        bake_correspondence(obj_copy, body_obj, genders=(gender,))
+        baked_idxs, baked_offsets = get_cloth_correspondence(obj_copy, body_obj, gender)
+
+        del obj_copy.data[HASH_PROPERTY.format(gender)]
+        idxs, offsets = get_cloth_correspondence(obj_copy, body_obj, gender)
+        assert np.array_equal(baked_idxs, idxs)
+        assert np.array_equal(baked_offsets, offsets)
+    finally:
+        mesh = obj_copy.data
+        bpy.data.objects.remove(obj_copy)
+        bpy.data.meshes.remove(mesh)
+
+
 @pytest.fixture(scope="class")
 def human_with_outfit(male_human):
     options = male_human.clothing.outfit.get_options(bpy.context)
@@ -1,4 +1,7 @@
+import numpy as np
 import pytest
+from HumGen3D.human.hair.haircards import HairCollection
+from HumGen3D.human.hair.import_cache import hair_import_cache
 from HumGen3D.tests.test_fixtures import *
 
 @pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
@@ -10,4 +13,31 @@ def test_hair(human, context):
 
     assert (
         hash(human.hair) != hash_before
-    ), f"Hash is the same after setting {chosen_hair=}"
\ No newline at end of file
+    ), f"Hash is the same after setting {chosen_hair=}"
+
+@pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
+def test_hair_import_cache(human, context):
+    hair_import_cache.clear()
+    chosen_hair = human.hair.regular_hair.get_options(context)[3]
+
+    human.hair.regular_hair.set(chosen_hair, context)
+    ps_count = len(human.hair.regular_hair.particle_systems)
+    hash_first = hash(human.hair)
+    assert len(hair_import_cache) == 1
+
+    human.hair.regular_hair.set(chosen_hair, context)
+    assert len(hair_import_cache) == 1
+    assert len(human.hair.regular_hair.particle_systems) == ps_count
+    assert hash(human.hair) == hash_first
+
+    human.hair.regular_hair.clear_cache()
+    assert not len(hair_import_cache)
+
+
+def test_haircard_faces():
+    hair_coords = np.zeros((2, 3, 3))
+    faces, faces_parallel = HairCollection._compute_new_face_vert_idxs(3, hair_coords)
+    assert faces.shape == (2, 2, 4)
+    assert faces[0].tolist() == [[5, 4, 1, 0], [4, 3, 2, 1]]
+    assert faces[1].tolist() == [[11, 10, 7, 6], [10, 9, 8, 7]]
+    assert (faces_parallel == faces).all()
@@ -4,7 +4,10 @@
 import bpy
 import pytest  # type:ignore
 from HumGen3D import Human
+from HumGen3D.backend import preview_collections
+from HumGen3D.backend.callback import hg_callback
 from HumGen3D.common.exceptions import HumGenException
+from HumGen3D.human.template_cache import template_cache
 from HumGen3D.tests.test_fixtures import *
 
 
@@ -151,3 +154,54 @@ def test_from_existing_fail():
     non_mesh = bpy.data.objects.new("Camera", cam)
     bpy.context.scene.collection.objects.link(non_mesh)
     assert_failure(non_mesh)
+
+
+@pytest.mark.parametrize("gender", ["male", "female"])
+def test_template_cache(gender, context):
+    preset = Human.get_preset_options(gender, context=context)[0]
+    human = Human.from_preset(preset, context)
+    assert gender in template_cache
+
+    other_human = Human.from_preset(preset, context)
+    assert other_human.objects.body.data != human.objects.body.data
+    assert other_human.objects.body.data.materials[0] != (
+        human.objects.body.data.materials[0]
+    )
+    assert other_human.objects.body.parent == other_human.objects.rig
+    for mod in other_human.objects.body.modifiers:
+        if mod.type == "ARMATURE":
+            assert mod.object == other_human.objects.rig
+
+    human.delete()
+    other_human.delete()
+
+
+@pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
+def test_callback_skips_same_refresh(human, context):
+    context.view_layer.objects.active = human.objects.rig
+    context.scene.HG3D.ui.phase = "clothing"
+
+    hg_callback(None)
+    populate_count = preview_collections["outfit"].populate_count
+    hg_callback(None)
+    assert preview_collections["outfit"].populate_count == populate_count
+
+    human.clothing.outfit.refresh_pcoll(context)
+    hg_callback(None)
+    assert preview_collections["outfit"].populate_count == populate_count + 2
+
+
+@pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
+def test_setters_work_after_skipped_callback(human, context):
+    context.view_layer.objects.active = human.objects.rig
+    context.scene.HG3D.ui.phase = "clothing"
+
+    hg_callback(None)
+    populate_count = preview_collections["outfit"].populate_count
+    hg_callback(None)
+    assert preview_collections["outfit"].populate_count == populate_count
+    assert not context.scene.HG3D.update_exception
+
+    height_before = human.height.centimeters
+    human.height.set(height_before + 10, context)
+    assert human.height.centimeters != height_before
@@ -0,0 +1,166 @@
+# Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
+# flake8: noqa F811
+
+import os
+
+import numpy as np
+import pytest
+from HumGen3D.human.keys.livekey_cache import livekey_cache
+from HumGen3D.human.keys.livekey_pack import (
+    PACK_EXTENSION,
+    LiveKeyPackRegistry,
+    write_livekey_pack,
+)
+from HumGen3D.tests.test_fixtures import *
+
+
+@pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
+def test_livekey_cache(human, context):
+    key = human.body.keys[0]
+    livekey_cache.invalidate()
+
+    key.set_without_update(0.3)
+    assert livekey_cache.stats["misses"] >= 1
+    hits_before = livekey_cache.stats["hits"]
+
+    key.set_without_update(0.6)
+    assert livekey_cache.stats["hits"] == hits_before + 1
+    assert pytest.approx(key.value) == 0.6
+
+    key.set_without_update(0)
+    human.keys.update_human_from_key_change(context)
+
+
+@pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
+def test_set_many(human, context):
+    keys = human.face.keys[:5]
+    values = {key.name: 0.1 * (i + 1) for i, key in enumerate(keys)}
+
+    not_found = human.keys.set_many({**values, "non_existent_key": 1.0})
+    assert not_found == ["non_existent_key"]
+    for key in keys:
+        assert pytest.approx(key.value) == values[key.name]
+
+    human.keys.set_many({name: 0 for name in values})
+    human.keys.update_human_from_key_change(context)
+    assert all(key.value == 0 for key in keys)
+
+
+def test_livekey_pack(tmp_path):
+    hg_folder = str(tmp_path)
+    livekey_folder = os.path.join(hg_folder, "livekeys", "face_proportions", "chin")
+    os.makedirs(livekey_folder)
+
+    relative_coordinates = np.zeros(300)
+    relative_coordinates[[3, 50, 299]] = (0.1, -0.2, 0.3)
+    changed_idxs = np.nonzero(relative_coordinates)
+    np.savez(
+        os.path.join(livekey_folder, "male_chin_size"),
+        indices=changed_idxs,
+        relative_coordinates=relative_coordinates[changed_idxs],
+    )
+
+    path = os.path.join("livekeys", "face_proportions", "chin", "male_chin_size.npz")
+    pack_path = os.path.join(hg_folder, "livekeys", "test" + PACK_EXTENSION)
+    assert write_livekey_pack(pack_path, hg_folder, [path]) == 1
+
+    registry = LiveKeyPackRegistry()
+    registry.load(hg_folder)
+    indices, packed_coordinates = registry.get(path)
+    assert list(indices) == [3, 50, 299]
+    assert np.allclose(packed_coordinates, (0.1, -0.2, 0.3))
+
+    (_, entry), *_ = registry.items()
+    assert (entry["name"], entry["gender"]) == ("chin_size", "male")
+    assert (entry["category"], entry["subcategory"]) == ("face_proportions", "chin")
+
+    registry.discard(path)
+    assert registry.get(path) is None
+
+
+@pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
+def test_key_index_invalidation(human):
+    assert "test_index_key" not in [key.name for key in human.keys]
+
+    sk = human.keys.add_shapekey("test_index_key")
+    assert human.keys["test_index_key"].as_bpy() == sk
+
+    sk.name = "test_index_key_renamed"
+    assert human.keys.get("test_index_key") is None
+    assert human.keys.get("test_index_key_renamed")
+
+    human.keys.remove_shapekey(sk)
+    assert human.keys.get("test_index_key_renamed") is None
+
+
+@pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
+def test_key_index_with_empty_livekey_collection(human, context):
+    livekey_count = len(human.keys.all_livekeys)
+    context.window_manager.livekeys.clear()
+
+    # The collection is filled again before the index is built
+    assert len(human.keys.all_livekeys) == livekey_count
+
+
+@pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
+def test_evaluated_coords(human, context):
+    from HumGen3D.common.geometry import world_coords_from_obj
+
+    body = human.objects.body
+    for local in (True, False):
+        expected = world_coords_from_obj(
+            body, data=human.keys.all_deformation_shapekeys, local=local
+        )
+        coords = human.keys.evaluated_coords(local=local)
+        assert np.allclose(coords, expected, atol=1e-5)
+        assert human.keys.evaluated_coords(local=local) is coords
+        assert not coords.flags.writeable
+
+    coords_before = human.keys.evaluated_coords()
+    key = human.body.keys[0]
+    key.set_without_update(0.5)
+    assert human.keys.evaluated_coords() is not coords_before
+    assert np.allclose(
+        human.keys.evaluated_coords(),
+        world_coords_from_obj(
+            body, data=human.keys.all_deformation_shapekeys, local=True
+        ),
+        atol=1e-5,
+    )
+
+    key.set_without_update(0)
+    human.keys.update_human_from_key_change(context)
+
+
+@pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
+def test_evaluated_coords_invalidation(human, context):
+    from HumGen3D.human.keys.keys import invalidate_coords_on_undo
+
+    body = human.objects.body
+    base_coords = human.keys.evaluated_coords(key_names=())
+    vertex_count = len(body.data.vertices)
+    expected = np.empty(vertex_count * 3, dtype=np.float64)
+    body.data.vertices.foreach_get("co", expected)
+    assert np.allclose(base_coords, expected.reshape((-1, 3)))
+
+    # Writes outside the add-on, like undo, need the handler to drop the cache
+    key_block = body.data.shape_keys.key_blocks[human.keys.permanent_key.name]
+    key_block.data[0].co.x += 1
+    invalidate_coords_on_undo(None)
+    coords = human.keys.evaluated_coords(key_names=[key_block.name])
+    assert np.isclose(coords[0, 0], key_block.data[0].co.x, atol=1e-5)
+
+    key_block.data[0].co.x -= 1
+    invalidate_coords_on_undo(None)
+
+
+def test_update_livekey_collection_from_catalog(context):
+    from HumGen3D.human.keys.keys import update_livekey_collection
+
+    update_livekey_collection()
+    paths = sorted(item.path for item in context.window_manager.livekeys)
+    assert paths
+
+    # The second listing comes from the content catalog and must be identical
+    update_livekey_collection()
+    assert sorted(item.path for item in context.window_manager.livekeys) == paths
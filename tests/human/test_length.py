@@ -1,6 +1,7 @@
 # Copyright (c) 2022 Oliver J. Post & Alexander Lashko - GNU GPL V3.0, see LICENSE
 # flake8: noqa F811
 
+import numpy as np
 import pytest
 from HumGen3D.tests.test_fixtures import *
 
@@ -19,3 +20,26 @@ def test_length(human, context):
     # assert human.creation_phase.length.centimeters == new_length_cm
 
     human.height.set(old_height, context)
+
+
+@pytest.mark.parametrize("human", ALL_HUMAN_FIXTURES)
+def test_armature_fitting(human, context):
+    from HumGen3D.human.height.height import get_bone_vertex_map
+
+    human.height.set(190, context)
+    rig = human.objects.rig
+    bone_map = get_bone_vertex_map(rig)
+    assert len(bone_map.bone_names)
+
+    body_coords, permanent_coords, temp_coords = (
+        np.empty(len(human.objects.body.data.vertices) * 3) for _ in range(3)
+    )
+    human.objects.body.data.vertices.foreach_get("co", body_coords)
+    human.keys.permanent_key.data.foreach_get("co", permanent_coords)
+    human.keys.temp_key.data.foreach_get("co", temp_coords)
+    coords = (temp_coords - body_coords) * human.keys.temp_key.value + permanent_coords
+    heads, tails = bone_map.fitted_coords(coords.reshape((-1, 3)))
+    current_heads, current_tails = bone_map.current_coords(rig)
+    assert np.allclose(heads, current_heads, atol=1e-4)
+    assert np.allclose(tails, current_tails, atol=1e-4)
+    assert context.object is None or context.object.mode == "OBJECT"
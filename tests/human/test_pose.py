@@ -2,6 +2,7 @@
 # flake8:noqa: F811
 import bpy
 import pytest
+from HumGen3D.human.content_changes import content_hash, get_generation
 from HumGen3D.tests.test_fixtures import *
 
 
@@ -29,6 +30,26 @@ def test_pose_hash(male_human, context):
     assert hash_before != hash(male_human.pose)
 
 
+def test_pose_generation(male_human, context):
+    rig = male_human.objects.rig
+    generation_before = get_generation(rig, "pose")
+    male_human.pose.set(male_human.pose.get_options(context)[3], context)
+    assert get_generation(rig, "pose") == generation_before + 1
+
+    stored_hash = male_human.props.hashes["$pose"]
+    assert content_hash(rig, "pose", male_human.pose) == stored_hash
+
+    # Manual changes in pose mode are found through the depsgraph, not through the
+    # generation
+    context.view_layer.objects.active = rig
+    bpy.ops.object.mode_set(mode="POSE")
+    rig.pose.bones.get("spine").rotation_euler = (125, 123, 76)
+    context.view_layer.update()
+    bpy.ops.object.mode_set(mode="OBJECT")
+    assert get_generation(rig, "pose") == generation_before + 1
+    assert content_hash(rig, "pose", male_human.pose) != stored_hash
+
+
 def test_rigify(male_human, context):
     old_rig_name = male_human.objects.rig.name
     male_human.pose.rigify.generate(context=context)
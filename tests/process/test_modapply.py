@@ -2,9 +2,15 @@
 # flake8:noqa: F811
 
 import bpy
+import numpy as np
 import pytest
 
-from HumGen3D.human.process.apply_modifiers import apply_modifiers, refresh_modapply
+from HumGen3D.common.geometry import mesh_from_arrays
+from HumGen3D.human.process.apply_modifiers import (
+    apply_modifiers,
+    quick_apply_modifiers,
+    refresh_modapply,
+)
 from HumGen3D.tests.test_fixtures import *
 
 
@@ -20,3 +26,41 @@ def test_armature_apply(human, context):
             item.enabled = True
             break
     apply_modifiers(human, context=context)
+
+
+def test_quick_apply_modifiers(context):
+    verts = np.random.default_rng(0).random((10, 3))
+    mesh = mesh_from_arrays("test_modapply_mesh", verts, edges=[], faces=[])
+    obj = bpy.data.objects.new("test_modapply_obj", mesh)
+    context.collection.objects.link(obj)
+    try:
+        obj.shape_key_add(name="Basis")
+        key = obj.shape_key_add(name="key")
+        key.data[3].co.x += 1
+        key.slider_max = 2
+        key.value = 1.5
+
+        key_coords_before = []
+        for sk in mesh.shape_keys.key_blocks:
+            coords = np.empty(len(verts) * 3, dtype=np.float32)
+            sk.data.foreach_get("co", coords)
+            key_coords_before.append(coords.reshape((-1, 3)))
+
+        # Without a texture the displacement is (1 - mid_level) * strength
+        mod = obj.modifiers.new("displace", "DISPLACE")
+        mod.direction = "Z"
+        mod.mid_level = 0
+        mod.strength = 0.5
+
+        quick_apply_modifiers(context, {"DISPLACE"}, obj)
+
+        assert not obj.modifiers
+        assert mesh.shape_keys.key_blocks["key"].value == 1.5
+        for sk, coords_before in zip(mesh.shape_keys.key_blocks, key_coords_before):
+            coords = np.empty(len(verts) * 3, dtype=np.float32)
+            sk.data.foreach_get("co", coords)
+            expected = coords_before + np.array([0, 0, 0.5], dtype=np.float32)
+            assert np.allclose(coords.reshape((-1, 3)), expected, atol=1e-5)
+    finally:
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)